@@ -8,9 +8,12 @@ de cobertura e performance.
 
 import os
 import sys
+import json
+import statistics
 import unittest
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from io import StringIO
 
@@ -18,6 +21,15 @@ from io import StringIO
 root_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(root_dir))
 
+# Cache local com dados de execuções anteriores (durações, baselines)
+TEST_CACHE_DIR = Path(__file__).resolve().parent / ".test_cache"
+DURATIONS_FILE = TEST_CACHE_DIR / "durations.json"
+PERF_BASELINE_FILE = TEST_CACHE_DIR / "perf_baseline.json"
+
+# Número de execuções mantidas no baseline e regressão máxima tolerada
+PERF_BASELINE_RUNS = 10
+PERF_MAX_RATIO = 1.20
+
 
 class TestResult:
     """Resultado de execução de testes."""
@@ -84,7 +96,12 @@ class TestRunner:
         self.test_modules = [
             'tests.test_technical_indicators',
             'tests.test_trading_strategies',
-            'tests.test_integration'
+            'tests.test_integration',
+            'tests.test_signals.test_trend_analyzer',
+            'tests.test_core.test_candle_cache',
+            'tests.test_core.test_rate_limiter',
+            'tests.test_core.test_exceptions',
+            'tests.test_data.test_candle_store'
         ]
     
     def discover_tests(self, test_dir="tests"):
@@ -104,6 +121,14 @@ class TestRunner:
         print(f"\n🧪 Executando testes: {module_name}")
         print("=" * 60)
         
+        result = self._execute_module(module_name)
+        if result is not None:
+            self._print_module_result(module_name, result)
+            return result
+        return TestResult()
+    
+    def _execute_module(self, module_name):
+        """Executa os testes de um módulo sem imprimir o resumo."""
         try:
             # Importar módulo
             module = __import__(module_name, fromlist=[''])
@@ -128,32 +153,90 @@ class TestRunner:
             result.test_results.total_tests = result.testsRun
             result.test_results.execution_time = execution_time
             
-            # Mostrar resultado
-            self._print_module_result(module_name, result.test_results)
-            
             return result.test_results
             
         except ImportError as e:
             print(f"❌ Erro ao importar módulo {module_name}: {e}")
-            return TestResult()
+            return None
         except Exception as e:
             print(f"❌ Erro ao executar testes {module_name}: {e}")
-            return TestResult()
+            return None
     
-    def run_all_tests(self):
-        """Executa todos os testes."""
+    def _load_durations(self):
+        """Carrega a duração da última execução de cada módulo."""
+        try:
+            with open(DURATIONS_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_durations(self, durations):
+        """Persiste a duração de cada módulo para o próximo agendamento."""
+        try:
+            TEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(DURATIONS_FILE, "w", encoding="utf-8") as f:
+                json.dump(durations, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️  Não foi possível salvar durações dos testes: {e}")
+    
+    def _schedule_modules(self, durations):
+        """
+        Ordena os módulos do mais longo para o mais curto (LPT).
+        
+        Módulos sem histórico vão primeiro, pois sua duração é desconhecida.
+        """
+        return sorted(
+            self.test_modules,
+            key=lambda name: durations.get(name, float("inf")),
+            reverse=True
+        )
+    
+    def run_all_tests(self, workers=1):
+        """
+        Executa todos os testes.
+        
+        Args:
+            workers: Número de módulos executados em paralelo
+        """
         print("🚀 Iniciando execução de testes dos Crypto Bots")
         print("=" * 60)
         
         total_result = TestResult()
         module_results = {}
+        durations = self._load_durations()
         
         overall_start_time = time.time()
         
-        for module_name in self.test_modules:
-            result = self.run_module_tests(module_name)
-            module_results[module_name] = result
-            
+        if workers > 1:
+            modules = self._schedule_modules(durations)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._execute_module, name): name
+                    for name in modules
+                }
+                for future in as_completed(futures):
+                    module_name = futures[future]
+                    result = future.result()
+                    print(f"\n🧪 Testes executados: {module_name}")
+                    print("=" * 60)
+                    if result is None:
+                        result = TestResult()
+                    else:
+                        self._print_module_result(module_name, result)
+                        durations[module_name] = result.execution_time
+                        # Salvar a cada módulo: uma execução interrompida
+                        # ainda aproveita as durações já medidas
+                        self._save_durations(durations)
+                    module_results[module_name] = result
+        else:
+            for module_name in self.test_modules:
+                result = self.run_module_tests(module_name)
+                module_results[module_name] = result
+                if result.total_tests > 0:
+                    durations[module_name] = result.execution_time
+                    self._save_durations(durations)
+        
+        for result in module_results.values():
             # Agregar resultados
             total_result.total_tests += result.total_tests
             total_result.passed_tests += result.passed_tests
@@ -253,7 +336,16 @@ class TestRunner:
             return False
     
     def run_performance_tests(self):
-        """Executa testes de performance."""
+        """
+        Executa testes de performance.
+        
+        O tempo medido é comparado com a mediana das últimas execuções
+        registradas em `.test_cache/perf_baseline.json`, em vez de limites
+        absolutos que dependem da máquina.
+        
+        Returns:
+            False se houve erro ou regressão acima de PERF_MAX_RATIO
+        """
         print("\n⚡ Executando testes de performance...")
         
         # Teste de performance dos indicadores
@@ -263,21 +355,51 @@ class TestRunner:
             test_instance = TestTechnicalIndicators()
             test_instance.setUp()
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             test_instance.test_performance()
-            performance_time = time.time() - start_time
+            performance_time = time.perf_counter() - start_time
             
             print(f"✅ Teste de performance dos indicadores: {performance_time:.3f}s")
             
-            if performance_time < 1.0:
-                print("🚀 Performance EXCELENTE!")
-            elif performance_time < 2.0:
-                print("👍 Performance BOA")
-            else:
-                print("⚠️  Performance pode ser melhorada")
-                
         except Exception as e:
             print(f"❌ Erro no teste de performance: {e}")
+            return False
+        
+        history = self._load_perf_baseline()
+        within_limit = True
+        
+        if history:
+            median_previous = statistics.median(history)
+            ratio = performance_time / median_previous
+            print(f"perf: {ratio:.2f}× vs baseline ({performance_time:.3f}s vs {median_previous:.3f}s)")
+            
+            if ratio > PERF_MAX_RATIO:
+                print(f"⚠️  Regressão de performance acima de {PERF_MAX_RATIO:.2f}×")
+                within_limit = False
+        else:
+            print("ℹ️  Nenhum baseline de performance registrado; esta execução será usada como referência")
+        
+        history.append(performance_time)
+        self._save_perf_baseline(history[-PERF_BASELINE_RUNS:])
+        
+        return within_limit
+    
+    def _load_perf_baseline(self):
+        """Carrega os tempos das últimas execuções de performance."""
+        try:
+            with open(PERF_BASELINE_FILE, encoding="utf-8") as f:
+                return [float(t) for t in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return []
+    
+    def _save_perf_baseline(self, history):
+        """Persiste os tempos das últimas execuções de performance."""
+        try:
+            TEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(PERF_BASELINE_FILE, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=2)
+        except OSError as e:
+            print(f"⚠️  Não foi possível salvar baseline de performance: {e}")
 
 
 def main():
@@ -296,7 +418,7 @@ def main():
     parser.add_argument(
         "--performance",
         action="store_true",
-        help="Executar testes de performance"
+        help="Executar testes de performance (não são executados automaticamente)"
     )
     parser.add_argument(
         "--verbose",
@@ -305,6 +427,13 @@ def main():
         default=2,
         help="Nível de verbosidade (use -v, -vv, -vvv)"
     )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Número de módulos de teste executados em paralelo (mais lentos primeiro)"
+    )
     parser.add_argument(
         "--quick",
         action="store_true",
@@ -315,6 +444,7 @@ def main():
     
     # Configurar ambiente
     os.environ.setdefault("TESTING", "1")
+    os.environ.setdefault("ENABLE_CANDLE_DISK_CACHE", "false")
     
     # Criar runner
     runner = TestRunner(verbosity=args.verbose)
@@ -333,8 +463,8 @@ def main():
         
         elif args.performance:
             # Testes de performance
-            runner.run_performance_tests()
-            sys.exit(0)
+            success = runner.run_performance_tests()
+            sys.exit(0 if success else 1)
         
         else:
             # Todos os testes
@@ -342,12 +472,8 @@ def main():
                 print("🏃 Modo rápido: executando apenas testes essenciais")
                 runner.test_modules = ['tests.test_technical_indicators']
             
-            result = runner.run_all_tests()
-            
-            # Executar testes de performance se todos passaram
-            if result.failed_tests == 0 and result.error_tests == 0:
-                runner.run_performance_tests()
-            
+            result = runner.run_all_tests(workers=args.workers)
+
             success_rate = (result.passed_tests / result.total_tests * 100) if result.total_tests > 0 else 0
             sys.exit(0 if success_rate >= 80 else 1)
     
@@ -10,11 +10,15 @@ Este módulo centraliza todas as configurações do sistema, incluindo:
 """
 
 import os
+from pathlib import Path
 from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 from enum import Enum
 
+# Raiz do projeto (src/config/settings.py -> raiz)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 class Environment(str, Enum):
     """Ambientes disponíveis."""
@@ -157,6 +161,17 @@ class Settings(BaseSettings):
     redis_url: str = Field("redis://localhost:6379/0", env="REDIS_URL")
     enable_redis_cache: bool = Field(False, env="ENABLE_REDIS_CACHE")
     
+    # Cache de candles históricos em disco (parquet); sem caminho, usa
+    # <data_storage_path>/candles
+    enable_candle_disk_cache: bool = Field(True, env="ENABLE_CANDLE_DISK_CACHE")
+    candle_cache_path: Optional[str] = Field(None, env="CANDLE_CACHE_PATH")
+    
+    @property
+    def candle_cache_dir(self) -> Path:
+        """Diretório do cache de candles; caminhos relativos partem da raiz do projeto."""
+        path = Path(self.candle_cache_path or Path(self.data_storage_path) / "candles")
+        return path if path.is_absolute() else PROJECT_ROOT / path
+    
     # =============================================================================
     # MONITORING AND PERFORMANCE
     # =============================================================================
@@ -170,6 +185,7 @@ class Settings(BaseSettings):
     max_concurrent_requests: int = Field(10, env="MAX_CONCURRENT_REQUESTS")
     request_retry_attempts: int = Field(3, env="REQUEST_RETRY_ATTEMPTS")
     request_retry_delay: float = Field(1.0, env="REQUEST_RETRY_DELAY")
+    request_retry_max_delay: float = Field(30.0, env="REQUEST_RETRY_MAX_DELAY")
     
     # =============================================================================
     # DEVELOPMENT AND DEBUGGING
@@ -6,27 +6,283 @@ com suporte a rate limiting, retry automático, logging estruturado
 e tratamento de erros.
 """
 
+import os
 import time
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
-import json
+import logging
+import random
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from threading import Lock
 
+import numpy as np
+import pandas as pd
+import orjson
+import pyarrow as pa
+import requests
+from cachetools import TLRUCache, TTLCache
+from requests.adapters import HTTPAdapter
 from coinbase.rest import RESTClient
 from coinbase.websocket import WSClient
 
 from ..config.settings import get_settings
 from ..config.logging_config import get_logger, log_api_request
 from .rate_limiter import get_rate_limiter
+from ..data.candle_store import CandleStore
 from .exceptions import (
     CoinbaseAPIException,
     RateLimitException,
     AuthenticationException,
     InsufficientFundsException,
-    InvalidOrderException
+    InvalidOrderException,
+    InvalidConfigurationException
 )
 
 logger = get_logger(__name__)
 
+# TTLs (segundos) dos caches de endpoints GET idempotentes
+PRODUCTS_CACHE_TTL = 3600
+PRODUCT_CACHE_TTL = 600
+BEST_BID_ASK_CACHE_TTL = 1
+
+# Duração de cada granularidade de candle em segundos
+_GRANULARITY_SECONDS = MappingProxyType({
+    "ONE_MINUTE": 60,
+    "FIVE_MINUTE": 300,
+    "FIFTEEN_MINUTE": 900,
+    "THIRTY_MINUTE": 1800,
+    "ONE_HOUR": 3600,
+    "TWO_HOUR": 7200,
+    "SIX_HOUR": 21600,
+    "ONE_DAY": 86400
+})
+
+# Limite de candles por requisição da API e paralelismo da paginação
+MAX_CANDLES_PER_REQUEST = 350
+CANDLE_FETCH_WORKERS = 8
+
+# Colunas numéricas dos candles da API (todas chegam como string)
+CANDLE_PRICE_FIELDS = ("low", "high", "open", "close", "volume")
+
+# Máximo de candles fechados mantidos em memória por (produto, granularidade)
+MAX_CACHED_CANDLES = 10000
+
+# Idade máxima (segundos) do cabeçalho Date usado como horário do servidor
+SERVER_TIME_MAX_AGE = 300
+
+# Último cabeçalho Date recebido: (horário do servidor, time.monotonic() da resposta)
+_last_server_date: Optional[Tuple[datetime, float]] = None
+
+# Despacho do método HTTP (já normalizado em maiúsculas) para o RESTClient
+_METHOD_HANDLERS = MappingProxyType({
+    "GET": lambda client, endpoint, params, data, **kwargs: client.get(endpoint, params=params or {}, **kwargs),
+    "POST": lambda client, endpoint, params, data, **kwargs: client.post(endpoint, data=data or {}, **kwargs),
+    "PUT": lambda client, endpoint, params, data, **kwargs: client.put(endpoint, data=data or {}, **kwargs),
+    "DELETE": lambda client, endpoint, params, data, **kwargs: client.delete(endpoint, **kwargs)
+})
+
+
+# Gerador próprio para o jitter dos retries, re-semeado em cada processo
+# filho para que workers criados por fork não repitam a mesma sequência
+_retry_random = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_retry_random.seed)
+
+
+def decorrelated_jitter(base: float, previous: float, cap: float) -> float:
+    """
+    Calcula a próxima espera de retry com "decorrelated jitter".
+    
+    Cada espera é sorteada entre `base` e o triplo da anterior, limitada a
+    `cap`, espalhando os retries de vários clientes no tempo em vez de
+    sincronizá-los após uma falha da API.
+    
+    Args:
+        base: Espera mínima em segundos
+        previous: Espera usada na tentativa anterior
+        cap: Espera máxima em segundos
+        
+    Returns:
+        Tempo de espera em segundos
+    """
+    return min(cap, _retry_random.uniform(base, max(base, previous * 3)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Interpreta o cabeçalho Retry-After (segundos ou data HTTP).
+    
+    Returns:
+        Segundos de espera, ou None se ausente/inválido
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def build_order_data(
+    product_id: str,
+    side: str,
+    order_type: str,
+    size: Optional[str],
+    price: Optional[str],
+    client_order_id: Optional[str],
+    extra: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Monta o corpo da requisição de criação de ordem.
+    
+    A configuração do tipo de ordem é montada antes e o dicionário final é
+    criado de uma só vez, sem reindexar a estrutura aninhada.
+    
+    Returns:
+        Corpo da requisição POST /orders
+    """
+    # Configurar parâmetros específicos do tipo de ordem
+    config: Dict[str, str] = {}
+    if order_type == "market_order":
+        if size:
+            config["quote_size" if side == "buy" else "base_size"] = size
+    elif order_type == "limit_order":
+        if size and price:
+            config["base_size"] = size
+            config["limit_price"] = price
+    
+    order_data = {
+        "product_id": product_id,
+        "side": side,
+        "order_configuration": {order_type: config}
+    }
+    
+    if client_order_id:
+        order_data["client_order_id"] = client_order_id
+    
+    # Adicionar parâmetros extras
+    if extra:
+        order_data.update(extra)
+    
+    return order_data
+
+
+def candles_to_arrays(candles: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Converte candles da API em arrays colunares.
+    
+    Cada coluna é preenchida de uma vez com np.fromiter. A API devolve os
+    candles do mais recente para o mais antigo, o que basta inverter; a
+    ordenação só é feita se os candles não vierem em nenhuma das ordens.
+    
+    Returns:
+        Arrays start (int64) e preços/volume (float64), do mais antigo
+        para o mais recente
+    """
+    count = len(candles)
+    columns = {"start": np.fromiter((int(c['start']) for c in candles), dtype=np.int64, count=count)}
+    for name in CANDLE_PRICE_FIELDS:
+        columns[name] = np.fromiter((float(c[name]) for c in candles), dtype=np.float64, count=count)
+    return chronological_columns(columns)
+
+
+def chronological_columns(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Coloca colunas de candles em ordem cronológica pela coluna start.
+    
+    Colunas em ordem decrescente (a da API) são apenas invertidas; as já
+    crescentes são devolvidas como estão.
+    """
+    if len(columns["start"]) > 1:
+        steps = np.diff(columns["start"])
+        if (steps < 0).all():
+            columns = {name: np.ascontiguousarray(column[::-1]) for name, column in columns.items()}
+        elif not (steps >= 0).all():
+            order = np.argsort(columns["start"], kind="stable")
+            columns = {name: column[order] for name, column in columns.items()}
+    return columns
+
+
+def candles_to_frame(candles: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Converte candles da API em um DataFrame colunar.
+    
+    Returns:
+        DataFrame com as colunas de candles_to_arrays, do mais antigo para
+        o mais recente
+    """
+    return pd.DataFrame(candles_to_arrays(candles))
+
+
+def _orjson_response(response: requests.Response, *args, **kwargs) -> None:
+    """Hook de resposta que decodifica o corpo JSON com orjson."""
+    response.json = lambda **_: orjson.loads(response.content)
+
+
+def _record_server_date(response: requests.Response, *args, **kwargs) -> None:
+    """Hook de resposta da sessão HTTP que guarda o cabeçalho Date."""
+    global _last_server_date
+    
+    value = response.headers.get("Date")
+    if not value:
+        return
+    
+    try:
+        _last_server_date = (parsedate_to_datetime(value), time.monotonic())
+    except (TypeError, ValueError):
+        pass
+
+
+@dataclass
+class _CandleSeries:
+    """Candles fechados em cache cobrindo, sem lacunas, [first, last]."""
+    first: int
+    last: int
+    candles: Dict[int, Any] = field(default_factory=dict)
+
+
+def _open_candle_expiry(key: Tuple[str, str, int, int], value: Any, now: float) -> float:
+    """O candle em formação expira quando o bucket fecha."""
+    _, _, bucket_start, interval = key
+    return bucket_start + interval
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_rest_client(api_key: str, api_secret: str, timeout: int) -> RESTClient:
+    """
+    Retorna um RESTClient compartilhado entre instâncias do CoinbaseClient.
+    
+    O pool de conexões keep-alive da sessão HTTP é reaproveitado por todas
+    as instâncias com as mesmas credenciais, evitando um novo handshake
+    TCP/TLS por cliente.
+    """
+    client = RESTClient(
+        api_key=api_key,
+        api_secret=api_secret,
+        timeout=timeout,
+        rate_limit_headers=True
+    )
+    
+    session = getattr(client, "session", None)
+    if isinstance(session, requests.Session):
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, pool_block=False)
+        session.mount("https://", adapter)
+        session.hooks["response"].append(_record_server_date)
+        session.hooks["response"].append(_orjson_response)
+    
+    return client
+
 
 class CoinbaseClient:
     """
@@ -59,6 +315,21 @@ class CoinbaseClient:
         # Configurações de retry
         self.max_retries = self.settings.request_retry_attempts
         self.retry_delay = self.settings.request_retry_delay
+        self.max_retry_delay = self.settings.request_retry_max_delay
+        
+        # Caches de endpoints GET idempotentes
+        self._cache_lock = Lock()
+        self._products_cache = TTLCache(maxsize=1, ttl=PRODUCTS_CACHE_TTL)
+        self._product_cache = TTLCache(maxsize=256, ttl=PRODUCT_CACHE_TTL)
+        self._best_bid_ask_cache = TTLCache(maxsize=256, ttl=BEST_BID_ASK_CACHE_TTL)
+        self._open_candle_cache = TLRUCache(maxsize=256, ttu=_open_candle_expiry, timer=time.time)
+        self._candle_series: Dict[Tuple[str, str], _CandleSeries] = {}
+        
+        # Cache persistente de candles fechados (reaproveitado entre execuções)
+        self._candle_store = (
+            CandleStore(self.settings.candle_cache_dir)
+            if self.settings.enable_candle_disk_cache else None
+        )
         
         logger.info(
             "Coinbase client initialized",
@@ -69,13 +340,12 @@ class CoinbaseClient:
     
     @property
     def rest_client(self) -> RESTClient:
-        """Retorna o cliente REST, inicializando se necessário."""
+        """Retorna o cliente REST compartilhado, inicializando se necessário."""
         if self._rest_client is None:
-            self._rest_client = RESTClient(
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-                timeout=self.settings.coinbase_timeout,
-                rate_limit_headers=True
+            self._rest_client = _get_shared_rest_client(
+                self.api_key,
+                self.api_secret,
+                self.settings.coinbase_timeout
             )
         return self._rest_client
     
@@ -98,99 +368,164 @@ class CoinbaseClient:
             **kwargs: Argumentos adicionais
             
         Returns:
-            Resposta da API
+            Resposta da API já decodificada do JSON (dict)
             
         Raises:
             CoinbaseAPIException: Para erros da API
             RateLimitException: Para rate limiting
+            ValueError: Para métodos HTTP não suportados
+        """
+        method = method.upper()
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is None:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        return self._send(method, handler, endpoint, params, data, **kwargs)
+    
+    def _send(
+        self,
+        method: str,
+        handler: Callable[..., Any],
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Executa a requisição com o método já normalizado e resolvido.
+        
+        Chamado por _make_request e pelas variantes _get/_post/_put/_delete,
+        que fixam método e handler na definição da classe.
         """
+        wait_time = self.retry_delay
+        
         for attempt in range(self.max_retries + 1):
+            start_ns = 0
             try:
                 # Aguardar rate limiter
                 self.rate_limiter.acquire(timeout=30)
                 
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 
                 # Fazer requisição
-                if method.lower() == 'get':
-                    response = self.rest_client.get(endpoint, params=params or {}, **kwargs)
-                elif method.lower() == 'post':
-                    response = self.rest_client.post(endpoint, data=data or {}, **kwargs)
-                elif method.lower() == 'put':
-                    response = self.rest_client.put(endpoint, data=data or {}, **kwargs)
-                elif method.lower() == 'delete':
-                    response = self.rest_client.delete(endpoint, **kwargs)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                response = handler(self.rest_client, endpoint, params, data, **kwargs)
                 
-                response_time = time.time() - start_time
+                # Log da requisição bem-sucedida (só monta os campos se INFO está ativo)
+                if logger.isEnabledFor(logging.INFO):
+                    log_api_request(
+                        logger,
+                        method=method,
+                        endpoint=endpoint,
+                        status_code=200,  # Assumindo sucesso se não houve exceção
+                        response_time=(time.perf_counter_ns() - start_ns) / 1e9
+                    )
                 
-                # Log da requisição bem-sucedida
+                return response
+            
+            except requests.exceptions.HTTPError as e:
+                # O SDK levanta HTTPError com a resposta original anexada
+                status_code = e.response.status_code if e.response is not None else None
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After")) if e.response is not None else None
+                error = e
+            except Exception as e:
+                status_code = None
+                retry_after = None
+                error = e
+            
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9 if start_ns else 0
+            
+            # Determinar tipo de erro
+            if status_code == 429:
+                error_msg = "Rate limit exceeded"
                 log_api_request(
                     logger,
-                    method=method.upper(),
+                    method=method,
                     endpoint=endpoint,
-                    status_code=200,  # Assumindo sucesso se não houve exceção
-                    response_time=response_time
+                    status_code=429,
+                    response_time=response_time,
+                    error=error_msg
                 )
                 
-                return response
-                
-            except Exception as e:
-                response_time = time.time() - start_time if 'start_time' in locals() else 0
-                
-                # Determinar tipo de erro
-                if "429" in str(e) or "rate limit" in str(e).lower():
-                    error_msg = "Rate limit exceeded"
-                    log_api_request(
-                        logger,
-                        method=method.upper(),
-                        endpoint=endpoint,
-                        status_code=429,
-                        response_time=response_time,
-                        error=error_msg
+                if attempt < self.max_retries:
+                    # Backoff exponencial com jitter, salvo quando o servidor indica a espera
+                    wait_time = retry_after if retry_after is not None else decorrelated_jitter(
+                        self.retry_delay, wait_time, self.max_retry_delay
                     )
-                    
-                    if attempt < self.max_retries:
-                        wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                        logger.warning(f"Rate limited, retrying in {wait_time}s", attempt=attempt + 1)
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise RateLimitException()
+                    logger.warning(f"Rate limited, retrying in {wait_time:.2f}s", attempt=attempt + 1)
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    raise RateLimitException(int(retry_after) if retry_after is not None else None)
+            
+            elif status_code == 401:
+                log_api_request(
+                    logger,
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=401,
+                    response_time=response_time,
+                    error="Authentication failed"
+                )
+                raise AuthenticationException()
+            
+            else:
+                # Erro genérico
+                error_msg = str(error)
+                log_api_request(
+                    logger,
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=status_code,
+                    response_time=response_time,
+                    error=error_msg
+                )
                 
-                elif "401" in str(e) or "unauthorized" in str(e).lower():
-                    log_api_request(
-                        logger,
-                        method=method.upper(),
-                        endpoint=endpoint,
-                        status_code=401,
-                        response_time=response_time,
-                        error="Authentication failed"
+                if attempt < self.max_retries:
+                    wait_time = retry_after if retry_after is not None else decorrelated_jitter(
+                        self.retry_delay, wait_time, self.max_retry_delay
                     )
-                    raise AuthenticationException()
-                
+                    logger.warning(f"Request failed, retrying in {wait_time:.2f}s", error=error_msg, attempt=attempt + 1)
+                    time.sleep(wait_time)
+                    continue
                 else:
-                    # Erro genérico
-                    error_msg = str(e)
-                    log_api_request(
-                        logger,
-                        method=method.upper(),
-                        endpoint=endpoint,
-                        response_time=response_time,
-                        error=error_msg
+                    raise CoinbaseAPIException(
+                        f"Request failed after {self.max_retries} retries: {error_msg}",
+                        status_code=status_code,
+                        endpoint=endpoint
                     )
-                    
-                    if attempt < self.max_retries:
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        logger.warning(f"Request failed, retrying in {wait_time}s", error=error_msg, attempt=attempt + 1)
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise CoinbaseAPIException(f"Request failed after {self.max_retries} retries: {error_msg}")
         
         raise CoinbaseAPIException("Max retries exceeded")
     
+    # Variantes especializadas por método, sem normalização nem lookup por chamada
+    _get = functools.partialmethod(_send, "GET", _METHOD_HANDLERS["GET"])
+    _post = functools.partialmethod(_send, "POST", _METHOD_HANDLERS["POST"])
+    _put = functools.partialmethod(_send, "PUT", _METHOD_HANDLERS["PUT"])
+    _delete = functools.partialmethod(_send, "DELETE", _METHOD_HANDLERS["DELETE"])
+    
+    def _cached_get(self, cache: TTLCache, key: Any, fn: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache ou executa a requisição e armazena o resultado.
+        
+        Args:
+            cache: Cache do endpoint (define o TTL)
+            key: Chave formada pelo endpoint e parâmetros
+            fn: Função que faz a requisição
+            
+        Returns:
+            Resposta do endpoint
+        """
+        with self._cache_lock:
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+        
+        value = fn()
+        
+        with self._cache_lock:
+            cache[key] = value
+        return value
+    
     # =============================================================================
     # ACCOUNT METHODS
     # =============================================================================
@@ -202,8 +537,8 @@ class CoinbaseClient:
         Returns:
             Lista de contas
         """
-        response = self._make_request('GET', '/api/v3/brokerage/accounts')
-        return response.accounts if hasattr(response, 'accounts') else []
+        response = self._get('/api/v3/brokerage/accounts')
+        return response.get('accounts', [])
     
     def get_account(self, account_id: str) -> Dict[str, Any]:
         """
@@ -215,8 +550,8 @@ class CoinbaseClient:
         Returns:
             Detalhes da conta
         """
-        response = self._make_request('GET', f'/api/v3/brokerage/accounts/{account_id}')
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        response = self._get(f'/api/v3/brokerage/accounts/{account_id}')
+        return response
     
     # =============================================================================
     # PRODUCT METHODS
@@ -229,8 +564,11 @@ class CoinbaseClient:
         Returns:
             Lista de produtos
         """
-        response = self._make_request('GET', '/api/v3/brokerage/products')
-        return response.products if hasattr(response, 'products') else []
+        def fetch():
+            response = self._get('/api/v3/brokerage/products')
+            return response.get('products', [])
+        
+        return self._cached_get(self._products_cache, 'products', fetch)
     
     def get_product(self, product_id: str) -> Dict[str, Any]:
         """
@@ -242,8 +580,11 @@ class CoinbaseClient:
         Returns:
             Detalhes do produto
         """
-        response = self._make_request('GET', f'/api/v3/brokerage/products/{product_id}')
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        def fetch():
+            response = self._get(f'/api/v3/brokerage/products/{product_id}')
+            return response
+        
+        return self._cached_get(self._product_cache, product_id, fetch)
     
     def get_product_candles(
         self,
@@ -255,48 +596,57 @@ class CoinbaseClient:
         """
         Retorna dados de candlestick para um produto.
 
-        CORREÇÃO: Valida limite de 350 candles da API Coinbase.
+        Períodos que excedem o limite de 350 candles da API são divididos
+        em janelas menores buscadas em paralelo.
+        
+        Raises:
+            InvalidConfigurationException: Se a granularidade não é suportada
         """
-        from datetime import timedelta
-
-        # Mapeamento de granularidade para segundos
-        granularity_seconds = {
-            "ONE_MINUTE": 60,
-            "FIVE_MINUTE": 300,
-            "FIFTEEN_MINUTE": 900,
-            "ONE_HOUR": 3600,
-            "SIX_HOUR": 21600,
-            "ONE_DAY": 86400
-        }
+        try:
+            interval_seconds = _GRANULARITY_SECONDS[granularity]
+        except KeyError:
+            raise InvalidConfigurationException(
+                "granularity",
+                granularity,
+                f"must be one of {', '.join(_GRANULARITY_SECONDS)}"
+            ) from None
 
         params = {"granularity": granularity}
 
-        # CORREÇÃO: Validar limite de 350 candles
         if start and end:
-            # Calcular número de candles que seriam retornados
-            time_diff = (end - start).total_seconds()
-            interval_seconds = granularity_seconds.get(granularity, 60)
-            estimated_candles = int(time_diff / interval_seconds)
-
-            # Se exceder 350, ajustar o período
-            if estimated_candles > 350:
-                logger.warning(
-                    f"Período solicitado resultaria em {estimated_candles} candles. "
-                    f"Limitando a 350 candles para evitar erro da API."
-                )
-                # Ajustar end para não exceder 350 candles
-                max_seconds = 350 * interval_seconds
-                end = start + timedelta(seconds=max_seconds)
-
-            params["start"] = int(start.timestamp())
-            params["end"] = int(end.timestamp())
+            # Períodos acima do limite de 350 candles são paginados em paralelo
+            return self._get_cached_candles(
+                product_id,
+                granularity,
+                interval_seconds,
+                int(start.timestamp()),
+                int(end.timestamp())
+            )
         elif start:
             params["start"] = int(start.timestamp())
         elif end:
             params["end"] = int(end.timestamp())
 
-        response = self._make_request(
-            'GET',
+        return self._request_candles(product_id, params)
+    
+    def get_product_candles_frame(
+        self,
+        product_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        granularity: str = "ONE_MINUTE"
+    ) -> pd.DataFrame:
+        """
+        Retorna os candles de get_product_candles como DataFrame colunar.
+        
+        Returns:
+            DataFrame ordenado do mais antigo para o mais recente
+        """
+        return candles_to_frame(self.get_product_candles(product_id, start, end, granularity))
+    
+    def _request_candles(self, product_id: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Busca candles diretamente na API."""
+        response = self._get(
             f'/api/v3/brokerage/products/{product_id}/candles',
             params=params
         )
@@ -305,7 +655,199 @@ class CoinbaseClient:
         except KeyError:
             logger.error("Erro ao obter candles: resposta inválida da API", response=response)
             return []
-        return response 
+        return response
+    
+    def _get_cached_candles(
+        self,
+        product_id: str,
+        granularity: str,
+        interval: int,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Retorna candles de [start_ts, end_ts] usando o cache de buckets fechados.
+        
+        Candles fechados nunca mudam, então apenas a janela ainda não coberta
+        pelo cache (normalmente o final do período) é buscada na API. O candle
+        em formação fica em cache até o fechamento do seu bucket.
+        
+        Returns:
+            Candles do mais recente para o mais antigo, como na API
+        """
+        series_key = (product_id, granularity)
+        current_bucket = int(time.time()) // interval * interval
+        last_closed = current_bucket - interval
+        
+        with self._cache_lock:
+            series = self._candle_series.get(series_key)
+            if series is not None and series.first <= start_ts <= series.last + interval:
+                cached = sorted(
+                    (t, c) for t, c in series.candles.items() if start_ts <= t <= end_ts
+                )
+                fetch_start = series.last + interval
+            else:
+                series = None
+                cached = []
+                fetch_start = start_ts
+        
+        fetched = []
+        if fetch_start <= end_ts:
+            open_key = (product_id, granularity, fetch_start, interval)
+            only_open_bucket = fetch_start == current_bucket
+            
+            cached_tail = None
+            if only_open_bucket:
+                with self._cache_lock:
+                    cached_tail = self._open_candle_cache.get(open_key)
+            
+            if cached_tail is not None:
+                fetched = cached_tail
+            else:
+                fetched = self._fetch_candle_range(
+                    product_id,
+                    granularity,
+                    interval,
+                    fetch_start,
+                    end_ts,
+                    last_closed
+                )
+                if only_open_bucket and fetched:
+                    with self._cache_lock:
+                        self._open_candle_cache[open_key] = fetched
+            
+            # Guardar apenas candles já fechados
+            closed_last = min(end_ts, last_closed) // interval * interval
+            closed = {}
+            if closed_last >= fetch_start:
+                for candle in fetched:
+                    candle_start = int(candle['start'])
+                    if candle_start <= last_closed:
+                        closed[candle_start] = candle
+            
+            # Resposta vazia pode ser erro da API; não marcar o trecho como coberto
+            if closed:
+                with self._cache_lock:
+                    if series is None:
+                        series = _CandleSeries(
+                            first=-(-start_ts // interval) * interval,
+                            last=closed_last
+                        )
+                        self._candle_series[series_key] = series
+                    series.candles.update(closed)
+                    series.last = max(series.last, closed_last)
+                    self._trim_candle_series(series)
+        
+        return list(fetched) + [candle for _, candle in reversed(cached)]
+    
+    def _fetch_candle_range(
+        self,
+        product_id: str,
+        granularity: str,
+        interval: int,
+        start_ts: int,
+        end_ts: int,
+        last_closed: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca candles de [start_ts, end_ts] passando pelo cache em disco.
+        
+        Apenas os trechos fechados ainda não gravados e o candle em formação
+        são buscados na API; os candles fechados obtidos são persistidos.
+        
+        Returns:
+            Candles do mais recente para o mais antigo, sem duplicatas
+        """
+        store = self._candle_store
+        closed_end = min(end_ts, last_closed)
+        if store is None or start_ts > closed_end:
+            return self._request_candle_range(product_id, granularity, interval, start_ts, end_ts)
+        
+        try:
+            gaps = store.missing_ranges(product_id, granularity, interval, start_ts, closed_end)
+            candles = store.read(product_id, granularity, start_ts, closed_end)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("Cache de candles em disco ilegível, buscando na API", error=str(e))
+            return self._request_candle_range(product_id, granularity, interval, start_ts, end_ts)
+        
+        for gap_start, gap_end in gaps:
+            fetched = self._request_candle_range(product_id, granularity, interval, gap_start, gap_end)
+            for candle in fetched:
+                candles[int(candle['start'])] = candle
+            
+            # Resposta vazia pode ser erro da API; não marcar o trecho como coberto
+            if fetched:
+                try:
+                    store.write(product_id, granularity, interval, gap_start, gap_end, fetched)
+                except (OSError, pa.ArrowException) as e:
+                    logger.warning("Falha ao gravar cache de candles em disco", error=str(e))
+        
+        # Candle em formação sempre vem da API
+        if end_ts > closed_end:
+            for candle in self._request_candle_range(
+                product_id, granularity, interval, closed_end + interval, end_ts
+            ):
+                candles[int(candle['start'])] = candle
+        
+        return [candles[candle_start] for candle_start in sorted(candles, reverse=True)]
+    
+    def _request_candle_range(
+        self,
+        product_id: str,
+        granularity: str,
+        interval: int,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca candles de [start_ts, end_ts] respeitando o limite da API.
+        
+        O período é dividido em janelas de até MAX_CANDLES_PER_REQUEST
+        candles, buscadas em paralelo; o rate limiter continua controlando
+        o ritmo das requisições.
+        
+        Returns:
+            Candles do mais recente para o mais antigo, sem duplicatas
+        """
+        window = MAX_CANDLES_PER_REQUEST * interval
+        ranges = [
+            (chunk_start, min(chunk_start + window - 1, end_ts))
+            for chunk_start in range(start_ts, end_ts + 1, window)
+        ]
+        
+        if len(ranges) == 1:
+            return self._request_candles(
+                product_id,
+                {"granularity": granularity, "start": start_ts, "end": end_ts}
+            )
+        
+        def fetch(chunk: Tuple[int, int]) -> List[Dict[str, Any]]:
+            return self._request_candles(
+                product_id,
+                {"granularity": granularity, "start": chunk[0], "end": chunk[1]}
+            )
+        
+        with ThreadPoolExecutor(max_workers=min(CANDLE_FETCH_WORKERS, len(ranges))) as executor:
+            chunks = list(executor.map(fetch, ranges))
+        
+        merged = {}
+        for chunk in chunks:
+            for candle in chunk:
+                merged[int(candle['start'])] = candle
+        
+        return [merged[candle_start] for candle_start in sorted(merged, reverse=True)]
+    
+    @staticmethod
+    def _trim_candle_series(series: _CandleSeries) -> None:
+        """Descarta os candles mais antigos quando o cache excede o limite."""
+        excess = len(series.candles) - MAX_CACHED_CANDLES
+        if excess <= 0:
+            return
+        
+        oldest = sorted(series.candles)[:excess]
+        for candle_start in oldest:
+            del series.candles[candle_start]
+        series.first = oldest[-1] + 1
     
     def get_market_trades(self, product_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -319,13 +861,12 @@ class CoinbaseClient:
             Lista de trades
         """
         params = {"limit": limit}
-        response = self._make_request(
-            'GET',
+        response = self._get(
             f'/api/v3/brokerage/products/{product_id}/ticker',
             params=params
         )
         
-        return response.trades if hasattr(response, 'trades') else []
+        return response.get('trades', [])
     
     def get_best_bid_ask(self, product_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -341,8 +882,11 @@ class CoinbaseClient:
         if product_ids:
             params["product_ids"] = ",".join(product_ids)
         
-        response = self._make_request('GET', '/api/v3/brokerage/best_bid_ask', params=params)
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        def fetch():
+            response = self._get('/api/v3/brokerage/best_bid_ask', params=params)
+            return response
+        
+        return self._cached_get(self._best_bid_ask_cache, params.get("product_ids", ""), fetch)
     
     def get_product_book(self, product_id: str, limit: int = 50) -> Dict[str, Any]:
         """
@@ -356,8 +900,8 @@ class CoinbaseClient:
             Order book
         """
         params = {"product_id": product_id, "limit": limit}
-        response = self._make_request('GET', '/api/v3/brokerage/product_book', params=params)
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        response = self._get('/api/v3/brokerage/product_book', params=params)
+        return response
     
     # =============================================================================
     # ORDER METHODS
@@ -388,34 +932,10 @@ class CoinbaseClient:
         Returns:
             Detalhes da ordem criada
         """
-        order_data = {
-            "product_id": product_id,
-            "side": side,
-            "order_configuration": {
-                order_type: {}
-            }
-        }
-        
-        if client_order_id:
-            order_data["client_order_id"] = client_order_id
-        
-        # Configurar parâmetros específicos do tipo de ordem
-        if order_type == "market_order":
-            if size:
-                if side == "buy":
-                    order_data["order_configuration"][order_type]["quote_size"] = size
-                else:
-                    order_data["order_configuration"][order_type]["base_size"] = size
-        elif order_type == "limit_order":
-            if size and price:
-                order_data["order_configuration"][order_type]["base_size"] = size
-                order_data["order_configuration"][order_type]["limit_price"] = price
+        order_data = build_order_data(product_id, side, order_type, size, price, client_order_id, kwargs)
         
-        # Adicionar parâmetros extras
-        order_data.update(kwargs)
-        
-        response = self._make_request('POST', '/api/v3/brokerage/orders', data=order_data)
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        response = self._post('/api/v3/brokerage/orders', data=order_data)
+        return response
     
     def cancel_orders(self, order_ids: List[str]) -> Dict[str, Any]:
         """
@@ -428,8 +948,8 @@ class CoinbaseClient:
             Resultado do cancelamento
         """
         data = {"order_ids": order_ids}
-        response = self._make_request('POST', '/api/v3/brokerage/orders/batch_cancel', data=data)
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        response = self._post('/api/v3/brokerage/orders/batch_cancel', data=data)
+        return response
     
     def get_orders(
         self,
@@ -448,14 +968,14 @@ class CoinbaseClient:
         Returns:
             Lista de ordens
         """
-        params = {"limit": limit}
-        if product_id:
-            params["product_id"] = product_id
-        if order_status:
-            params["order_status"] = order_status
+        params = {
+            key: value
+            for key, value in (("limit", limit), ("product_id", product_id), ("order_status", order_status))
+            if value is not None
+        }
         
-        response = self._make_request('GET', '/api/v3/brokerage/orders/historical/batch', params=params)
-        return response.orders if hasattr(response, 'orders') else []
+        response = self._get('/api/v3/brokerage/orders/historical/batch', params=params)
+        return response.get('orders', [])
     
     def get_order(self, order_id: str) -> Dict[str, Any]:
         """
@@ -467,8 +987,8 @@ class CoinbaseClient:
         Returns:
             Detalhes da ordem
         """
-        response = self._make_request('GET', f'/api/v3/brokerage/orders/historical/{order_id}')
-        return response.to_dict() if hasattr(response, 'to_dict') else response
+        response = self._get(f'/api/v3/brokerage/orders/historical/{order_id}')
+        return response
     
     def get_fills(
         self,
@@ -487,14 +1007,14 @@ class CoinbaseClient:
         Returns:
             Lista de fills
         """
-        params = {"limit": limit}
-        if product_id:
-            params["product_id"] = product_id
-        if order_id:
-            params["order_id"] = order_id
+        params = {
+            key: value
+            for key, value in (("limit", limit), ("product_id", product_id), ("order_id", order_id))
+            if value is not None
+        }
         
-        response = self._make_request('GET', '/api/v3/brokerage/orders/historical/fills', params=params)
-        return response.fills if hasattr(response, 'fills') else []
+        response = self._get('/api/v3/brokerage/orders/historical/fills', params=params)
+        return response.get('fills', [])
     
     # =============================================================================
     # PORTFOLIO METHODS
@@ -510,12 +1030,10 @@ class CoinbaseClient:
         Returns:
             Lista de portfólios
         """
-        params = {}
-        if portfolio_type:
-            params["portfolio_type"] = portfolio_type
+        params = {"portfolio_type": portfolio_type} if portfolio_type is not None else {}
         
-        response = self._make_request('GET', '/api/v3/brokerage/portfolios', params=params)
-        return response.portfolios if hasattr(response, 'portfolios') else []
+        response = self._get('/api/v3/brokerage/portfolios', params=params)
+        return response.get('portfolios', [])
     
     # =============================================================================
     # UTILITY METHODS
@@ -525,18 +1043,30 @@ class CoinbaseClient:
         """
         Retorna o horário do servidor.
         
+        Usa o cabeçalho Date da resposta mais recente, ajustado pelo tempo
+        decorrido, sem fazer nenhuma requisição. Sem resposta recente (até
+        SERVER_TIME_MAX_AGE segundos), usa o horário local.
+        
         Returns:
-            Horário do servidor
+            Horário do servidor (UTC)
         """
-        # Como a API Coinbase não tem endpoint específico para server time,
-        # usamos uma requisição simples e extraímos o timestamp dos headers
-        response = self._make_request('GET', '/api/v3/brokerage/accounts')
-        return datetime.now()  # Fallback para horário local
+        last = _last_server_date
+        if last is not None:
+            server_date, received_at = last
+            age = time.monotonic() - received_at
+            if age <= SERVER_TIME_MAX_AGE:
+                return server_date + timedelta(seconds=age)
+        
+        return datetime.now(timezone.utc)  # Fallback para horário local
     
     def test_connection(self) -> bool:
         """
         Testa a conexão com a API.
         
+        Como os bots chamam este método na inicialização, ele também aquece
+        a sessão TLS do cliente REST compartilhado antes das primeiras
+        requisições de mercado.
+        
         Returns:
             True se a conexão está funcionando
         """
@@ -5,15 +5,46 @@ Este módulo define todas as exceções específicas do sistema,
 permitindo tratamento de erros mais granular e informativo.
 """
 
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
+# Detalhes vazios compartilhados (somente leitura) para não alocar um dict
+# a cada exceção levantada sem informações adicionais
+_EMPTY_DETAILS = MappingProxyType({})
+
+
+def _picklable(value: Any) -> Any:
+    """Converte MappingProxyType (não serializável), inclusive aninhados, em dict."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _picklable(item) for key, item in value.items()}
+    return value
+
+
+def _rebuild_exception(cls: type, args: tuple) -> "CryptoBotsException":
+    """Recria a exceção sem chamar __init__ (usado no unpickling)."""
+    exc = cls.__new__(cls)
+    exc.args = args
+    return exc
+
 
 class CryptoBotsException(Exception):
     """Exceção base para todos os erros do sistema."""
     
+    __slots__ = ("message", "details")
+    
+    def __reduce__(self):
+        # Atributos em __slots__ não entram no pickle padrão de exceções,
+        # que além disso chamaria __init__ com os args da mensagem
+        state = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = _picklable(getattr(self, name))
+        return (_rebuild_exception, (type(self), self.args), state)
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         self.message = message
-        self.details = details or {}
+        self.details = details or _EMPTY_DETAILS
         super().__init__(self.message)
 
 
@@ -25,6 +56,8 @@ class APIException(CryptoBotsException):
 class CoinbaseAPIException(APIException):
     """Exceções específicas da API Coinbase."""
     
+    __slots__ = ("status_code", "response_data", "endpoint")
+    
     def __init__(
         self,
         message: str,
@@ -33,14 +66,17 @@ class CoinbaseAPIException(APIException):
         endpoint: Optional[str] = None
     ):
         self.status_code = status_code
-        self.response_data = response_data or {}
+        self.response_data = response_data or _EMPTY_DETAILS
         self.endpoint = endpoint
         
-        details = {
-            "status_code": status_code,
-            "response_data": response_data,
-            "endpoint": endpoint
-        }
+        if status_code is None and response_data is None and endpoint is None:
+            details = _EMPTY_DETAILS
+        else:
+            details = {
+                "status_code": status_code,
+                "response_data": response_data,
+                "endpoint": endpoint
+            }
         
         super().__init__(message, details)
 
@@ -48,6 +84,11 @@ class CoinbaseAPIException(APIException):
 class RateLimitException(CoinbaseAPIException):
     """Exceção para quando o rate limit é excedido."""
     
+    __slots__ = ("retry_after",)
+    
+    # Dados de resposta do caso mais comum (sem Retry-After), compartilhados
+    _NO_RETRY_AFTER = MappingProxyType({"retry_after": None})
+    
     def __init__(self, retry_after: Optional[int] = None):
         message = "Rate limit exceeded"
         if retry_after:
@@ -56,7 +97,7 @@ class RateLimitException(CoinbaseAPIException):
         super().__init__(
             message,
             status_code=429,
-            response_data={"retry_after": retry_after}
+            response_data={"retry_after": retry_after} if retry_after is not None else self._NO_RETRY_AFTER
         )
         self.retry_after = retry_after
 
@@ -7,7 +7,7 @@ os limites da API Coinbase e evitar erros 429 (Too Many Requests).
 
 import asyncio
 import time
-from typing import Dict, Optional
+from typing import Optional
 from dataclasses import dataclass
 from threading import Lock
 
@@ -28,12 +28,39 @@ class RateLimitInfo:
     last_request_time: float
 
 
+class _TokenBucket:
+    """
+    Balde de tokens com reposição contínua.
+    
+    Repõe limit tokens a cada period segundos; burst tokens extras de
+    capacidade permitem rajadas acima do limite após períodos ociosos.
+    """
+    
+    __slots__ = ("capacity", "rate", "tokens")
+    
+    def __init__(self, limit: float, period: float, burst: float = 0):
+        self.capacity = limit + burst
+        self.rate = limit / period
+        self.tokens = self.capacity
+    
+    def refill(self, elapsed: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+    
+    def wait_time(self) -> float:
+        """Segundos até haver um token disponível."""
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
 class RateLimiter:
     """
     Rate limiter thread-safe para controle de requisições.
     
-    Implementa sliding window rate limiting com suporte a múltiplas
-    janelas de tempo (segundo, minuto, hora).
+    Implementa token buckets com reposição contínua para cada janela de
+    tempo (segundo, minuto, hora). Cada aquisição é O(1): o lock protege
+    apenas a reposição e o consumo dos tokens, e a espera acontece fora
+    dele, então chamadores bloqueados não serializam os demais.
     """
     
     def __init__(
@@ -50,21 +77,26 @@ class RateLimiter:
             requests_per_second: Máximo de requests por segundo
             requests_per_minute: Máximo de requests por minuto
             requests_per_hour: Máximo de requests por hora
-            burst_allowance: Allowance para rajadas de requests
+            burst_allowance: Requests extras permitidos em rajada acima do
+                limite por segundo (capacidade adicional do balde de um
+                segundo; os limites por minuto e por hora continuam valendo)
         """
         self.requests_per_second = requests_per_second
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         self.burst_allowance = burst_allowance
         
-        # Janelas de tempo para tracking
-        self.second_window: Dict[int, int] = {}
-        self.minute_window: Dict[int, int] = {}
-        self.hour_window: Dict[int, int] = {}
+        # Um balde por janela de tempo
+        self._buckets = (
+            _TokenBucket(requests_per_second, 1.0, burst_allowance),
+            _TokenBucket(requests_per_minute, 60.0),
+            _TokenBucket(requests_per_hour, 3600.0)
+        )
+        self._last_refill = time.monotonic()
         
-        # Controle de burst
-        self.burst_tokens = burst_allowance
-        self.last_token_refill = time.time()
+        # Estatísticas
+        self.request_count = 0
+        self.last_request_time = 0.0
         
         # Thread safety
         self._lock = Lock()
@@ -77,6 +109,36 @@ class RateLimiter:
             burst=burst_allowance
         )
     
+    def _refill(self) -> None:
+        """Repõe os tokens pelo tempo decorrido. Deve ser chamado com o lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            for bucket in self._buckets:
+                bucket.refill(elapsed)
+            self._last_refill = now
+    
+    def _required_wait(self) -> float:
+        """Espera necessária pelo limite mais restritivo. Deve ser chamado com o lock."""
+        return max(bucket.wait_time() for bucket in self._buckets)
+    
+    def _try_acquire(self) -> float:
+        """
+        Tenta consumir um token de cada balde.
+        
+        Returns:
+            0.0 se adquiriu, senão o tempo de espera em segundos
+        """
+        with self._lock:
+            self._refill()
+            wait_time = self._required_wait()
+            if wait_time == 0.0:
+                for bucket in self._buckets:
+                    bucket.tokens -= 1
+                self.request_count += 1
+                self.last_request_time = time.time()
+            return wait_time
+    
     def can_make_request(self) -> bool:
         """
         Verifica se uma requisição pode ser feita agora.
@@ -85,30 +147,8 @@ class RateLimiter:
             True se a requisição pode ser feita, False caso contrário
         """
         with self._lock:
-            current_time = time.time()
-            current_second = int(current_time)
-            current_minute = int(current_time // 60)
-            current_hour = int(current_time // 3600)
-            
-            # Limpar janelas antigas
-            self._cleanup_windows(current_second, current_minute, current_hour)
-            
-            # Verificar limites
-            second_count = self.second_window.get(current_second, 0)
-            minute_count = sum(self.minute_window.values())
-            hour_count = sum(self.hour_window.values())
-            
-            # Verificar se pode fazer a requisição
-            if second_count >= self.requests_per_second:
-                return False
-            
-            if minute_count >= self.requests_per_minute:
-                return False
-            
-            if hour_count >= self.requests_per_hour:
-                return False
-            
-            return True
+            self._refill()
+            return self._required_wait() == 0.0
     
     def wait_if_needed(self) -> Optional[float]:
         """
@@ -117,33 +157,10 @@ class RateLimiter:
         Returns:
             Tempo de espera em segundos, ou None se não precisa esperar
         """
-        if self.can_make_request():
-            return None
-        
-        current_time = time.time()
-        current_second = int(current_time)
-        current_minute = int(current_time // 60)
-        current_hour = int(current_time // 3600)
-        
-        # Calcular tempo de espera baseado no limite mais restritivo
-        wait_times = []
-        
-        # Limite por segundo
-        second_count = self.second_window.get(current_second, 0)
-        if second_count >= self.requests_per_second:
-            wait_times.append(1.0 - (current_time % 1))
-        
-        # Limite por minuto
-        minute_count = sum(self.minute_window.values())
-        if minute_count >= self.requests_per_minute:
-            wait_times.append(60.0 - (current_time % 60))
-        
-        # Limite por hora
-        hour_count = sum(self.hour_window.values())
-        if hour_count >= self.requests_per_hour:
-            wait_times.append(3600.0 - (current_time % 3600))
-        
-        return min(wait_times) if wait_times else None
+        with self._lock:
+            self._refill()
+            wait_time = self._required_wait()
+        return wait_time or None
     
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -153,32 +170,26 @@ class RateLimiter:
             timeout: Tempo máximo de espera em segundos
             
         Returns:
-            True se conseguiu adquirir, False se timeout
+            True quando a permissão é adquirida
             
         Raises:
             RateLimitException: Se não conseguir adquirir dentro do timeout
         """
-        start_time = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
         
         while True:
-            if self.can_make_request():
-                self._record_request()
-                return True
-            
-            wait_time = self.wait_if_needed()
-            if wait_time is None:
-                self._record_request()
+            wait_time = self._try_acquire()
+            if wait_time == 0.0:
                 return True
             
             # Verificar timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     raise RateLimitException()
+                wait_time = min(wait_time, remaining)
             
-            # Esperar um pouco antes de tentar novamente
-            sleep_time = min(wait_time, 0.1)
-            time.sleep(sleep_time)
+            time.sleep(wait_time)
     
     async def acquire_async(self, timeout: Optional[float] = None) -> bool:
         """
@@ -188,105 +199,57 @@ class RateLimiter:
             timeout: Tempo máximo de espera em segundos
             
         Returns:
-            True se conseguiu adquirir, False se timeout
+            True quando a permissão é adquirida
+            
+        Raises:
+            RateLimitException: Se não conseguir adquirir dentro do timeout
         """
-        start_time = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
         
         while True:
-            if self.can_make_request():
-                self._record_request()
-                return True
-            
-            wait_time = self.wait_if_needed()
-            if wait_time is None:
-                self._record_request()
+            wait_time = self._try_acquire()
+            if wait_time == 0.0:
                 return True
             
             # Verificar timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     raise RateLimitException()
+                wait_time = min(wait_time, remaining)
             
             # Esperar assincronamente
-            sleep_time = min(wait_time, 0.1)
-            await asyncio.sleep(sleep_time)
-    
-    def _record_request(self) -> None:
-        """Registra uma requisição nas janelas de tempo."""
-        current_time = time.time()
-        current_second = int(current_time)
-        current_minute = int(current_time // 60)
-        current_hour = int(current_time // 3600)
-        
-        # Incrementar contadores
-        self.second_window[current_second] = self.second_window.get(current_second, 0) + 1
-        self.minute_window[current_minute] = self.minute_window.get(current_minute, 0) + 1
-        self.hour_window[current_hour] = self.hour_window.get(current_hour, 0) + 1
-        
-        logger.debug(
-            "Request recorded",
-            second=current_second,
-            minute=current_minute,
-            hour=current_hour,
-            second_count=self.second_window[current_second],
-            minute_count=self.minute_window[current_minute],
-            hour_count=self.hour_window[current_hour]
-        )
-    
-    def _cleanup_windows(self, current_second: int, current_minute: int, current_hour: int) -> None:
-        """Remove entradas antigas das janelas de tempo."""
-        # Limpar janela de segundos (manter apenas último segundo)
-        old_seconds = [s for s in self.second_window.keys() if s < current_second - 1]
-        for s in old_seconds:
-            del self.second_window[s]
-        
-        # Limpar janela de minutos (manter apenas últimos 2 minutos)
-        old_minutes = [m for m in self.minute_window.keys() if m < current_minute - 2]
-        for m in old_minutes:
-            del self.minute_window[m]
-        
-        # Limpar janela de horas (manter apenas últimas 2 horas)
-        old_hours = [h for h in self.hour_window.keys() if h < current_hour - 2]
-        for h in old_hours:
-            del self.hour_window[h]
+            await asyncio.sleep(wait_time)
     
     def get_status(self) -> RateLimitInfo:
         """
         Retorna informações sobre o status atual do rate limiter.
         
         Returns:
-            Informações sobre rate limiting
+            Informações sobre rate limiting (tokens consumidos por janela)
         """
         with self._lock:
-            current_time = time.time()
-            current_second = int(current_time)
-            current_minute = int(current_time // 60)
-            current_hour = int(current_time // 3600)
-            
-            self._cleanup_windows(current_second, current_minute, current_hour)
-            
-            second_count = self.second_window.get(current_second, 0)
-            minute_count = sum(self.minute_window.values())
-            hour_count = sum(self.hour_window.values())
+            self._refill()
+            second, minute, hour = (
+                bucket.capacity - bucket.tokens for bucket in self._buckets
+            )
             
             return RateLimitInfo(
-                requests_per_second=second_count,
-                requests_per_minute=minute_count,
-                requests_per_hour=hour_count,
-                window_start=current_time,
-                request_count=hour_count,
-                last_request_time=current_time
+                requests_per_second=second,
+                requests_per_minute=minute,
+                requests_per_hour=hour,
+                window_start=time.time(),
+                request_count=self.request_count,
+                last_request_time=self.last_request_time
             )
     
     def reset(self) -> None:
         """Reseta todos os contadores do rate limiter."""
         with self._lock:
-            self.second_window.clear()
-            self.minute_window.clear()
-            self.hour_window.clear()
-            self.burst_tokens = self.burst_allowance
-            self.last_token_refill = time.time()
+            for bucket in self._buckets:
+                bucket.tokens = bucket.capacity
+            self._last_refill = time.monotonic()
+            self.request_count = 0
             
             logger.info("Rate limiter reset")
 
@@ -0,0 +1,183 @@
+"""
+Cache persistente de candles em disco.
+
+Candles fechados nunca mudam, então este módulo os guarda em arquivos
+parquet para que reexecuções de backtests e recálculos de indicadores
+não busquem novamente na API períodos já conhecidos.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SECONDS_PER_DAY = 86400
+_COVERAGE_FILE = "coverage.json"
+
+
+class CandleStore:
+    """
+    Armazena candles fechados por (produto, granularidade).
+    
+    Cada série fica em <raiz>/<produto>/<granularidade>/, com um arquivo
+    parquet por dia UTC (escritas incrementais tocam apenas os dias
+    afetados) e um coverage.json com os intervalos já buscados. A API
+    omite candles sem negociação, por isso a cobertura é registrada à
+    parte em vez de deduzida dos candles presentes.
+    """
+    
+    def __init__(self, root: Union[str, Path]):
+        """
+        Inicializa o cache.
+        
+        Args:
+            root: Diretório raiz do cache
+        """
+        self.root = Path(root)
+        self._lock = Lock()
+    
+    def _series_dir(self, product_id: str, granularity: str) -> Path:
+        return self.root / product_id / granularity
+    
+    @staticmethod
+    def _day_file(series_dir: Path, day: int) -> Path:
+        date = datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc)
+        return series_dir / f"{date:%Y-%m-%d}.parquet"
+    
+    @staticmethod
+    def _load_coverage(series_dir: Path) -> List[List[int]]:
+        try:
+            with open(series_dir / _COVERAGE_FILE) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return []
+    
+    @staticmethod
+    def _replace(path: Path, write) -> None:
+        """Escreve em arquivo temporário e substitui atomicamente."""
+        tmp = path.with_name(path.name + ".tmp")
+        write(tmp)
+        os.replace(tmp, path)
+    
+    def missing_ranges(
+        self,
+        product_id: str,
+        granularity: str,
+        interval: int,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Retorna os trechos de [start_ts, end_ts] ainda não cobertos.
+        
+        Returns:
+            Lista de (início, fim) alinhados aos buckets, em ordem crescente
+        """
+        first = -(-start_ts // interval) * interval
+        last = end_ts // interval * interval
+        
+        with self._lock:
+            coverage = self._load_coverage(self._series_dir(product_id, granularity))
+        
+        gaps = []
+        cursor = first
+        for covered_start, covered_end in coverage:
+            if covered_end < cursor:
+                continue
+            if covered_start > last:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - interval))
+            cursor = max(cursor, covered_end + interval)
+        
+        if cursor <= last:
+            gaps.append((cursor, last))
+        
+        return gaps
+    
+    def read(
+        self,
+        product_id: str,
+        granularity: str,
+        start_ts: int,
+        end_ts: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Lê os candles armazenados em [start_ts, end_ts].
+        
+        Returns:
+            Candles indexados pelo início do bucket
+        """
+        series_dir = self._series_dir(product_id, granularity)
+        candles = {}
+        
+        with self._lock:
+            for day in range(start_ts // SECONDS_PER_DAY, end_ts // SECONDS_PER_DAY + 1):
+                path = self._day_file(series_dir, day)
+                if not path.exists():
+                    continue
+                
+                for row in pq.read_table(path, memory_map=True).to_pylist():
+                    candle_start = int(row['start'])
+                    if start_ts <= candle_start <= end_ts:
+                        candles[candle_start] = row
+        
+        return candles
+    
+    def write(
+        self,
+        product_id: str,
+        granularity: str,
+        interval: int,
+        start_ts: int,
+        end_ts: int,
+        candles: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Grava candles fechados e marca [start_ts, end_ts] como coberto.
+        
+        Args:
+            candles: Candles do período, como retornados pela API
+        """
+        by_day: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        for candle in candles:
+            candle_start = int(candle['start'])
+            by_day.setdefault(candle_start // SECONDS_PER_DAY, {})[candle_start] = candle
+        
+        series_dir = self._series_dir(product_id, granularity)
+        
+        with self._lock:
+            series_dir.mkdir(parents=True, exist_ok=True)
+            
+            for day, day_candles in by_day.items():
+                path = self._day_file(series_dir, day)
+                if path.exists():
+                    for row in pq.read_table(path).to_pylist():
+                        day_candles.setdefault(int(row['start']), row)
+                
+                table = pa.Table.from_pylist([day_candles[t] for t in sorted(day_candles)])
+                self._replace(path, lambda tmp: pq.write_table(table, tmp))
+            
+            # Mesclar o novo intervalo na cobertura
+            coverage = sorted(self._load_coverage(series_dir) + [[start_ts, end_ts]])
+            merged = [coverage[0]]
+            for covered_start, covered_end in coverage[1:]:
+                if covered_start <= merged[-1][1] + interval:
+                    merged[-1][1] = max(merged[-1][1], covered_end)
+                else:
+                    merged.append([covered_start, covered_end])
+            
+            def dump(tmp: Path) -> None:
+                with open(tmp, "w") as f:
+                    json.dump(merged, f)
+            
+            self._replace(series_dir / _COVERAGE_FILE, dump)
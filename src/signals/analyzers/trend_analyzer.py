@@ -5,21 +5,196 @@ Este módulo implementa análise de tendências usando indicadores técnicos
 para identificar direções de mercado e gerar sinais de trading.
 """
 
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 from ...config.settings import get_settings
 from ...config.logging_config import get_logger
-from ...core.exceptions import InsufficientDataException, InvalidIndicatorException
+from ...core.exceptions import InsufficientDataException
 from ..indicators.technical_indicators import TechnicalIndicators, SignalType, IndicatorResult
+from ..indicators.streaming import PRICE_DTYPE, MacdState, PriceBuffer, RollingWindow, RsiState
 
 logger = get_logger(__name__)
 
+# Pesos dos indicadores na combinação de sinais, na ordem em que são calculados
+_INDICATOR_WEIGHTS = MappingProxyType({
+    "rsi": 1.0,
+    "macd": 1.5,
+    "bollinger": 1.0,
+    "moving_averages": 2.0,
+    "stochastic": 0.8,
+    "williams_r": 0.7
+})
+_WEIGHT_ORDER = tuple(_INDICATOR_WEIGHTS)
+_WEIGHTS = np.fromiter(_INDICATOR_WEIGHTS.values(), dtype=np.float64, count=len(_INDICATOR_WEIGHTS))
+_WEIGHTS.flags.writeable = False
 
-@dataclass
+# Pesos quando só há indicadores de fechamento (view, sem cópia)
+_CLOSE_WEIGHTS = _WEIGHTS[:_WEIGHT_ORDER.index("stochastic")]
+
+# Períodos padrão do Stochastic usados pela análise
+_STOCH_K_PERIOD = 14
+_STOCH_D_PERIOD = 3
+
+# Máximo de análises mantidas no cache LRU
+ANALYSIS_CACHE_SIZE = 128
+
+# Tendência por código (-1 indexa o último elemento: baixa)
+_CODE_TREND = ("sideways", "bullish", "bearish")
+
+# Tabelas de get_signal_description; bisect_left sobre os limites reproduz
+# as comparações estritas (valor > limite)
+_ACTION_BY_SIGNAL = {
+    "buy": "compra",
+    "strong_buy": "compra",
+    "sell": "venda",
+    "strong_sell": "venda"
+}
+_CONFIDENCE_BOUNDS = (0.6, 0.8)
+_CONFIDENCE_LABELS = ("baixa", "moderada", "alta")
+
+_TREND_DESCRIPTION = {"bullish": "alta", "bearish": "baixa"}
+_STRENGTH_BOUNDS = (0.5, 0.8)
+_STRENGTH_LABELS = ("fraca", "moderada", "forte")
+
+
+def _rsi_details(value: float) -> Dict[str, Any]:
+    """Detalhes do RSI com status de sobrecompra/sobrevenda."""
+    if value > 70:
+        status = "sobrecomprado"
+    elif value < 30:
+        status = "sobrevendido"
+    else:
+        status = "neutro"
+    return {"valor": round(value, 2), "status": status}
+
+
+def _macd_details(value: Dict[str, float]) -> Dict[str, Any]:
+    """Detalhes das linhas do MACD."""
+    return {
+        "linha_macd": round(value["macd"], 4),
+        "linha_sinal": round(value["signal"], 4),
+        "histograma": round(value["histogram"], 4)
+    }
+
+
+def _bollinger_details(value: Dict[str, float]) -> Dict[str, Any]:
+    """Detalhes das Bollinger Bands."""
+    return {
+        "banda_superior": round(value["upper"], 2),
+        "banda_media": round(value["middle"], 2),
+        "banda_inferior": round(value["lower"], 2),
+        "posicao": round(value["position"] * 100, 1)
+    }
+
+
+def _moving_averages_details(value: Dict[str, float]) -> Dict[str, Any]:
+    """Detalhes das médias móveis."""
+    return {
+        "curta": round(value["short_ma"], 2),
+        "longa": round(value["long_ma"], 2),
+        "divergencia": round(value["divergence"], 2)
+    }
+
+
+# Nome exibido e construtor dos detalhes de cada indicador (demais são omitidos)
+_DETAIL_BUILDERS: Dict[str, Tuple[str, Callable[[Any], Dict[str, Any]]]] = {
+    "rsi": ("RSI", _rsi_details),
+    "macd": ("MACD", _macd_details),
+    "bollinger": ("Bollinger", _bollinger_details),
+    "moving_averages": ("Médias Móveis", _moving_averages_details)
+}
+
+
+def _sign(value: float) -> int:
+    """Retorna -1, 0 ou +1 conforme o sinal do valor."""
+    return int(value > 0) - int(value < 0)
+
+
+@lru_cache(maxsize=1)
+def _isoformat(timestamp: datetime) -> str:
+    """
+    Formata o timestamp em ISO 8601.
+    
+    Descrições consecutivas da mesma análise reaproveitam a string.
+    """
+    return timestamp.isoformat()
+
+
+class _StreamState:
+    """
+    Estado incremental dos indicadores para análise candle a candle.
+    
+    RSI, MACD, Bollinger Bands e médias móveis são recorrências O(1) por
+    candle; Stochastic e Williams %R são recalculados sobre janelas curtas
+    de tamanho fixo. Guarda também o valor anterior das séries que os
+    classificadores comparam com o candle atual.
+    """
+    
+    __slots__ = (
+        "count", "rsi", "macd", "bb", "sma_short", "sma_long",
+        "rsi_value", "macd_value", "previous_macd", "sma_value", "previous_sma",
+        "recent_close", "high", "low", "close"
+    )
+    
+    def __init__(self, analyzer: "TrendAnalyzer"):
+        self.count = 0
+        self.rsi = RsiState(analyzer.rsi_period)
+        self.macd = MacdState(analyzer.macd_fast, analyzer.macd_slow, analyzer.macd_signal)
+        self.bb = RollingWindow(analyzer.bb_period)
+        self.sma_short = RollingWindow(analyzer.ma_short)
+        self.sma_long = RollingWindow(analyzer.ma_long)
+        
+        self.rsi_value = math.nan
+        self.macd_value = (math.nan, math.nan)
+        self.previous_macd = (math.nan, math.nan)
+        self.sma_value = (math.nan, math.nan)
+        self.previous_sma = (math.nan, math.nan)
+        
+        # Últimos fechamentos para a tendência de preço (_determine_trend)
+        self.recent_close: deque = deque(maxlen=10)
+        
+        # Janelas de máximas/mínimas/fechamentos para Stochastic (%K + %D)
+        # e Williams %R
+        hlc_window = _STOCH_K_PERIOD + _STOCH_D_PERIOD - 1
+        self.high: deque = deque(maxlen=hlc_window)
+        self.low: deque = deque(maxlen=hlc_window)
+        self.close: deque = deque(maxlen=hlc_window)
+    
+    def push_exponential(self, close: float) -> None:
+        """Atualiza apenas as recorrências exponenciais (RSI e MACD)."""
+        self.count += 1
+        self.rsi_value = self.rsi.update(close)
+        
+        self.previous_macd = self.macd_value
+        self.macd_value = self.macd.update(close)
+    
+    def push(self, close: float, high: Optional[float], low: Optional[float]) -> None:
+        """Atualiza as recorrências com um candle."""
+        self.push_exponential(close)
+        
+        self.bb.push(close)
+        self.sma_short.push(close)
+        self.sma_long.push(close)
+        self.previous_sma = self.sma_value
+        self.sma_value = (self.sma_short.mean(), self.sma_long.mean())
+        
+        self.recent_close.append(close)
+        if high is not None and low is not None:
+            self.high.append(high)
+            self.low.append(low)
+            self.close.append(close)
+
+
+@dataclass(slots=True)
 class TrendAnalysis:
     """Resultado da análise de tendência."""
     trend: str  # bullish, bearish, sideways
@@ -58,6 +233,12 @@ class TrendAnalyzer:
         self.ma_short = self.settings.ma_short
         self.ma_long = self.settings.ma_long
         
+        # Cache LRU de análises por conteúdo das séries de preço
+        self._analysis_cache: OrderedDict = OrderedDict()
+        
+        # Estado da análise incremental (analyze_stream)
+        self._state: Optional[_StreamState] = None
+        
         logger.info(
             "Trend analyzer initialized",
             rsi_period=self.rsi_period,
@@ -68,9 +249,43 @@ class TrendAnalyzer:
             ma_long=self.ma_long
         )
     
+    @staticmethod
+    def make_buffer(maxlen: int) -> PriceBuffer:
+        """
+        Cria um buffer circular float64 para alimentar analyze().
+        
+        O loop de candles chama buffer.push(preço) e passa buffer.view()
+        em prices, evitando listas de floats Python e cópias por análise.
+        
+        Args:
+            maxlen: Número de candles mantidos
+            
+        Returns:
+            Buffer de preços
+        """
+        return PriceBuffer(maxlen)
+    
+    @staticmethod
+    def _as_array(
+        seq: Union[List[float], np.ndarray],
+        converted: Dict[int, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Converte uma série para np.ndarray float64 contíguo.
+        
+        Séries que são o mesmo objeto (ex.: high ausente, usando close) são
+        convertidas uma única vez.
+        """
+        key = id(seq)
+        array = converted.get(key)
+        if array is None:
+            array = np.ascontiguousarray(seq, dtype=PRICE_DTYPE)
+            converted[key] = array
+        return array
+    
     def analyze(
         self,
-        prices: Dict[str, List[float]],
+        prices: Dict[str, Union[List[float], np.ndarray]],
         volumes: Optional[List[float]] = None,
         timestamp: Optional[datetime] = None
     ) -> TrendAnalysis:
@@ -78,7 +293,9 @@ class TrendAnalyzer:
         Analisa tendências de mercado com base em dados históricos.
         
         Args:
-            prices: Dicionário com preços (open, high, low, close)
+            prices: Dicionário com preços (open, high, low, close), como
+                listas ou arrays NumPy; arrays float64 contíguos (ex.:
+                PriceBuffer.view()) são usados sem cópia
             volumes: Volumes de negociação (opcional)
             timestamp: Timestamp da análise (opcional)
             
@@ -88,92 +305,229 @@ class TrendAnalyzer:
         Raises:
             InsufficientDataException: Se não há dados suficientes
         """
-        if not prices or not prices.get('close'):
+        if not prices or prices.get('close') is None or len(prices['close']) == 0:
             raise InsufficientDataException(1, 0)
         
-        close_prices = prices['close']
-        high_prices = prices.get('high', close_prices)
-        low_prices = prices.get('low', close_prices)
-        open_prices = prices.get('open', close_prices)
+        # Converter cada série para float64 uma única vez; o mesmo buffer é
+        # repassado a todos os indicadores
+        converted: Dict[int, np.ndarray] = {}
+        close_prices = self._as_array(prices['close'], converted)
+        high_prices = self._as_array(prices.get('high', prices['close']), converted)
+        low_prices = self._as_array(prices.get('low', prices['close']), converted)
+        open_prices = self._as_array(prices.get('open', prices['close']), converted)
         
         # Timestamp padrão
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Calcular indicadores
-        indicators_results = {}
+        # A análise depende apenas das séries usadas (os parâmetros são fixos
+        # por instância); ticks repetidos reaproveitam o resultado anterior
+        use_high_low = bool(volumes) and len(volumes) >= 14
+        cache_key = (
+            close_prices.tobytes(),
+            high_prices.tobytes() if use_high_low else None,
+            low_prices.tobytes() if use_high_low else None
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return replace(cached, timestamp=timestamp)
+        
+        # Calcular indicadores: RSI, MACD, Bollinger Bands e médias móveis em
+        # uma única passada; Stochastic e Williams %R se volumes disponíveis
+        indicators_results = TechnicalIndicators.compute_all(
+            close_prices,
+            high_prices if use_high_low else None,
+            low_prices if use_high_low else None,
+            rsi_period=self.rsi_period,
+            rsi_overbought=self.rsi_overbought,
+            rsi_oversold=self.rsi_oversold,
+            macd_fast=self.macd_fast,
+            macd_slow=self.macd_slow,
+            macd_signal=self.macd_signal,
+            bb_period=self.bb_period,
+            bb_std=self.bb_std,
+            ma_short=self.ma_short,
+            ma_long=self.ma_long,
+            k_period=_STOCH_K_PERIOD,
+            d_period=_STOCH_D_PERIOD
+        )
         
-        try:
-            # RSI
-            indicators_results['rsi'] = TechnicalIndicators.rsi(
-                close_prices,
-                period=self.rsi_period,
-                overbought=self.rsi_overbought,
-                oversold=self.rsi_oversold
-            )
-            
-            # MACD
-            indicators_results['macd'] = TechnicalIndicators.macd(
-                close_prices,
-                fast_period=self.macd_fast,
-                slow_period=self.macd_slow,
-                signal_period=self.macd_signal
-            )
-            
-            # Bollinger Bands
-            indicators_results['bollinger'] = TechnicalIndicators.bollinger_bands(
-                close_prices,
-                period=self.bb_period,
-                std_dev=self.bb_std
+        analysis = self._build_analysis(close_prices, indicators_results, use_high_low, timestamp)
+        
+        self._analysis_cache[cache_key] = analysis
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        
+        return analysis
+    
+    def start_stream(self, prices: Dict[str, Union[List[float], np.ndarray]]) -> None:
+        """
+        Inicia a análise incremental a partir do histórico de candles.
+        
+        Args:
+            prices: Dicionário com preços (close e, opcionalmente, high e low)
+                em ordem cronológica
+        """
+        self._state = self._warmup(prices)
+    
+    def reset_stream(self) -> None:
+        """Descarta o estado da análise incremental."""
+        self._state = None
+    
+    def _warmup(self, prices: Dict[str, Union[List[float], np.ndarray]]) -> _StreamState:
+        """Alimenta um estado novo com o histórico, candle a candle."""
+        state = _StreamState(self)
+        close = prices.get('close')
+        if close is None:
+            return state
+        
+        high = prices.get('high')
+        low = prices.get('low')
+        
+        # As EMAs dependem de todo o histórico, mas as janelas móveis só
+        # guardam os últimos candles: o prefixo atualiza apenas as EMAs e
+        # a cauda (maior janela + o candle anterior) passa pelo estado todo
+        tail = max(
+            self.bb_period,
+            self.ma_long + 1,
+            state.recent_close.maxlen,
+            state.close.maxlen
+        )
+        start = max(len(close) - tail, 0)
+        
+        for value in close[:start]:
+            state.push_exponential(float(value))
+        
+        for i in range(start, len(close)):
+            state.push(
+                float(close[i]),
+                float(high[i]) if high is not None else None,
+                float(low[i]) if low is not None else None
             )
-            
-            # Moving Averages
-            indicators_results['moving_averages'] = TechnicalIndicators.moving_averages(
-                close_prices,
-                short_period=self.ma_short,
-                long_period=self.ma_long
+        
+        return state
+    
+    def update_stream(self, close: float, high: Optional[float] = None, low: Optional[float] = None) -> None:
+        """
+        Incorpora um candle ao estado incremental sem classificar os
+        indicadores (candles intermediários entre duas análises).
+        
+        Args:
+            close: Preço de fechamento do candle
+            high: Preço máximo (opcional)
+            low: Preço mínimo (opcional)
+        """
+        if self._state is None:
+            self._state = _StreamState(self)
+        self._state.push(close, high, low)
+    
+    def analyze_stream(
+        self,
+        close: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        open_: Optional[float] = None,
+        timestamp: Optional[datetime] = None
+    ) -> TrendAnalysis:
+        """
+        Analisa o mercado incorporando apenas o novo candle.
+        
+        Equivale a analyze() sobre todo o histórico recebido, mas com custo
+        O(1) por candle. As séries em metadata dos indicadores contêm apenas
+        os pontos usados na classificação (candle anterior e atual).
+        Stochastic e Williams %R entram quando high e low são informados.
+        
+        Args:
+            close: Preço de fechamento do candle
+            high: Preço máximo (opcional)
+            low: Preço mínimo (opcional)
+            open_: Preço de abertura (não usado pelos indicadores)
+            timestamp: Timestamp da análise (opcional)
+        
+        Returns:
+            Análise de tendência
+        
+        Raises:
+            InsufficientDataException: Se ainda não há candles suficientes
+        """
+        self.update_stream(close, high, low)
+        state = self._state
+
+        min_periods = max(self.rsi_period + 1, self.macd_slow + self.macd_signal, self.bb_period, self.ma_long)
+        if state.count < min_periods:
+            raise InsufficientDataException(min_periods, state.count)
+        
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        use_high_low = len(state.close) >= _STOCH_K_PERIOD
+        
+        # Classificar os valores atuais com os mesmos critérios de analyze()
+        macd_line = np.array((state.previous_macd[0], state.macd_value[0]))
+        signal_line = np.array((state.previous_macd[1], state.macd_value[1]))
+        sma_short = np.array((state.previous_sma[0], state.sma_value[0]))
+        sma_long = np.array((state.previous_sma[1], state.sma_value[1]))
+        
+        indicators_results = {
+            'rsi': TechnicalIndicators._rsi_result(
+                np.array((state.rsi_value,)),
+                self.rsi_period,
+                self.rsi_overbought,
+                self.rsi_oversold
+            ),
+            'macd': TechnicalIndicators._macd_result(
+                macd_line,
+                signal_line,
+                self.macd_fast,
+                self.macd_slow,
+                self.macd_signal
+            ),
+            'bollinger': TechnicalIndicators._bollinger_result(
+                np.array((close,)),
+                np.array((state.bb.mean(),)),
+                np.array((state.bb.std(),)),
+                self.bb_period,
+                self.bb_std
+            ),
+            'moving_averages': TechnicalIndicators._moving_averages_result(
+                sma_short,
+                sma_long,
+                self.ma_short,
+                self.ma_long
             )
-            
-            # Adicionar mais indicadores se volumes disponíveis
-            if volumes and len(volumes) >= 14:
-                # Stochastic Oscillator
-                indicators_results['stochastic'] = TechnicalIndicators.stochastic_oscillator(
-                    high_prices,
-                    low_prices,
-                    close_prices
-                )
-                
-                # Williams %R
-                indicators_results['williams_r'] = TechnicalIndicators.williams_r(
-                    high_prices,
-                    low_prices,
-                    close_prices
-                )
-        
-        except Exception as e:
-            logger.error("Error calculating indicators", error=str(e))
-            raise InvalidIndicatorException("analyze", str(e))
-        
-        # Combinar sinais com pesos
-        weights = {
-            'rsi': 1.0,
-            'macd': 1.5,
-            'bollinger': 1.0,
-            'moving_averages': 2.0,
-            'stochastic': 0.8,
-            'williams_r': 0.7
         }
         
-        # Filtrar apenas indicadores disponíveis
-        available_indicators = [indicators_results[k] for k in indicators_results.keys()]
-        available_weights = [weights[k] for k in indicators_results.keys()]
+        if use_high_low:
+            indicators_results.update(TechnicalIndicators.high_low_indicators(
+                np.array(state.high),
+                np.array(state.low),
+                np.array(state.close),
+                k_period=_STOCH_K_PERIOD,
+                d_period=_STOCH_D_PERIOD
+            ))
         
-        # Combinar sinais
+        return self._build_analysis(state.recent_close, indicators_results, use_high_low, timestamp)
+    
+    def _build_analysis(
+        self,
+        close_prices: Sequence[float],
+        indicators_results: Dict[str, IndicatorResult],
+        use_high_low: bool,
+        timestamp: datetime
+    ) -> TrendAnalysis:
+        """Combina os indicadores calculados em uma análise de tendência."""
+        # Combinar sinais com pesos; os indicadores são calculados na ordem de
+        # _WEIGHT_ORDER, e stochastic/williams_r só existem juntos
+        indicators = list(indicators_results.values())
         combined_signal = TechnicalIndicators.combine_signals(
-            available_indicators,
-            available_weights
+            indicators,
+            _WEIGHTS if use_high_low else _CLOSE_WEIGHTS
         )
         
+        # Sinais e forças em arrays paralelos, extraídos uma única vez
+        signal_codes, _ = TechnicalIndicators.signal_arrays(indicators)
+        
         # Determinar tendência
         trend, trend_strength = self._determine_trend(
             close_prices,
@@ -183,7 +537,7 @@ class TrendAnalyzer:
         
         # Calcular confiança
         confidence = self._calculate_confidence(
-            indicators_results,
+            signal_codes,
             combined_signal,
             trend_strength
         )
@@ -199,7 +553,7 @@ class TrendAnalyzer:
     
     def _determine_trend(
         self,
-        prices: List[float],
+        prices: Sequence[float],
         indicators: Dict[str, IndicatorResult],
         combined_signal: IndicatorResult
     ) -> Tuple[str, float]:
@@ -214,60 +568,52 @@ class TrendAnalyzer:
         Returns:
             Tupla com (tendência, força)
         """
+        # Tendências codificadas como -1 (baixa), 0 (lateral), +1 (alta)
+        
         # Verificar tendência de médias móveis
-        ma_trend = "sideways"
+        ma_code = 0
         ma_strength = 0.5
         
         if 'moving_averages' in indicators:
-            ma_result = indicators['moving_averages']
-            ma_values = ma_result.value
-            
-            if ma_values['short_ma'] > ma_values['long_ma']:
-                ma_trend = "bullish"
-                ma_strength = min(ma_values['divergence'] / 5.0, 1.0)
-            elif ma_values['short_ma'] < ma_values['long_ma']:
-                ma_trend = "bearish"
+            ma_values = indicators['moving_averages'].value
+            ma_code = _sign(ma_values['short_ma'] - ma_values['long_ma'])
+            if ma_code:
                 ma_strength = min(ma_values['divergence'] / 5.0, 1.0)
         
         # Verificar tendência de preços recentes
-        price_trend = "sideways"
+        price_code = 0
         price_strength = 0.5
         
         if len(prices) >= 10:
-            recent_prices = prices[-10:]
-            price_change = (recent_prices[-1] - recent_prices[0]) / recent_prices[0] * 100
+            # Variação entre os extremos da janela de 10 candles, sem copiar a janela
+            window_start = float(prices[-10])
+            price_change = (float(prices[-1]) - window_start) / window_start * 100.0
             
-            if price_change > 1.0:  # 1% de aumento
-                price_trend = "bullish"
-                price_strength = min(price_change / 5.0, 1.0)
-            elif price_change < -1.0:  # 1% de queda
-                price_trend = "bearish"
+            if abs(price_change) > 1.0:  # Variação acima de 1%
+                price_code = _sign(price_change)
                 price_strength = min(abs(price_change) / 5.0, 1.0)
         
         # Combinar tendências
-        if ma_trend == price_trend:
-            final_trend = ma_trend
+        if ma_code == price_code:
+            final_code = ma_code
             final_strength = (ma_strength + price_strength) / 2
         elif ma_strength > price_strength:
-            final_trend = ma_trend
+            final_code = ma_code
             final_strength = ma_strength * 0.7 + price_strength * 0.3
         else:
-            final_trend = price_trend
+            final_code = price_code
             final_strength = price_strength * 0.7 + ma_strength * 0.3
         
-        # Ajustar com base no sinal combinado
-        if combined_signal.signal in [SignalType.BUY, SignalType.STRONG_BUY] and final_trend == "bearish":
-            final_trend = "sideways"
-            final_strength = 0.5
-        elif combined_signal.signal in [SignalType.SELL, SignalType.STRONG_SELL] and final_trend == "bullish":
-            final_trend = "sideways"
+        # Sinal combinado na direção oposta à tendência a neutraliza
+        if combined_signal.signal_code * final_code < 0:
+            final_code = 0
             final_strength = 0.5
         
-        return final_trend, final_strength
+        return _CODE_TREND[final_code], final_strength
     
     def _calculate_confidence(
         self,
-        indicators: Dict[str, IndicatorResult],
+        signal_codes: np.ndarray,
         combined_signal: IndicatorResult,
         trend_strength: float
     ) -> float:
@@ -275,7 +621,7 @@ class TrendAnalyzer:
         Calcula o nível de confiança do sinal.
         
         Args:
-            indicators: Resultados dos indicadores
+            signal_codes: Códigos dos sinais dos indicadores (SIGNAL_CODES)
             combined_signal: Sinal combinado
             trend_strength: Força da tendência
             
@@ -283,12 +629,8 @@ class TrendAnalyzer:
             Nível de confiança (0.0 a 1.0)
         """
         # Contar quantos indicadores concordam com o sinal combinado
-        agreeing_indicators = 0
-        total_indicators = len(indicators)
-        
-        for indicator in indicators.values():
-            if indicator.signal == combined_signal.signal:
-                agreeing_indicators += 1
+        total_indicators = signal_codes.size
+        agreeing_indicators = int(np.count_nonzero(signal_codes == combined_signal.signal_code))
         
         # Calcular concordância
         agreement_ratio = agreeing_indicators / total_indicators if total_indicators > 0 else 0
@@ -318,84 +660,28 @@ class TrendAnalyzer:
         strength = analysis.strength
         
         # Descrição do sinal
-        if signal_type in ["buy", "strong_buy"]:
-            action = "compra"
-            if confidence > 0.8:
-                confidence_desc = "alta"
-            elif confidence > 0.6:
-                confidence_desc = "moderada"
-            else:
-                confidence_desc = "baixa"
-        elif signal_type in ["sell", "strong_sell"]:
-            action = "venda"
-            if confidence > 0.8:
-                confidence_desc = "alta"
-            elif confidence > 0.6:
-                confidence_desc = "moderada"
-            else:
-                confidence_desc = "baixa"
-        else:
+        action = _ACTION_BY_SIGNAL.get(signal_type)
+        if action is None:
             action = "neutro"
             confidence_desc = "moderada"
+        else:
+            confidence_desc = _CONFIDENCE_LABELS[bisect_left(_CONFIDENCE_BOUNDS, confidence)]
         
         # Descrição da tendência
-        if trend == "bullish":
-            trend_desc = "alta"
-            if strength > 0.8:
-                trend_strength_desc = "forte"
-            elif strength > 0.5:
-                trend_strength_desc = "moderada"
-            else:
-                trend_strength_desc = "fraca"
-        elif trend == "bearish":
-            trend_desc = "baixa"
-            if strength > 0.8:
-                trend_strength_desc = "forte"
-            elif strength > 0.5:
-                trend_strength_desc = "moderada"
-            else:
-                trend_strength_desc = "fraca"
-        else:
+        trend_desc = _TREND_DESCRIPTION.get(trend)
+        if trend_desc is None:
             trend_desc = "lateral"
             trend_strength_desc = "indefinida"
+        else:
+            trend_strength_desc = _STRENGTH_LABELS[bisect_left(_STRENGTH_BOUNDS, strength)]
         
         # Detalhes dos indicadores
         indicators_details = {}
         for name, indicator in analysis.indicators.items():
-            if name == "rsi":
-                value = indicator.value
-                if value > 70:
-                    status = "sobrecomprado"
-                elif value < 30:
-                    status = "sobrevendido"
-                else:
-                    status = "neutro"
-                indicators_details["RSI"] = {
-                    "valor": round(value, 2),
-                    "status": status
-                }
-            elif name == "macd":
-                value = indicator.value
-                indicators_details["MACD"] = {
-                    "linha_macd": round(value["macd"], 4),
-                    "linha_sinal": round(value["signal"], 4),
-                    "histograma": round(value["histogram"], 4)
-                }
-            elif name == "bollinger":
-                value = indicator.value
-                indicators_details["Bollinger"] = {
-                    "banda_superior": round(value["upper"], 2),
-                    "banda_media": round(value["middle"], 2),
-                    "banda_inferior": round(value["lower"], 2),
-                    "posicao": round(value["position"] * 100, 1)
-                }
-            elif name == "moving_averages":
-                value = indicator.value
-                indicators_details["Médias Móveis"] = {
-                    "curta": round(value["short_ma"], 2),
-                    "longa": round(value["long_ma"], 2),
-                    "divergencia": round(value["divergence"], 2)
-                }
+            entry = _DETAIL_BUILDERS.get(name)
+            if entry is not None:
+                display_name, build = entry
+                indicators_details[display_name] = build(indicator.value)
         
         return {
             "sinal": signal_type,
@@ -412,6 +698,6 @@ class TrendAnalyzer:
                 }
             },
             "indicadores": indicators_details,
-            "timestamp": analysis.timestamp.isoformat()
+            "timestamp": _isoformat(analysis.timestamp)
         }
 
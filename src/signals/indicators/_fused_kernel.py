@@ -0,0 +1,493 @@
+"""
+Kernels compilados dos indicadores baseados no fechamento.
+
+Calcula RSI, MACD, Bollinger Bands e médias móveis em uma única passada
+sobre o array de fechamentos, reproduzindo a semântica dos indicadores
+individuais (RSI de Wilder, ewm com adjust=False, rolling mean/std com
+ddof=1), e os kernels isolados usados por esses indicadores.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, error_model="numpy")
+def _ema_step(num, den, x, alpha, adjust):
+    """
+    Atualiza o estado (numerador, denominador) de uma EMA com o valor x.
+    
+    Com adjust=True numerador e denominador da média ponderada decaem a
+    cada valor e nulos só decaem (ignore_na=False). Com adjust=False a
+    média é a recorrência s = alpha * x + (1 - alpha) * s, semeada com o
+    primeiro valor válido (den fica em 1), e nulos não alteram o estado.
+    A média vale num / den, ou NaN enquanto den é zero.
+    """
+    if adjust:
+        num *= 1.0 - alpha
+        den *= 1.0 - alpha
+        if not np.isnan(x):
+            num += x
+            den += 1.0
+    elif not np.isnan(x):
+        if den == 0.0:
+            num = x
+            den = 1.0
+        else:
+            num = alpha * x + (1.0 - alpha) * num
+    return num, den
+
+
+@njit(cache=True, error_model="numpy")
+def ewm_mean(values, span, adjust=False):
+    """
+    Média móvel exponencial, equivalente a pandas
+    ewm(span=span, adjust=adjust).mean() sem nulos intermediários.
+    
+    A forma recursiva (adjust=False, padrão) custa uma multiplicação-soma
+    por valor; a ajustada difere dela apenas no início da série, por um
+    termo que decai com (1 - alpha)^n.
+    """
+    n = values.shape[0]
+    result = np.empty(n)
+    alpha = 2.0 / (span + 1.0)
+    num = 0.0
+    den = 0.0
+    
+    for i in range(n):
+        num, den = _ema_step(num, den, values[i], alpha, adjust)
+        result[i] = num / den if den > 0.0 else np.nan
+    
+    return result
+
+
+@njit(cache=True, error_model="numpy")
+def macd_lines(values, fast_period, slow_period, signal_period, adjust=False):
+    """
+    Linhas do MACD e de sinal em uma única passada.
+    
+    Equivale a ewm_mean aplicada aos preços (EMAs rápida e lenta) e à
+    diferença entre elas (sinal), mas as três médias são atualizadas no
+    mesmo laço, com os fatores alpha calculados uma vez por chamada e sem
+    séries intermediárias para as EMAs.
+    
+    Returns:
+        Tupla (macd, signal)
+    """
+    n = values.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    fast_alpha = 2.0 / (fast_period + 1.0)
+    slow_alpha = 2.0 / (slow_period + 1.0)
+    signal_alpha = 2.0 / (signal_period + 1.0)
+    fast_num = 0.0
+    fast_den = 0.0
+    slow_num = 0.0
+    slow_den = 0.0
+    signal_num = 0.0
+    signal_den = 0.0
+    
+    for i in range(n):
+        # Nulos (só os iniciais, após validate_data) não entram nas médias
+        x = values[i]
+        fast_num, fast_den = _ema_step(fast_num, fast_den, x, fast_alpha, adjust)
+        slow_num, slow_den = _ema_step(slow_num, slow_den, x, slow_alpha, adjust)
+        m = fast_num / fast_den - slow_num / slow_den if fast_den > 0.0 else np.nan
+        macd[i] = m
+        signal_num, signal_den = _ema_step(signal_num, signal_den, m, signal_alpha, adjust)
+        signal[i] = signal_num / signal_den if signal_den > 0.0 else np.nan
+    
+    return macd, signal
+
+
+@njit(cache=True, error_model="numpy")
+def forward_fill(values):
+    """
+    Copia a série preenchendo cada nulo com o último valor válido.
+    
+    Nulos iniciais permanecem nulos, como em fillna(method='ffill').
+    """
+    result = values.copy()
+    for i in range(1, result.shape[0]):
+        if np.isnan(result[i]):
+            result[i] = result[i - 1]
+    return result
+
+
+@njit(cache=True, error_model="numpy")
+def any_nan_hlc(high, low, close):
+    """
+    Indica se máximas, mínimas ou fechamentos (de mesmo tamanho) contêm
+    nulos, percorrendo as três séries juntas e parando no primeiro.
+    """
+    for i in range(close.shape[0]):
+        if np.isnan(high[i]) or np.isnan(low[i]) or np.isnan(close[i]):
+            return True
+    return False
+
+
+@njit(cache=True, error_model="numpy")
+def _wilder_step(delta, count, period, avg_gain, avg_loss):
+    """
+    Atualiza as médias de ganhos e perdas do RSI com a variação de número
+    count (a partir de 1).
+    
+    As primeiras period variações formam a média simples inicial; depois
+    vale a suavização de Wilder, avg = (avg * (period - 1) + valor) / period.
+    """
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    if count <= period:
+        return avg_gain + gain / period, avg_loss + loss / period
+    return (
+        (avg_gain * (period - 1) + gain) / period,
+        (avg_loss * (period - 1) + loss) / period
+    )
+
+
+@njit(cache=True, error_model="numpy")
+def rsi_wilder(prices, period):
+    """
+    RSI com suavização de Wilder em uma única passada.
+    
+    Returns:
+        Série do RSI, com NaN antes da primeira média completa (índice
+        period)
+    """
+    n = prices.shape[0]
+    result = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        avg_gain, avg_loss = _wilder_step(prices[i] - prices[i - 1], i, period, avg_gain, avg_loss)
+        if i >= period:
+            result[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    
+    return result
+
+
+@njit(cache=True, error_model="numpy")
+def rsi_wilder_last(prices, period):
+    """
+    Último valor do RSI de Wilder, sem materializar a série.
+    
+    Mesma recursão de rsi_wilder, mantendo apenas as médias finais de
+    ganhos e perdas (NaN se não há period + 1 preços).
+    """
+    n = prices.shape[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        avg_gain, avg_loss = _wilder_step(prices[i] - prices[i - 1], i, period, avg_gain, avg_loss)
+    
+    if n <= period:
+        return np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True, error_model="numpy")
+def _rolling_sum_step(values, i, window, nan_count, total, since_sync):
+    """
+    Avança a soma corrente de rolling_mean até a janela terminada em i.
+    
+    Returns:
+        Tupla (média da janela ou NaN, nan_count, total, since_sync)
+    """
+    x = values[i]
+    if np.isnan(x):
+        nan_count += 1
+    if i >= window and np.isnan(values[i - window]):
+        nan_count -= 1
+    if i < window - 1:
+        return np.nan, nan_count, total, since_sync
+    if nan_count > 0:
+        return np.nan, nan_count, total, window
+    
+    if since_sync >= window:
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += values[j]
+        since_sync = 0
+    else:
+        total += x - values[i - window]
+    
+    return total / window, nan_count, total, since_sync + 1
+
+
+@njit(cache=True, error_model="numpy")
+def rolling_mean(values, window):
+    """
+    Média móvel simples com soma corrente (O(1) por valor).
+    
+    A soma é recalculada exatamente a cada window valores, limitando o
+    acúmulo de erro de arredondamento. Janelas com nulos resultam em NaN.
+    
+    Returns:
+        Série das médias, com NaN onde a janela ainda não está completa
+    """
+    n = values.shape[0]
+    result = np.full(n, np.nan)
+    nan_count = 0
+    total = 0.0
+    since_sync = window
+    
+    for i in range(n):
+        mean, nan_count, total, since_sync = _rolling_sum_step(
+            values, i, window, nan_count, total, since_sync
+        )
+        result[i] = mean
+    
+    return result
+
+
+@njit(cache=True, error_model="numpy")
+def _rolling_mean_std_step(values, i, window, nan_count, fresh, mean, m2):
+    """
+    Avança o estado de Welford de rolling_mean_std até a janela terminada em i.
+    
+    Returns:
+        Tupla (média ou NaN, desvio ou NaN, nan_count, fresh, mean, m2)
+    """
+    x = values[i]
+    if np.isnan(x):
+        nan_count += 1
+    if i >= window and np.isnan(values[i - window]):
+        nan_count -= 1
+    if i < window - 1:
+        return np.nan, np.nan, nan_count, fresh, mean, m2
+    if nan_count > 0:
+        return np.nan, np.nan, nan_count, True, mean, m2
+    
+    if fresh:
+        # Primeira janela válida: duas passadas exatas
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += values[j]
+        mean = total / window
+        m2 = 0.0
+        for j in range(i - window + 1, i + 1):
+            diff = values[j] - mean
+            m2 += diff * diff
+    else:
+        old = values[i - window]
+        new_mean = mean + (x - old) / window
+        m2 += (x - old) * (x - new_mean + old - mean)
+        mean = new_mean
+    
+    std = np.sqrt(max(m2, 0.0) / (window - 1)) if window > 1 else np.nan
+    return mean, std, nan_count, False, mean, m2
+
+
+@njit(cache=True, error_model="numpy")
+def rolling_mean_std(values, window):
+    """
+    Média e desvio padrão amostral (ddof=1) móveis em uma única passada.
+    
+    A cada deslocamento da janela a média e a soma dos quadrados dos
+    desvios são atualizadas em O(1) (Welford com remoção), evitando a
+    perda de precisão de soma/soma dos quadrados com preços altos. Janelas
+    com nulos resultam em NaN, e a primeira janela completa após elas é
+    recalculada do zero.
+    
+    Returns:
+        Tupla (mean, std), com NaN onde a janela ainda não está completa
+    """
+    n = values.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    
+    nan_count = 0
+    fresh = True
+    mean = 0.0
+    m2 = 0.0
+    
+    for i in range(n):
+        mean_i, std_i, nan_count, fresh, mean, m2 = _rolling_mean_std_step(
+            values, i, window, nan_count, fresh, mean, m2
+        )
+        mean_out[i] = mean_i
+        std_out[i] = std_i
+    
+    return mean_out, std_out
+
+
+@njit(cache=True, error_model="numpy")
+def last_mean_std(values, window):
+    """
+    Média e desvio padrão amostral (ddof=1) apenas da última janela.
+    
+    Duas passadas exatas sobre os últimos window valores; um nulo na
+    janela resulta em NaN, como em rolling_mean_std.
+    
+    Returns:
+        Tupla (mean, std)
+    """
+    start = values.shape[0] - window
+    total = 0.0
+    for j in range(start, start + window):
+        total += values[j]
+    mean = total / window
+    
+    m2 = 0.0
+    for j in range(start, start + window):
+        diff = values[j] - mean
+        m2 += diff * diff
+    
+    std = np.sqrt(m2 / (window - 1)) if window > 1 else np.nan
+    return mean, std
+
+
+@njit(cache=True, error_model="numpy")
+def _rolling_extreme(values, window, sign):
+    """
+    Extremo móvel com deque monotônica de índices (O(1) amortizado).
+    
+    sign=1 calcula o máximo e sign=-1 o mínimo. A deque é um buffer
+    circular de capacidade window; janelas com nulos resultam em NaN.
+    """
+    n = values.shape[0]
+    result = np.full(n, np.nan)
+    queue = np.empty(window, dtype=np.int64)
+    head = 0
+    size = 0
+    nan_count = 0
+    
+    for i in range(n):
+        # Descartar o índice que saiu da janela
+        if size > 0 and queue[head] <= i - window:
+            head = (head + 1) % window
+            size -= 1
+        if i >= window and np.isnan(values[i - window]):
+            nan_count -= 1
+        
+        x = values[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            # Valores dominados pelo novo nunca mais serão o extremo
+            while size > 0 and sign * values[queue[(head + size - 1) % window]] <= sign * x:
+                size -= 1
+            queue[(head + size) % window] = i
+            size += 1
+        
+        if i >= window - 1 and nan_count == 0:
+            result[i] = values[queue[head]]
+    
+    return result
+
+
+@njit(cache=True, error_model="numpy")
+def rolling_max(values, window):
+    """Máximo móvel, com NaN onde a janela ainda não está completa."""
+    return _rolling_extreme(values, window, 1.0)
+
+
+@njit(cache=True, error_model="numpy")
+def rolling_min(values, window):
+    """Mínimo móvel, com NaN onde a janela ainda não está completa."""
+    return _rolling_extreme(values, window, -1.0)
+
+
+@njit(cache=True, error_model="numpy")
+def fused_close_indicators(
+    close,
+    rsi_period,
+    macd_fast,
+    macd_slow,
+    macd_signal,
+    bb_period,
+    ma_short,
+    ma_long,
+    out
+):
+    """
+    Percorre os fechamentos uma vez atualizando todas as recorrências.
+    
+    As EMAs são sequenciais por natureza, então o laço não é paralelizado;
+    o ganho vem de ler o buffer uma única vez e não alocar séries
+    intermediárias. Todas as janelas são atualizadas em O(1) por candle.
+    
+    As sete séries são gravadas nas linhas de out (shape (7, n)), que
+    pode ser reaproveitado entre chamadas.
+    
+    Returns:
+        Tupla (rsi, macd, signal, bb_mean, bb_std, sma_short, sma_long)
+        de views de out, com NaN onde a janela ainda não está completa
+    """
+    n = close.shape[0]
+    rsi = out[0]
+    macd = out[1]
+    signal = out[2]
+    bb_mean = out[3]
+    bb_std = out[4]
+    sma_short = out[5]
+    sma_long = out[6]
+    rsi[:] = np.nan
+    
+    # Fatores das EMAs (alpha = 2 / (span + 1))
+    fast_alpha = 2.0 / (macd_fast + 1.0)
+    slow_alpha = 2.0 / (macd_slow + 1.0)
+    signal_alpha = 2.0 / (macd_signal + 1.0)
+    
+    # Médias de ganhos e perdas do RSI (suavização de Wilder)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    # Estado das EMAs (recorrência adjust=False, ver _ema_step)
+    fast_num = 0.0
+    fast_den = 0.0
+    slow_num = 0.0
+    slow_den = 0.0
+    signal_num = 0.0
+    signal_den = 0.0
+    
+    # Estado das janelas móveis (ver _rolling_mean_std_step e
+    # _rolling_sum_step): nulos invalidam a janela até saírem dela
+    bb_nan = 0
+    bb_fresh = True
+    bb_m = 0.0
+    bb_m2 = 0.0
+    short_nan = 0
+    short_sum = 0.0
+    short_sync = ma_short
+    long_nan = 0
+    long_sum = 0.0
+    long_sync = ma_long
+    
+    for i in range(n):
+        x = close[i]
+        
+        # RSI: ganhos e perdas suavizados
+        if i > 0:
+            avg_gain, avg_loss = _wilder_step(x - close[i - 1], i, rsi_period, avg_gain, avg_loss)
+            if i >= rsi_period:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        
+        # MACD: EMAs rápida e lenta e linha de sinal
+        fast_num, fast_den = _ema_step(fast_num, fast_den, x, fast_alpha, False)
+        slow_num, slow_den = _ema_step(slow_num, slow_den, x, slow_alpha, False)
+        m = fast_num / fast_den - slow_num / slow_den if fast_den > 0.0 else np.nan
+        macd[i] = m
+        signal_num, signal_den = _ema_step(signal_num, signal_den, m, signal_alpha, False)
+        signal[i] = signal_num / signal_den if signal_den > 0.0 else np.nan
+        
+        # Bollinger: média e soma dos quadrados dos desvios da janela
+        # (Welford com remoção, como rolling_mean_std)
+        mean_i, std_i, bb_nan, bb_fresh, bb_m, bb_m2 = _rolling_mean_std_step(
+            close, i, bb_period, bb_nan, bb_fresh, bb_m, bb_m2
+        )
+        bb_mean[i] = mean_i
+        bb_std[i] = std_i
+        
+        # Médias móveis simples (como rolling_mean)
+        mean_i, short_nan, short_sum, short_sync = _rolling_sum_step(
+            close, i, ma_short, short_nan, short_sum, short_sync
+        )
+        sma_short[i] = mean_i
+        mean_i, long_nan, long_sum, long_sync = _rolling_sum_step(
+            close, i, ma_long, long_nan, long_sum, long_sync
+        )
+        sma_long[i] = mean_i
+    
+    return rsi, macd, signal, bb_mean, bb_std, sma_short, sma_long
@@ -0,0 +1,272 @@
+"""
+Estado incremental de indicadores para processamento candle a candle.
+
+Em vez de recalcular as janelas inteiras a cada novo candle, estes
+acumuladores atualizam suas estatísticas em O(1) por valor recebido.
+"""
+
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+# Tipo dos buffers de preço. float32 não serve: com preços na casa de
+# dezenas de milhares (BTC) o passo de representação passa de 0,001, e
+# somas móveis e variâncias de janelas de baixa volatilidade perdem todos
+# os dígitos significativos
+PRICE_DTYPE = np.float64
+
+
+class RollingWindow:
+    """
+    Janela móvel com média e soma dos quadrados dos desvios incrementais.
+    
+    Fornece a média (SMA) e o desvio padrão amostral (ddof=1, como
+    pandas rolling().std()) da janela em O(1) por valor, com a mesma
+    atualização de Welford com remoção de rolling_mean_std: a forma
+    soma dos quadrados - soma²/n cancela catastroficamente com preços altos.
+    """
+    
+    __slots__ = ("period", "_buffer", "_index", "_count", "_mean", "_m2")
+    
+    def __init__(self, period: int):
+        """
+        Inicializa a janela.
+        
+        Args:
+            period: Tamanho da janela
+        """
+        self.period = period
+        self._buffer: List[float] = [0.0] * period
+        self._index = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+    
+    @property
+    def ready(self) -> bool:
+        """Indica se a janela já está completa."""
+        return self._count == self.period
+    
+    def push(self, value: float) -> None:
+        """Adiciona um valor, descartando o mais antigo se a janela está cheia."""
+        if self._count == self.period:
+            old = self._buffer[self._index]
+            new_mean = self._mean + (value - old) / self.period
+            self._m2 += (value - old) * (value - new_mean + old - self._mean)
+            self._mean = new_mean
+        else:
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        
+        self._buffer[self._index] = value
+        self._index += 1
+        
+        if self._index == self.period:
+            self._index = 0
+            # Recalcular a cada volta completa evita o acúmulo de erro de
+            # arredondamento (custo O(period) amortizado em O(1))
+            if self._count == self.period:
+                self._mean = math.fsum(self._buffer) / self.period
+                self._m2 = math.fsum((v - self._mean) ** 2 for v in self._buffer)
+    
+    def mean(self) -> float:
+        """Média da janela (NaN enquanto incompleta)."""
+        if not self.ready:
+            return math.nan
+        return self._mean
+    
+    def std(self) -> float:
+        """Desvio padrão amostral da janela (NaN enquanto incompleta)."""
+        if not self.ready or self.period < 2:
+            return math.nan
+        return math.sqrt(max(self._m2, 0.0) / (self.period - 1))
+
+
+class EwmMean:
+    """
+    Média móvel exponencial incremental.
+    
+    Usa a recorrência s = alpha * x + (1 - alpha) * s semeada com o
+    primeiro valor, como ewm_mean com adjust=False (padrão dos kernels).
+    """
+    
+    __slots__ = ("_alpha", "_value")
+    
+    def __init__(self, span: int):
+        """
+        Inicializa a média.
+        
+        Args:
+            span: Período da EMA (alpha = 2 / (span + 1))
+        """
+        self._alpha = 2.0 / (span + 1.0)
+        self._value = math.nan
+    
+    def update(self, value: float) -> float:
+        """Adiciona um valor e retorna a média atualizada."""
+        if self._value != self._value:
+            self._value = value
+        else:
+            self._value = self._alpha * value + (1.0 - self._alpha) * self._value
+        return self._value
+
+
+class RsiState:
+    """
+    RSI incremental com suavização de Wilder.
+    
+    As primeiras period variações formam a média simples inicial; depois
+    avg = (avg * (period - 1) + valor) / period, como o kernel rsi_wilder.
+    """
+    
+    __slots__ = ("period", "_previous", "_count", "_avg_gain", "_avg_loss")
+    
+    def __init__(self, period: int):
+        """
+        Inicializa o estado.
+        
+        Args:
+            period: Período do RSI
+        """
+        self.period = period
+        self._previous = math.nan
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+    
+    def update(self, close: float) -> float:
+        """Adiciona um fechamento e retorna o RSI atual (NaN até a média inicial)."""
+        previous = self._previous
+        self._previous = close
+        if previous != previous:
+            return math.nan
+        
+        delta = close - previous
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        
+        self._count += 1
+        if self._count <= period:
+            self._avg_gain += gain / period
+            self._avg_loss += loss / period
+            if self._count < period:
+                return math.nan
+        else:
+            self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+            self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+        
+        if self._avg_loss == 0.0:
+            # Mesmo resultado da divisão em ponto flutuante do NumPy
+            return 100.0 if self._avg_gain > 0.0 else math.nan
+        return 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+
+
+class MacdState:
+    """MACD incremental: EMAs rápida e lenta e linha de sinal."""
+    
+    __slots__ = ("_fast", "_slow", "_signal")
+    
+    def __init__(self, fast_period: int, slow_period: int, signal_period: int):
+        """
+        Inicializa o estado.
+        
+        Args:
+            fast_period: Período da EMA rápida
+            slow_period: Período da EMA lenta
+            signal_period: Período da linha de sinal
+        """
+        self._fast = EwmMean(fast_period)
+        self._slow = EwmMean(slow_period)
+        self._signal = EwmMean(signal_period)
+    
+    def update(self, close: float) -> Tuple[float, float]:
+        """Adiciona um fechamento e retorna (macd, sinal)."""
+        macd = self._fast.update(close) - self._slow.update(close)
+        return macd, self._signal.update(macd)
+
+
+class PriceBuffer:
+    """
+    Buffer circular de preços em float64 contíguo.
+    
+    Cada valor é gravado em duas posições de um array com o dobro do
+    tamanho, de modo que os últimos maxlen valores formam sempre uma
+    fatia contígua em ordem cronológica: view() não copia nem reordena.
+    """
+    
+    __slots__ = ("maxlen", "_storage", "_index", "_count")
+    
+    def __init__(self, maxlen: int):
+        """
+        Inicializa o buffer.
+        
+        Args:
+            maxlen: Número máximo de valores mantidos
+        """
+        self.maxlen = maxlen
+        self._storage = np.empty(2 * maxlen, dtype=PRICE_DTYPE)
+        self._index = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def push(self, value: float) -> None:
+        """Adiciona um valor, sobrescrevendo o mais antigo se cheio."""
+        self._storage[self._index] = value
+        self._storage[self._index + self.maxlen] = value
+        self._index += 1
+        if self._index == self.maxlen:
+            self._index = 0
+        if self._count < self.maxlen:
+            self._count += 1
+    
+    def view(self) -> np.ndarray:
+        """
+        Retorna os valores em ordem cronológica, sem cópia.
+        
+        A view é somente leitura e reflete escritas posteriores; copie-a
+        se precisar preservar o conteúdo após novos push().
+        """
+        if self._count < self.maxlen:
+            window = self._storage[:self._count]
+        else:
+            window = self._storage[self._index:self._index + self.maxlen]
+        window = window.view()
+        window.flags.writeable = False
+        return window
+
+
+class IndicatorWorkspace:
+    """
+    Buffers pré-alocados para as séries do kernel fundido.
+    
+    Chamadas seguidas de close_indicators/compute_all (ex.: em backtests)
+    gravam nas mesmas sete linhas em vez de alocar séries novas. As séries
+    dos resultados (metadata *_series) passam a ser views desses buffers e
+    são sobrescritas pela chamada seguinte; copie-as se precisar
+    preservá-las.
+    """
+    
+    __slots__ = ("capacity", "_storage")
+    
+    def __init__(self, capacity: int):
+        """
+        Inicializa o workspace.
+        
+        Args:
+            capacity: Tamanho máximo esperado das séries (cresce se preciso)
+        """
+        self.capacity = capacity
+        self._storage = np.empty((7, capacity), dtype=PRICE_DTYPE)
+    
+    def rows(self, n: int) -> np.ndarray:
+        """Retorna as sete linhas com os primeiros n elementos (shape (7, n))."""
+        if n > self.capacity:
+            self.capacity = n
+            self._storage = np.empty((7, n), dtype=PRICE_DTYPE)
+        return self._storage[:, :n]
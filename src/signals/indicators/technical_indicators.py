@@ -8,16 +8,41 @@ médias móveis e outros.
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional, Union
+from functools import lru_cache
+from typing import Any, List, Dict, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 from ...config.logging_config import get_logger
 from ...core.exceptions import InvalidIndicatorException, InsufficientDataException
+from ._fused_kernel import (
+    any_nan_hlc,
+    forward_fill,
+    fused_close_indicators,
+    last_mean_std,
+    macd_lines,
+    rolling_max,
+    rolling_mean,
+    rolling_mean_std,
+    rolling_min,
+    rsi_wilder,
+    rsi_wilder_last
+)
+from .streaming import PRICE_DTYPE, IndicatorWorkspace
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _normalized_weights(weights: Tuple[float, ...]) -> np.ndarray:
+    """Normaliza os pesos para somarem 1 (array somente leitura, compartilhado)."""
+    normalized = np.array(weights, dtype=np.float64)
+    normalized /= normalized.sum()
+    normalized.flags.writeable = False
+    return normalized
+
+
 class SignalType(Enum):
     """Tipos de sinais de trading."""
     BUY = "buy"
@@ -27,13 +52,35 @@ class SignalType(Enum):
     STRONG_SELL = "strong_sell"
 
 
-@dataclass
+# Código inteiro de cada sinal: positivo para compra, negativo para venda
+SIGNAL_CODES = MappingProxyType({
+    SignalType.STRONG_SELL: -2,
+    SignalType.SELL: -1,
+    SignalType.HOLD: 0,
+    SignalType.BUY: 1,
+    SignalType.STRONG_BUY: 2
+})
+
+# Valor textual de cada código de sinal
+_SIGNAL_VALUES = MappingProxyType({code: signal.value for signal, code in SIGNAL_CODES.items()})
+
+# Conjuntos imutáveis para testes de pertinência (sem criar listas a cada teste)
+BUY_SIGNALS = frozenset({SignalType.BUY, SignalType.STRONG_BUY})
+SELL_SIGNALS = frozenset({SignalType.SELL, SignalType.STRONG_SELL})
+
+
+@dataclass(slots=True)
 class IndicatorResult:
     """Resultado de um indicador técnico."""
     value: Union[float, Dict[str, float]]
     signal: SignalType
     strength: float  # 0.0 a 1.0
-    metadata: Dict[str, any]
+    metadata: Dict[str, any]  # séries completas (*_series) como np.ndarray, exceto com return_last_only
+    
+    @property
+    def signal_code(self) -> int:
+        """Código inteiro do sinal (-2 a 2), para comparações numéricas."""
+        return SIGNAL_CODES[self.signal]
 
 
 class TechnicalIndicators:
@@ -45,39 +92,92 @@ class TechnicalIndicators:
     """
     
     @staticmethod
-    def validate_data(data: Union[List[float], pd.Series], min_periods: int) -> pd.Series:
+    def validate_data(
+        data: Union[List[float], np.ndarray, pd.Series],
+        min_periods: int,
+        validate: bool = True
+    ) -> np.ndarray:
         """
-        Valida e converte dados para pandas Series.
+        Valida e converte dados para np.ndarray float64.
+        
+        Arrays NumPy float64 são usados sem cópia, permitindo que vários
+        indicadores compartilhem o mesmo buffer.
         
         Args:
             data: Dados de preço
             min_periods: Número mínimo de períodos necessários
+            validate: Se False, pula a verificação de nulos (dados já validados)
             
         Returns:
-            Dados como pandas Series
+            Dados como np.ndarray float64
             
         Raises:
             InsufficientDataException: Se não há dados suficientes
             InvalidIndicatorException: Se os dados são inválidos
         """
-        if isinstance(data, list):
-            data = pd.Series(data)
+        data = np.asarray(data, dtype=PRICE_DTYPE)
         
         if len(data) < min_periods:
             raise InsufficientDataException(min_periods, len(data))
         
-        if data.isnull().any():
+        if validate and np.isnan(data).any():
             logger.warning("Data contains null values, forward filling")
-            data = data.fillna(method='ffill')
+            data = forward_fill(data)
         
         return data
     
+    @staticmethod
+    def _validate_hlc(
+        high_prices: Union[List[float], np.ndarray, pd.Series],
+        low_prices: Union[List[float], np.ndarray, pd.Series],
+        close_prices: Union[List[float], np.ndarray, pd.Series],
+        min_periods: int,
+        validate: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Valida máximas, mínimas e fechamentos de uma vez.
+        
+        Sem dados OHLC o chamador repassa o mesmo buffer de fechamento como
+        máxima e mínima; séries idênticas são convertidas uma única vez e
+        compartilham o mesmo array. A busca por nulos percorre as três
+        séries em uma só passada.
+        """
+        close = TechnicalIndicators.validate_data(close_prices, min_periods, validate=False)
+        high = close if high_prices is close_prices else TechnicalIndicators.validate_data(
+            high_prices, min_periods, validate=False
+        )
+        if low_prices is close_prices:
+            low = close
+        elif low_prices is high_prices:
+            low = high
+        else:
+            low = TechnicalIndicators.validate_data(low_prices, min_periods, validate=False)
+        
+        if len(high) != len(close) or len(low) != len(close):
+            raise InvalidIndicatorException("hlc", "High, low and close lengths must match")
+        
+        if validate and any_nan_hlc(high, low, close):
+            logger.warning("Data contains null values, forward filling")
+            filled_close = forward_fill(close)
+            filled_high = filled_close if high is close else forward_fill(high)
+            if low is close:
+                low = filled_close
+            elif low is high:
+                low = filled_high
+            else:
+                low = forward_fill(low)
+            high, close = filled_high, filled_close
+        
+        return high, low, close
+    
     @staticmethod
     def rsi(
-        prices: Union[List[float], pd.Series],
+        prices: Union[List[float], np.ndarray, pd.Series],
         period: int = 14,
         overbought: float = 70,
-        oversold: float = 30
+        oversold: float = 30,
+        validate: bool = True,
+        return_last_only: bool = False
     ) -> IndicatorResult:
         """
         Calcula o Relative Strength Index (RSI).
@@ -87,28 +187,38 @@ class TechnicalIndicators:
             period: Período para cálculo
             overbought: Nível de sobrecompra
             oversold: Nível de sobrevenda
+            validate: Se False, pula a verificação de nulos (dados já validados)
+            return_last_only: Calcula só o valor atual, sem a série no metadata
             
         Returns:
             Resultado do RSI
         """
-        prices = TechnicalIndicators.validate_data(prices, period + 1)
-        
-        # Calcular mudanças de preço
-        delta = prices.diff()
-        
-        # Separar ganhos e perdas
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
+        prices = TechnicalIndicators.validate_data(prices, period + 1, validate)
         
-        # Calcular médias móveis exponenciais
-        avg_gains = gains.ewm(span=period).mean()
-        avg_losses = losses.ewm(span=period).mean()
-        
-        # Calcular RSI
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
-        
-        current_rsi = rsi.iloc[-1]
+        # Médias de ganhos e perdas com suavização de Wilder, em uma passada
+        if return_last_only:
+            rsi = np.array([rsi_wilder_last(prices, period)])
+        else:
+            rsi = rsi_wilder(prices, period)
+        
+        return TechnicalIndicators._rsi_result(
+            rsi,
+            period,
+            overbought,
+            oversold,
+            include_series=not return_last_only
+        )
+    
+    @staticmethod
+    def _rsi_result(
+        rsi: np.ndarray,
+        period: int,
+        overbought: float,
+        oversold: float,
+        include_series: bool = True
+    ) -> IndicatorResult:
+        """Classifica a série do RSI em sinal e força."""
+        current_rsi = rsi[-1]
         
         # Determinar sinal
         if current_rsi >= overbought:
@@ -126,56 +236,76 @@ class TechnicalIndicators:
             )
             strength = 1.0 - (distance_to_extreme / 50.0)
         
+        metadata = {
+            "period": period,
+            "overbought": overbought,
+            "oversold": oversold
+        }
+        if include_series:
+            metadata["rsi_series"] = rsi
+        
         return IndicatorResult(
             value=current_rsi,
             signal=signal,
             strength=strength,
-            metadata={
-                "period": period,
-                "overbought": overbought,
-                "oversold": oversold,
-                "rsi_series": rsi.tolist()
-            }
+            metadata=metadata
         )
     
     @staticmethod
     def macd(
-        prices: Union[List[float], pd.Series],
+        prices: Union[List[float], np.ndarray, pd.Series],
         fast_period: int = 12,
         slow_period: int = 26,
-        signal_period: int = 9
+        signal_period: int = 9,
+        validate: bool = True,
+        adjust: bool = False
     ) -> IndicatorResult:
         """
         Calcula o MACD (Moving Average Convergence Divergence).
         
+        As EMAs usam por padrão a recorrência simples (adjust=False), como
+        close_indicators e o modo streaming; adjust=True reproduz pandas
+        ewm(span=...).mean() e só difere no início da série.
+        
         Args:
             prices: Preços de fechamento
             fast_period: Período da EMA rápida
             slow_period: Período da EMA lenta
             signal_period: Período da linha de sinal
+            validate: Se False, pula a verificação de nulos (dados já validados)
+            adjust: Usar a EMA ajustada (média ponderada normalizada)
             
         Returns:
             Resultado do MACD
         """
-        prices = TechnicalIndicators.validate_data(prices, slow_period + signal_period)
-        
-        # Calcular EMAs
-        ema_fast = prices.ewm(span=fast_period).mean()
-        ema_slow = prices.ewm(span=slow_period).mean()
+        prices = TechnicalIndicators.validate_data(prices, slow_period + signal_period, validate)
         
-        # Calcular MACD line
-        macd_line = ema_fast - ema_slow
+        # EMAs rápida e lenta e linha de sinal em uma passada
+        macd_line, signal_line = macd_lines(prices, fast_period, slow_period, signal_period, adjust)
         
-        # Calcular Signal line
-        signal_line = macd_line.ewm(span=signal_period).mean()
-        
-        # Calcular Histogram
+        return TechnicalIndicators._macd_result(
+            macd_line,
+            signal_line,
+            fast_period,
+            slow_period,
+            signal_period
+        )
+    
+    @staticmethod
+    def _macd_result(
+        macd_line: np.ndarray,
+        signal_line: np.ndarray,
+        fast_period: int,
+        slow_period: int,
+        signal_period: int
+    ) -> IndicatorResult:
+        """Classifica as linhas do MACD em sinal e força."""
         histogram = macd_line - signal_line
         
-        current_macd = macd_line.iloc[-1]
-        current_signal = signal_line.iloc[-1]
-        current_histogram = histogram.iloc[-1]
-        previous_histogram = histogram.iloc[-2] if len(histogram) > 1 else 0
+        current_macd = macd_line[-1]
+        current_signal = signal_line[-1]
+        current_histogram = histogram[-1]
+        previous_histogram = histogram[-2] if len(histogram) > 1 else 0
         
         # Determinar sinal
         if current_macd > current_signal and current_histogram > 0:
@@ -208,17 +338,19 @@ class TechnicalIndicators:
                 "fast_period": fast_period,
                 "slow_period": slow_period,
                 "signal_period": signal_period,
-                "macd_series": macd_line.tolist(),
-                "signal_series": signal_line.tolist(),
-                "histogram_series": histogram.tolist()
+                "macd_series": macd_line,
+                "signal_series": signal_line,
+                "histogram_series": histogram
             }
         )
     
     @staticmethod
     def bollinger_bands(
-        prices: Union[List[float], pd.Series],
+        prices: Union[List[float], np.ndarray, pd.Series],
         period: int = 20,
-        std_dev: float = 2.0
+        std_dev: float = 2.0,
+        validate: bool = True,
+        return_last_only: bool = False
     ) -> IndicatorResult:
         """
         Calcula as Bollinger Bands.
@@ -227,26 +359,45 @@ class TechnicalIndicators:
             prices: Preços de fechamento
             period: Período para média móvel
             std_dev: Número de desvios padrão
+            validate: Se False, pula a verificação de nulos (dados já validados)
+            return_last_only: Calcula só a última janela, sem as séries no metadata
             
         Returns:
             Resultado das Bollinger Bands
         """
-        prices = TechnicalIndicators.validate_data(prices, period)
+        prices = TechnicalIndicators.validate_data(prices, period, validate)
         
-        # Calcular média móvel simples
-        sma = prices.rolling(window=period).mean()
-        
-        # Calcular desvio padrão
-        std = prices.rolling(window=period).std()
-        
-        # Calcular bandas
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        
-        current_price = prices.iloc[-1]
-        current_upper = upper_band.iloc[-1]
-        current_lower = lower_band.iloc[-1]
-        current_middle = sma.iloc[-1]
+        # Calcular média móvel simples e desvio padrão em uma passada
+        if return_last_only:
+            mean, std = last_mean_std(prices, period)
+            sma, std = np.array([mean]), np.array([std])
+        else:
+            sma, std = rolling_mean_std(prices, period)
+        
+        return TechnicalIndicators._bollinger_result(
+            prices,
+            sma,
+            std,
+            period,
+            std_dev,
+            include_series=not return_last_only
+        )
+    
+    @staticmethod
+    def _bollinger_result(
+        prices: np.ndarray,
+        sma: np.ndarray,
+        std: np.ndarray,
+        period: int,
+        std_dev: float,
+        include_series: bool = True
+    ) -> IndicatorResult:
+        """Monta as bandas a partir da média e do desvio e classifica o sinal."""
+        # Bandas atuais a partir dos escalares; as séries só entram no metadata
+        current_price = prices[-1]
+        current_middle = sma[-1]
+        current_upper = current_middle + std[-1] * std_dev
+        current_lower = current_middle - std[-1] * std_dev
         
         # Calcular posição do preço nas bandas (0 = banda inferior, 1 = banda superior)
         band_width = current_upper - current_lower
@@ -265,6 +416,16 @@ class TechnicalIndicators:
             distance_from_center = abs(price_position - 0.5)
             strength = distance_from_center * 2  # Normalizar para 0-1
         
+        metadata = {
+            "period": period,
+            "std_dev": std_dev,
+            "band_width": band_width
+        }
+        if include_series:
+            metadata["upper_series"] = sma + (std * std_dev)
+            metadata["middle_series"] = sma
+            metadata["lower_series"] = sma - (std * std_dev)
+        
         return IndicatorResult(
             value={
                 "upper": current_upper,
@@ -274,21 +435,15 @@ class TechnicalIndicators:
             },
             signal=signal,
             strength=strength,
-            metadata={
-                "period": period,
-                "std_dev": std_dev,
-                "band_width": band_width,
-                "upper_series": upper_band.tolist(),
-                "middle_series": sma.tolist(),
-                "lower_series": lower_band.tolist()
-            }
+            metadata=metadata
         )
     
     @staticmethod
     def moving_averages(
-        prices: Union[List[float], pd.Series],
+        prices: Union[List[float], np.ndarray, pd.Series],
         short_period: int = 10,
-        long_period: int = 50
+        long_period: int = 50,
+        validate: bool = True
     ) -> IndicatorResult:
         """
         Calcula médias móveis simples e determina crossover.
@@ -297,20 +452,36 @@ class TechnicalIndicators:
             prices: Preços de fechamento
             short_period: Período da média curta
             long_period: Período da média longa
+            validate: Se False, pula a verificação de nulos (dados já validados)
             
         Returns:
             Resultado das médias móveis
         """
-        prices = TechnicalIndicators.validate_data(prices, long_period)
+        prices = TechnicalIndicators.validate_data(prices, long_period, validate)
         
         # Calcular médias móveis
-        sma_short = prices.rolling(window=short_period).mean()
-        sma_long = prices.rolling(window=long_period).mean()
-        
-        current_short = sma_short.iloc[-1]
-        current_long = sma_long.iloc[-1]
-        previous_short = sma_short.iloc[-2] if len(sma_short) > 1 else current_short
-        previous_long = sma_long.iloc[-2] if len(sma_long) > 1 else current_long
+        sma_short = rolling_mean(prices, short_period)
+        sma_long = rolling_mean(prices, long_period)
+        
+        return TechnicalIndicators._moving_averages_result(
+            sma_short,
+            sma_long,
+            short_period,
+            long_period
+        )
+    
+    @staticmethod
+    def _moving_averages_result(
+        sma_short: np.ndarray,
+        sma_long: np.ndarray,
+        short_period: int,
+        long_period: int
+    ) -> IndicatorResult:
+        """Classifica o cruzamento das médias em sinal e força."""
+        current_short = sma_short[-1]
+        current_long = sma_long[-1]
+        previous_short = sma_short[-2] if len(sma_short) > 1 else current_short
+        previous_long = sma_long[-2] if len(sma_long) > 1 else current_long
         
         # Verificar crossover
         current_above = current_short > current_long
@@ -346,20 +517,77 @@ class TechnicalIndicators:
                 "long_period": long_period,
                 "crossover": current_above != previous_above,
                 "trend": "bullish" if current_above else "bearish",
-                "short_series": sma_short.tolist(),
-                "long_series": sma_long.tolist()
+                "short_series": sma_short,
+                "long_series": sma_long
             }
         )
     
+    @staticmethod
+    def close_indicators(
+        prices: Union[List[float], np.ndarray, pd.Series],
+        rsi_period: int = 14,
+        rsi_overbought: float = 70,
+        rsi_oversold: float = 30,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        bb_period: int = 20,
+        bb_std: float = 2.0,
+        ma_short: int = 10,
+        ma_long: int = 50,
+        validate: bool = True,
+        workspace: Optional[IndicatorWorkspace] = None
+    ) -> Dict[str, IndicatorResult]:
+        """
+        Calcula RSI, MACD, Bollinger Bands e médias móveis em uma passada.
+        
+        Equivale a chamar rsi, macd, bollinger_bands e moving_averages com
+        os mesmos parâmetros, mas o kernel compilado lê os fechamentos uma
+        única vez. Com um IndicatorWorkspace as séries são gravadas nos
+        buffers dele em vez de alocadas (ver IndicatorWorkspace).
+        
+        Returns:
+            Resultados indexados por 'rsi', 'macd', 'bollinger' e
+            'moving_averages'
+        """
+        min_periods = max(rsi_period + 1, macd_slow + macd_signal, bb_period, ma_long)
+        close = TechnicalIndicators.validate_data(prices, min_periods, validate)
+        
+        if workspace is not None:
+            out = workspace.rows(len(close))
+        else:
+            out = np.empty((7, len(close)), dtype=PRICE_DTYPE)
+        
+        rsi, macd_line, signal_line, bb_mean, bb_sd, sma_short, sma_long = fused_close_indicators(
+            close,
+            rsi_period,
+            macd_fast,
+            macd_slow,
+            macd_signal,
+            bb_period,
+            ma_short,
+            ma_long,
+            out
+        )
+        
+        return {
+            'rsi': TechnicalIndicators._rsi_result(rsi, rsi_period, rsi_overbought, rsi_oversold),
+            'macd': TechnicalIndicators._macd_result(macd_line, signal_line, macd_fast, macd_slow, macd_signal),
+            'bollinger': TechnicalIndicators._bollinger_result(close, bb_mean, bb_sd, bb_period, bb_std),
+            'moving_averages': TechnicalIndicators._moving_averages_result(sma_short, sma_long, ma_short, ma_long)
+        }
+    
     @staticmethod
     def stochastic_oscillator(
-        high_prices: Union[List[float], pd.Series],
-        low_prices: Union[List[float], pd.Series],
-        close_prices: Union[List[float], pd.Series],
+        high_prices: Union[List[float], np.ndarray, pd.Series],
+        low_prices: Union[List[float], np.ndarray, pd.Series],
+        close_prices: Union[List[float], np.ndarray, pd.Series],
         k_period: int = 14,
         d_period: int = 3,
         overbought: float = 80,
-        oversold: float = 20
+        oversold: float = 20,
+        validate: bool = True,
+        return_last_only: bool = False
     ) -> IndicatorResult:
         """
         Calcula o Oscilador Estocástico.
@@ -372,25 +600,54 @@ class TechnicalIndicators:
             d_period: Período para %D
             overbought: Nível de sobrecompra
             oversold: Nível de sobrevenda
+            validate: Se False, pula a verificação de nulos (dados já validados)
+            return_last_only: Calcula só o valor atual, sem as séries no metadata
             
         Returns:
             Resultado do Estocástico
         """
-        high_prices = TechnicalIndicators.validate_data(high_prices, k_period)
-        low_prices = TechnicalIndicators.validate_data(low_prices, k_period)
-        close_prices = TechnicalIndicators.validate_data(close_prices, k_period)
+        high_prices, low_prices, close_prices = TechnicalIndicators._validate_hlc(
+            high_prices, low_prices, close_prices, k_period, validate
+        )
+        
+        if return_last_only:
+            # O %D atual só depende das últimas d_period janelas de %K
+            tail = k_period + d_period - 1
+            high_prices, low_prices, close_prices = high_prices[-tail:], low_prices[-tail:], close_prices[-tail:]
         
         # Calcular %K
-        lowest_low = low_prices.rolling(window=k_period).min()
-        highest_high = high_prices.rolling(window=k_period).max()
+        lowest_low = rolling_min(low_prices, k_period)
+        highest_high = rolling_max(high_prices, k_period)
         
-        k_percent = 100 * (close_prices - lowest_low) / (highest_high - lowest_low)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_percent = 100 * (close_prices - lowest_low) / (highest_high - lowest_low)
         
         # Calcular %D (média móvel de %K)
-        d_percent = k_percent.rolling(window=d_period).mean()
-        
-        current_k = k_percent.iloc[-1]
-        current_d = d_percent.iloc[-1]
+        d_percent = rolling_mean(k_percent, d_period)
+        
+        return TechnicalIndicators._stochastic_result(
+            k_percent,
+            d_percent,
+            k_period,
+            d_period,
+            overbought,
+            oversold,
+            include_series=not return_last_only
+        )
+    
+    @staticmethod
+    def _stochastic_result(
+        k_percent: np.ndarray,
+        d_percent: np.ndarray,
+        k_period: int,
+        d_period: int,
+        overbought: float,
+        oversold: float,
+        include_series: bool = True
+    ) -> IndicatorResult:
+        """Classifica %K e %D em sinal e força."""
+        current_k = k_percent[-1]
+        current_d = d_percent[-1]
         
         # Determinar sinal
         if current_k >= overbought and current_d >= overbought:
@@ -406,6 +663,16 @@ class TechnicalIndicators:
             signal = SignalType.HOLD
             strength = 0.1
         
+        metadata = {
+            "k_period": k_period,
+            "d_period": d_period,
+            "overbought": overbought,
+            "oversold": oversold
+        }
+        if include_series:
+            metadata["k_series"] = k_percent
+            metadata["d_series"] = d_percent
+        
         return IndicatorResult(
             value={
                 "k_percent": current_k,
@@ -413,24 +680,19 @@ class TechnicalIndicators:
             },
             signal=signal,
             strength=strength,
-            metadata={
-                "k_period": k_period,
-                "d_period": d_period,
-                "overbought": overbought,
-                "oversold": oversold,
-                "k_series": k_percent.tolist(),
-                "d_series": d_percent.tolist()
-            }
+            metadata=metadata
         )
     
     @staticmethod
     def williams_r(
-        high_prices: Union[List[float], pd.Series],
-        low_prices: Union[List[float], pd.Series],
-        close_prices: Union[List[float], pd.Series],
+        high_prices: Union[List[float], np.ndarray, pd.Series],
+        low_prices: Union[List[float], np.ndarray, pd.Series],
+        close_prices: Union[List[float], np.ndarray, pd.Series],
         period: int = 14,
         overbought: float = -20,
-        oversold: float = -80
+        oversold: float = -80,
+        validate: bool = True,
+        return_last_only: bool = False
     ) -> IndicatorResult:
         """
         Calcula o Williams %R.
@@ -442,21 +704,48 @@ class TechnicalIndicators:
             period: Período para cálculo
             overbought: Nível de sobrecompra
             oversold: Nível de sobrevenda
+            validate: Se False, pula a verificação de nulos (dados já validados)
+            return_last_only: Calcula só o valor atual, sem a série no metadata
             
         Returns:
             Resultado do Williams %R
         """
-        high_prices = TechnicalIndicators.validate_data(high_prices, period)
-        low_prices = TechnicalIndicators.validate_data(low_prices, period)
-        close_prices = TechnicalIndicators.validate_data(close_prices, period)
-        
-        # Calcular Williams %R
-        highest_high = high_prices.rolling(window=period).max()
-        lowest_low = low_prices.rolling(window=period).min()
+        high_prices, low_prices, close_prices = TechnicalIndicators._validate_hlc(
+            high_prices, low_prices, close_prices, period, validate
+        )
         
-        williams_r = -100 * (highest_high - close_prices) / (highest_high - lowest_low)
+        if return_last_only:
+            # Apenas a última janela (np.max/np.min propagam nulos como as
+            # janelas móveis)
+            highest_high = np.max(high_prices[-period:], keepdims=True)
+            lowest_low = np.min(low_prices[-period:], keepdims=True)
+            close_prices = close_prices[-1:]
+        else:
+            highest_high = rolling_max(high_prices, period)
+            lowest_low = rolling_min(low_prices, period)
         
-        current_wr = williams_r.iloc[-1]
+        # Calcular Williams %R
+        with np.errstate(divide='ignore', invalid='ignore'):
+            williams_r = -100 * (highest_high - close_prices) / (highest_high - lowest_low)
+        
+        return TechnicalIndicators._williams_r_result(
+            williams_r,
+            period,
+            overbought,
+            oversold,
+            include_series=not return_last_only
+        )
+    
+    @staticmethod
+    def _williams_r_result(
+        williams_r: np.ndarray,
+        period: int,
+        overbought: float,
+        oversold: float,
+        include_series: bool = True
+    ) -> IndicatorResult:
+        """Classifica a série do Williams %R em sinal e força."""
+        current_wr = williams_r[-1]
         
         # Determinar sinal
         if current_wr >= overbought:
@@ -474,20 +763,160 @@ class TechnicalIndicators:
             )
             strength = 1.0 - (distance_to_extreme / 40.0)  # Normalizar para range de 80
         
+        metadata = {
+            "period": period,
+            "overbought": overbought,
+            "oversold": oversold
+        }
+        if include_series:
+            metadata["williams_r_series"] = williams_r
+        
         return IndicatorResult(
             value=current_wr,
             signal=signal,
             strength=strength,
-            metadata={
-                "period": period,
-                "overbought": overbought,
-                "oversold": oversold,
-                "williams_r_series": williams_r.tolist()
-            }
+            metadata=metadata
         )
     
     @staticmethod
-    def combine_signals(indicators: List[IndicatorResult], weights: Optional[List[float]] = None) -> IndicatorResult:
+    def high_low_indicators(
+        high_prices: Union[List[float], np.ndarray, pd.Series],
+        low_prices: Union[List[float], np.ndarray, pd.Series],
+        close_prices: Union[List[float], np.ndarray, pd.Series],
+        k_period: int = 14,
+        d_period: int = 3,
+        stoch_overbought: float = 80,
+        stoch_oversold: float = 20,
+        williams_overbought: float = -20,
+        williams_oversold: float = -80,
+        validate: bool = True
+    ) -> Dict[str, IndicatorResult]:
+        """
+        Calcula o Oscilador Estocástico e o Williams %R juntos.
+        
+        Equivale a chamar stochastic_oscillator e williams_r (este com
+        period=k_period), mas a máxima e a mínima móveis são calculadas uma
+        única vez e compartilhadas pelos dois.
+        
+        Returns:
+            Resultados indexados por 'stochastic' e 'williams_r'
+        """
+        high_prices, low_prices, close_prices = TechnicalIndicators._validate_hlc(
+            high_prices, low_prices, close_prices, k_period, validate
+        )
+        
+        highest_high = rolling_max(high_prices, k_period)
+        lowest_low = rolling_min(low_prices, k_period)
+        price_range = highest_high - lowest_low
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_percent = 100 * (close_prices - lowest_low) / price_range
+            williams_r = -100 * (highest_high - close_prices) / price_range
+        d_percent = rolling_mean(k_percent, d_period)
+        
+        return {
+            'stochastic': TechnicalIndicators._stochastic_result(
+                k_percent,
+                d_percent,
+                k_period,
+                d_period,
+                stoch_overbought,
+                stoch_oversold
+            ),
+            'williams_r': TechnicalIndicators._williams_r_result(
+                williams_r,
+                k_period,
+                williams_overbought,
+                williams_oversold
+            )
+        }
+    
+    @staticmethod
+    def compute_all(
+        close_prices: Union[List[float], np.ndarray, pd.Series],
+        high_prices: Optional[Union[List[float], np.ndarray, pd.Series]] = None,
+        low_prices: Optional[Union[List[float], np.ndarray, pd.Series]] = None,
+        rsi_period: int = 14,
+        rsi_overbought: float = 70,
+        rsi_oversold: float = 30,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        bb_period: int = 20,
+        bb_std: float = 2.0,
+        ma_short: int = 10,
+        ma_long: int = 50,
+        k_period: int = 14,
+        d_period: int = 3,
+        validate: bool = True,
+        workspace: Optional[IndicatorWorkspace] = None
+    ) -> Dict[str, IndicatorResult]:
+        """
+        Calcula todos os indicadores de uma série de preços.
+        
+        Os fechamentos são validados uma única vez e compartilhados pela
+        passada fundida (RSI, MACD, Bollinger Bands e médias móveis) e pela
+        passada de máximas/mínimas (Stochastic e Williams %R), que só é
+        feita quando high e low são informados.
+        
+        Returns:
+            Resultados indexados por 'rsi', 'macd', 'bollinger',
+            'moving_averages' e, com high/low, 'stochastic' e 'williams_r'
+        """
+        min_periods = max(rsi_period + 1, macd_slow + macd_signal, bb_period, ma_long)
+        close = TechnicalIndicators.validate_data(close_prices, min_periods, validate)
+        
+        results = TechnicalIndicators.close_indicators(
+            close,
+            rsi_period=rsi_period,
+            rsi_overbought=rsi_overbought,
+            rsi_oversold=rsi_oversold,
+            macd_fast=macd_fast,
+            macd_slow=macd_slow,
+            macd_signal=macd_signal,
+            bb_period=bb_period,
+            bb_std=bb_std,
+            ma_short=ma_short,
+            ma_long=ma_long,
+            validate=False,
+            workspace=workspace
+        )
+        
+        if high_prices is not None and low_prices is not None:
+            # Séries ausentes repassadas como o próprio fechamento mantêm a
+            # identidade do buffer validado
+            results.update(TechnicalIndicators.high_low_indicators(
+                close if high_prices is close_prices else high_prices,
+                close if low_prices is close_prices else low_prices,
+                close,
+                k_period=k_period,
+                d_period=d_period,
+                validate=validate
+            ))
+        
+        return results
+    
+    @staticmethod
+    def signal_arrays(indicators: List[IndicatorResult]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extrai sinais e forças dos indicadores em arrays paralelos.
+        
+        Args:
+            indicators: Lista de resultados de indicadores
+            
+        Returns:
+            Tupla com (códigos dos sinais em int8, forças em float64)
+        """
+        count = len(indicators)
+        codes = np.fromiter((SIGNAL_CODES[ind.signal] for ind in indicators), dtype=np.int8, count=count)
+        strengths = np.fromiter((ind.strength for ind in indicators), dtype=np.float64, count=count)
+        return codes, strengths
+    
+    @staticmethod
+    def combine_signals(
+        indicators: List[IndicatorResult],
+        weights: Optional[Union[List[float], np.ndarray]] = None
+    ) -> IndicatorResult:
         """
         Combina múltiplos sinais de indicadores em um sinal consolidado.
         
@@ -507,24 +936,15 @@ class TechnicalIndicators:
         if len(weights) != len(indicators):
             raise InvalidIndicatorException("combine_signals", "Weights length must match indicators length")
         
-        # Normalizar pesos
-        total_weight = sum(weights)
-        weights = [w / total_weight for w in weights]
+        # Normalizar pesos (conjuntos de pesos se repetem a cada chamada)
+        weights = _normalized_weights(tuple(map(float, weights)))
         
         # Calcular scores para cada tipo de sinal
-        buy_score = 0.0
-        sell_score = 0.0
-        hold_score = 0.0
-        
-        for indicator, weight in zip(indicators, weights):
-            weighted_strength = indicator.strength * weight
-            
-            if indicator.signal in [SignalType.BUY, SignalType.STRONG_BUY]:
-                buy_score += weighted_strength
-            elif indicator.signal in [SignalType.SELL, SignalType.STRONG_SELL]:
-                sell_score += weighted_strength
-            else:
-                hold_score += weighted_strength
+        codes, strengths = TechnicalIndicators.signal_arrays(indicators)
+        weighted = strengths * weights
+        buy_score = float(weighted[codes > 0].sum())
+        sell_score = float(weighted[codes < 0].sum())
+        hold_score = float(weighted[codes == 0].sum())
         
         # Determinar sinal final
         max_score = max(buy_score, sell_score, hold_score)
@@ -545,15 +965,38 @@ class TechnicalIndicators:
             signal=final_signal,
             strength=max_score,
             metadata={
-                "individual_signals": [
-                    {
-                        "signal": ind.signal.value,
-                        "strength": ind.strength,
-                        "weight": weight
-                    }
-                    for ind, weight in zip(indicators, weights)
-                ],
+                # Arrays paralelos; individual_signals() monta a lista de dicts
+                "signal_codes": codes,
+                "strengths": strengths,
                 "weights": weights
             }
         )
+    
+    @staticmethod
+    def individual_signals(combined: IndicatorResult) -> List[Dict[str, Any]]:
+        """
+        Lista os sinais individuais de um resultado de combine_signals.
+        
+        Destinado a logs e depuração; o caminho de decisão usa os arrays
+        guardados no metadata.
+        
+        Args:
+            combined: Resultado de combine_signals
+            
+        Returns:
+            Lista de dicts com signal, strength e weight de cada indicador
+        """
+        metadata = combined.metadata
+        return [
+            {
+                "signal": _SIGNAL_VALUES[code],
+                "strength": strength,
+                "weight": weight
+            }
+            for code, strength, weight in zip(
+                metadata["signal_codes"].tolist(),
+                metadata["strengths"].tolist(),
+                metadata["weights"].tolist()
+            )
+        ]
 
@@ -7,21 +7,44 @@ baseados em análise técnica de criptomoedas.
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..config.settings import get_settings
 from ..config.logging_config import get_logger, log_signal_generated, log_performance_metrics
-from ..core.coinbase_client import CoinbaseClient
+from ..core.coinbase_client import (
+    CANDLE_PRICE_FIELDS,
+    CoinbaseClient,
+    candles_to_arrays,
+    chronological_columns
+)
 from ..core.exceptions import CryptoBotsException, InsufficientDataException
 from .analyzers.trend_analyzer import TrendAnalyzer, TrendAnalysis
 from .notifiers.console_notifier import NotificationManager
 
 logger = get_logger(__name__)
 
+# Granularidade dos candles analisados e sua duração em segundos
+CANDLE_GRANULARITY = "ONE_MINUTE"
+CANDLE_SECONDS = 60
+
+# Folga após o fechamento do candle para a API refleti-lo
+CANDLE_CLOSE_GRACE = 1.0
+
+# Histórico de candles buscado a cada análise
+CANDLE_HISTORY = timedelta(hours=24)
+
+# Mínimo de candles para analisar um símbolo
+MIN_CANDLES = 100
 
-@dataclass
+# Linha separadora das notificações de início e encerramento
+NOTIFICATION_SEPARATOR = "━" * 40
+
+
+@dataclass(slots=True)
 class SignalResult:
     """Resultado de um sinal gerado."""
     symbol: str
@@ -51,14 +74,29 @@ class SignalBot:
         self.notification_manager = NotificationManager()
         
         # Configurações do bot
-        self.trading_pairs = self.settings.trading_pairs
+        self.trading_pairs = tuple(self.settings.trading_pairs)
         self.update_interval = self.settings.signal_update_interval
         self.min_volume_threshold = self.settings.min_volume_threshold
         self.signal_strength_threshold = self.settings.signal_strength_threshold
         
+        # Limita as buscas de candles simultâneas, evitando rajadas que
+        # esbarram no rate limit da API quando há muitos pares
+        self._api_semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
+        
+        # Análise incremental por símbolo e início do último candle incorporado
+        self._stream_analyzers: Dict[str, TrendAnalyzer] = {}
+        self._stream_last_start: Dict[str, int] = {}
+        
+        # Candles fechados já convertidos, por símbolo e início do bucket
+        # (na ordem de CANDLE_PRICE_FIELDS): não mudam entre ciclos
+        self._parsed_candles: Dict[str, Dict[int, Tuple[float, ...]]] = {}
+        
         # Estado interno
         self.is_running = False
         self.last_signals: Dict[str, SignalResult] = {}
+        # Resumo do último sinal por símbolo para a deduplicação:
+        # (valor do sinal, confiança, time.monotonic() do envio)
+        self._last_sig_meta: Dict[str, Tuple[str, float, float]] = {}
         self.performance_metrics: Dict[str, Any] = {
             "signals_generated": 0,
             "notifications_sent": 0,
@@ -96,12 +134,13 @@ class SignalBot:
             # Loop principal
             while self.is_running:
                 start_time = time.time()
+                loop_t0 = time.perf_counter()
                 
                 try:
                     await self._process_signals()
                     
                     # Métricas de performance
-                    processing_time = time.time() - start_time
+                    processing_time = time.perf_counter() - loop_t0
                     log_performance_metrics(
                         logger,
                         component="signal_bot",
@@ -112,7 +151,7 @@ class SignalBot:
                     
                 except Exception as e:
                     self.performance_metrics["errors"] += 1
-                    processing_time = time.time() - start_time
+                    processing_time = time.perf_counter() - loop_t0
                     
                     log_performance_metrics(
                         logger,
@@ -125,8 +164,8 @@ class SignalBot:
                     
                     logger.error("Error processing signals", error=str(e))
                 
-                # Aguardar próximo ciclo
-                await asyncio.sleep(self.update_interval)
+                # Aguardar o próximo fechamento de candle
+                await asyncio.sleep(self._seconds_until_next_cycle(start_time))
                 
         except KeyboardInterrupt:
             logger.info("Signal bot stopped by user")
@@ -137,6 +176,26 @@ class SignalBot:
             self.is_running = False
             await self._send_shutdown_notification()
     
+    def _seconds_until_next_cycle(self, cycle_start: float) -> float:
+        """
+        Calcula a espera até o próximo ciclo.
+        
+        Os ciclos acontecem logo após o fechamento de um candle, avançando
+        update_interval arredondado para candles inteiros (ao menos um):
+        candles fechados não mudam, então analisar entre dois fechamentos só
+        repetiria o resultado.
+        
+        Args:
+            cycle_start: Início do ciclo atual (time.time())
+            
+        Returns:
+            Segundos até o próximo ciclo
+        """
+        last_close = (cycle_start - CANDLE_CLOSE_GRACE) // CANDLE_SECONDS * CANDLE_SECONDS
+        candles_ahead = max(1, -(-self.update_interval // CANDLE_SECONDS))
+        next_cycle = last_close + candles_ahead * CANDLE_SECONDS + CANDLE_CLOSE_GRACE
+        return max(next_cycle - time.time(), 0.0)
+    
     async def stop(self) -> None:
         """Para o bot de sinais."""
         logger.info("Stopping signal bot")
@@ -144,19 +203,14 @@ class SignalBot:
     
     async def _process_signals(self) -> None:
         """Processa sinais para todos os pares de trading."""
-        tasks = []
-        
-        for symbol in self.trading_pairs:
-            task = asyncio.create_task(self._analyze_symbol(symbol))
-            tasks.append(task)
-        
-        # Executar análises em paralelo
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Executar análises em paralelo (gather agenda as corrotinas como tasks)
+        results = await asyncio.gather(
+            *(self._analyze_symbol(symbol) for symbol in self.trading_pairs),
+            return_exceptions=True
+        )
         
         # Processar resultados
-        for i, result in enumerate(results):
-            symbol = self.trading_pairs[i]
-            
+        for symbol, result in zip(self.trading_pairs, results):
             if isinstance(result, Exception):
                 logger.error(f"Error analyzing {symbol}", error=str(result))
                 continue
@@ -175,32 +229,50 @@ class SignalBot:
             Resultado do sinal ou None se não há sinal
         """
         try:
-            # Obter dados históricos
-            end_time = datetime.now()
-            start_time = end_time - timedelta(hours=24)  # Últimas 24 horas
+            # Obter dados históricos (um único relógio para todo o ciclo)
+            now = datetime.now()
+            end_time = now
+            start_time = now - CANDLE_HISTORY
+            
+            # O último candle fechado já foi incorporado: a análise daria o
+            # mesmo resultado, então nem os candles precisam ser buscados
+            if self._stream_last_start.get(symbol) == self._last_closed_start(now):
+                logger.debug(f"No new closed candle for {symbol}")
+                return None
+            
+            # O cliente é síncrono (e thread-safe); rodar em uma thread deixa
+            # o event loop livre para as buscas dos demais pares em paralelo
+            async with self._api_semaphore:
+                candles = await asyncio.to_thread(
+                    self.coinbase_client.get_product_candles,
+                    product_id=symbol,
+                    start=start_time,
+                    end=end_time,
+                    granularity=CANDLE_GRANULARITY
+                )
             
-            candles = self.coinbase_client.get_product_candles(
-                product_id=symbol,
-                start=start_time,
-                end=end_time,
-                granularity="ONE_MINUTE"
-            )
-            logger.debug(candles)
             # Verificar se há candles suficientes
-            if not candles or len(candles) < 100:
-                logger.warning(f"Insufficient data for {symbol}", candles_count=len(candles) if candles else 0)
+            candles_count = len(candles) if candles else 0
+            logger.debug(f"Fetched candles for {symbol}", candles_count=candles_count)
+            if candles_count < MIN_CANDLES:
+                logger.warning(f"Insufficient data for {symbol}", candles_count=candles_count)
                 return None
             
             # Converter dados para formato esperado
-            prices = self._convert_candles_to_prices(candles)
+            prices = self._convert_candles_to_prices(candles, symbol=symbol, now=now)
             
             # Verificar volume mínimo
-            if not self._check_volume_threshold(candles):
+            if not self._check_volume_threshold(prices['volume']):
                 logger.debug(f"Volume below threshold for {symbol}")
                 return None
             
-            # Executar análise
-            analysis = self.trend_analyzer.analyze(prices)
+            # Executar análise (apenas com os candles fechados desde o ciclo
+            # anterior) em uma thread: o aquecimento da partida a frio é
+            # CPU-bound e bloquearia as buscas dos demais pares
+            analysis = await asyncio.to_thread(self._analyze_incremental, symbol, prices, now)
+            if analysis is None:
+                logger.debug(f"No new closed candle for {symbol}")
+                return None
             
             # Verificar se o sinal atende aos critérios
             if analysis.confidence < self.signal_strength_threshold:
@@ -223,7 +295,7 @@ class SignalBot:
                 symbol=symbol,
                 analysis=analysis,
                 description=description,
-                timestamp=datetime.now()
+                timestamp=now
             )
             
             # Log do sinal gerado
@@ -253,54 +325,162 @@ class SignalBot:
             logger.error(f"Error analyzing {symbol}", error=str(e))
             return None
     
-    def _convert_candles_to_prices(self, candles: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+    def _analyze_incremental(
+        self,
+        symbol: str,
+        prices: Dict[str, np.ndarray],
+        now: datetime
+    ) -> Optional[TrendAnalysis]:
+        """
+        Atualiza a análise do símbolo com os candles fechados ainda não vistos.
+        
+        Cada símbolo tem um TrendAnalyzer em modo streaming: na primeira
+        chamada (ou se o último candle incorporado saiu da janela buscada)
+        o estado é aquecido com o histórico; depois, só os candles novos
+        são incorporados, em O(1) cada. O candle em formação fica de fora,
+        pois ainda muda até o fechamento do bucket.
+        
+        Args:
+            symbol: Par de trading
+            prices: Arrays de _convert_candles_to_prices
+            now: Instante do ciclo, usado também como timestamp da análise
+            
+        Returns:
+            Análise do último candle fechado, ou None se nenhum candle
+            fechou desde a chamada anterior
+            
+        Raises:
+            InsufficientDataException: Se ainda não há candles suficientes
+        """
+        starts = prices['start']
+        close = prices['close']
+        last_closed = self._last_closed_start(now)
+        closed_count = int(np.searchsorted(starts, last_closed, side='right'))
+        if closed_count == 0:
+            return None
+        
+        analyzer = self._stream_analyzers.get(symbol)
+        last_start = self._stream_last_start.get(symbol)
+        
+        if analyzer is None or last_start is None or last_start < starts[0]:
+            # Partida a frio: aquecer com todos os candles fechados menos o último
+            if analyzer is None:
+                analyzer = self._stream_analyzers[symbol] = TrendAnalyzer()
+            analyzer.start_stream({'close': close[:closed_count - 1]})
+            first_new = closed_count - 1
+        else:
+            first_new = int(np.searchsorted(starts, last_start, side='right'))
+            if first_new >= closed_count:
+                return None
+        
+        self._stream_last_start[symbol] = int(starts[closed_count - 1])
+        
+        for i in range(first_new, closed_count - 1):
+            analyzer.update_stream(float(close[i]))
+        
+        return analyzer.analyze_stream(float(close[closed_count - 1]), timestamp=now)
+    
+    @staticmethod
+    def _last_closed_start(now: datetime) -> int:
+        """Início do bucket do último candle fechado em now."""
+        return int(now.timestamp()) // CANDLE_SECONDS * CANDLE_SECONDS - CANDLE_SECONDS
+    
+    def _convert_candles_to_prices(
+        self,
+        candles: List[Dict[str, Any]],
+        symbol: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, np.ndarray]:
         """
         Converte dados de candles para formato de preços.
         
+        Com symbol e now, os candles fechados são convertidos uma única vez
+        e reaproveitados nos ciclos seguintes; só os novos e o candle em
+        formação passam por float() a cada chamada.
+        
         Args:
             candles: Lista de candles da API
+            symbol: Par de trading dono do cache de candles convertidos
+            now: Instante do ciclo, que define os candles já fechados
             
         Returns:
-            Dicionário com listas de preços
+            Dicionário com arrays float64 de preços e volume e o início
+            (int64) de cada candle, do mais antigo para o mais recente
         """
-        # Ordenar candles por timestamp (mais antigo primeiro)
-        sorted_candles = sorted(candles, key=lambda x: int(x.get('start', 0)))
-        
-        prices = {
-            'open': [],
-            'high': [],
-            'low': [],
-            'close': [],
-            'volume': []
-        }
+        if symbol is None or now is None:
+            columns = candles_to_arrays(candles)
+        else:
+            columns = self._parse_candles_cached(symbol, candles, self._last_closed_start(now))
         
-        for candle in sorted_candles:
-            prices['open'].append(float(candle.get('open', 0)))
-            prices['high'].append(float(candle.get('high', 0)))
-            prices['low'].append(float(candle.get('low', 0)))
-            prices['close'].append(float(candle.get('close', 0)))
-            prices['volume'].append(float(candle.get('volume', 0)))
+        return {
+            'start': columns['start'],
+            'open': columns['open'],
+            'high': columns['high'],
+            'low': columns['low'],
+            'close': columns['close'],
+            'volume': columns['volume']
+        }
+    
+    def _parse_candles_cached(
+        self,
+        symbol: str,
+        candles: List[Dict[str, Any]],
+        last_closed: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Converte candles em colunas reaproveitando os candles fechados já vistos.
         
-        return prices
+        Args:
+            symbol: Par de trading
+            candles: Lista de candles da API
+            last_closed: Início do último candle fechado
+            
+        Returns:
+            Colunas no formato de candles_to_arrays
+        """
+        cache = self._parsed_candles.setdefault(symbol, {})
+        count = len(candles)
+        starts = np.fromiter((int(c['start']) for c in candles), dtype=np.int64, count=count)
+        
+        rows = []
+        for candle, start in zip(candles, starts.tolist()):
+            row = cache.get(start)
+            if row is None:
+                row = tuple(float(candle[name]) for name in CANDLE_PRICE_FIELDS)
+                if start <= last_closed:
+                    cache[start] = row
+            rows.append(row)
+        
+        # Descartar candles que saíram da janela buscada
+        if len(cache) > count:
+            oldest = int(starts.min())
+            for start in [start for start in cache if start < oldest]:
+                del cache[start]
+        
+        # Transposta contígua: cada coluna vira uma linha contígua da tabela
+        table = np.array(rows, dtype=np.float64).reshape(count, len(CANDLE_PRICE_FIELDS))
+        table = np.ascontiguousarray(table.T)
+        columns = {"start": starts}
+        for i, name in enumerate(CANDLE_PRICE_FIELDS):
+            columns[name] = table[i]
+        return chronological_columns(columns)
     
-    def _check_volume_threshold(self, candles: List[Dict[str, Any]]) -> bool:
+    def _check_volume_threshold(self, volumes: np.ndarray) -> bool:
         """
         Verifica se o volume atende ao threshold mínimo.
         
         Args:
-            candles: Lista de candles
+            volumes: Volumes dos candles, já convertidos por
+                _convert_candles_to_prices
             
         Returns:
             True se o volume é suficiente
         """
-        if not candles:
+        if len(volumes) == 0:
             return False
         
         # Calcular volume médio das últimas 24 horas
-        total_volume = sum(float(candle.get('volume', 0)) for candle in candles)
-        avg_volume = total_volume / len(candles) if candles else 0
-        
-        return avg_volume >= self.min_volume_threshold
+        return float(np.mean(volumes)) >= self.min_volume_threshold
     
     def _is_new_signal(self, symbol: str, analysis: TrendAnalysis) -> bool:
         """
@@ -313,22 +493,22 @@ class SignalBot:
         Returns:
             True se é um novo sinal
         """
-        if symbol not in self.last_signals:
+        last_meta = self._last_sig_meta.get(symbol)
+        if last_meta is None:
             return True
         
-        last_signal = self.last_signals[symbol]
+        last_signal, last_confidence, last_time = last_meta
         
         # Verificar se mudou o tipo de sinal
-        if last_signal.analysis.signal != analysis.signal:
+        if last_signal != analysis.signal.value:
             return True
         
         # Verificar se passou tempo suficiente (evitar spam)
-        time_diff = datetime.now() - last_signal.timestamp
-        if time_diff.total_seconds() < 300:  # 5 minutos
+        if time.monotonic() - last_time < 300:  # 5 minutos
             return False
         
         # Verificar se a confiança aumentou significativamente
-        confidence_diff = analysis.confidence - last_signal.analysis.confidence
+        confidence_diff = analysis.confidence - last_confidence
         if confidence_diff > 0.2:  # 20% de aumento na confiança
             return True
         
@@ -347,6 +527,7 @@ class SignalBot:
         
         # Salvar último sinal
         self.last_signals[symbol] = signal_result
+        self._last_sig_meta[symbol] = (analysis.signal.value, analysis.confidence, time.monotonic())
         
         # Enviar notificação
         try:
@@ -366,13 +547,15 @@ class SignalBot:
     
     async def _send_startup_notification(self) -> None:
         """Envia notificação de inicialização."""
-        message = f"🤖 Bot de Sinais Iniciado\n"
-        message += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        message += f"📊 Pares monitorados: {', '.join(self.trading_pairs)}\n"
-        message += f"⏱️ Intervalo de atualização: {self.update_interval}s\n"
-        message += f"🎯 Threshold de confiança: {self.signal_strength_threshold * 100}%\n"
-        message += f"📈 Threshold de volume: {self.min_volume_threshold:,.0f}\n"
-        message += f"🕐 Iniciado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        message = (
+            f"🤖 Bot de Sinais Iniciado\n"
+            f"{NOTIFICATION_SEPARATOR}\n"
+            f"📊 Pares monitorados: {', '.join(self.trading_pairs)}\n"
+            f"⏱️ Intervalo de atualização: {self.update_interval}s\n"
+            f"🎯 Threshold de confiança: {self.signal_strength_threshold * 100}%\n"
+            f"📈 Threshold de volume: {self.min_volume_threshold:,.0f}\n"
+            f"🕐 Iniciado em: {datetime.now():%Y-%m-%d %H:%M:%S}"
+        )
         
         self.notification_manager.send_custom_notification(message)
     
@@ -380,13 +563,17 @@ class SignalBot:
         """Envia notificação de encerramento."""
         uptime = datetime.now() - self.performance_metrics["uptime_start"]
         
-        message = f"🛑 Bot de Sinais Encerrado\n"
-        message += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        message += f"⏱️ Tempo de execução: {str(uptime).split('.')[0]}\n"
-        message += f"📊 Sinais gerados: {self.performance_metrics['signals_generated']}\n"
-        message += f"📨 Notificações enviadas: {self.performance_metrics['notifications_sent']}\n"
-        message += f"❌ Erros: {self.performance_metrics['errors']}\n"
-        message += f"🕐 Encerrado em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        metrics = self.performance_metrics
+        
+        message = (
+            f"🛑 Bot de Sinais Encerrado\n"
+            f"{NOTIFICATION_SEPARATOR}\n"
+            f"⏱️ Tempo de execução: {str(uptime).split('.')[0]}\n"
+            f"📊 Sinais gerados: {metrics['signals_generated']}\n"
+            f"📨 Notificações enviadas: {metrics['notifications_sent']}\n"
+            f"❌ Erros: {metrics['errors']}\n"
+            f"🕐 Encerrado em: {datetime.now():%Y-%m-%d %H:%M:%S}"
+        )
         
         self.notification_manager.send_custom_notification(message)
     
@@ -402,7 +589,7 @@ class SignalBot:
         return {
             "is_running": self.is_running,
             "uptime": str(uptime).split('.')[0],
-            "trading_pairs": self.trading_pairs,
+            "trading_pairs": list(self.trading_pairs),
             "update_interval": self.update_interval,
             "performance_metrics": self.performance_metrics.copy(),
             "last_signals": {
@@ -0,0 +1,68 @@
+"""
+Kernel compilado das condições de saída de posições.
+
+Avalia stop-loss, take-profit, tempo máximo e trailing stop de todas as
+posições em um único laço sobre as colunas da tabela de posições, sem os
+arrays booleanos temporários de cada comparação.
+"""
+
+import numpy as np
+from numba import njit
+
+# Códigos de saída retornados por evaluate_exits (0 = manter a posição)
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_TRAILING_STOP = 3
+EXIT_MAX_HOLD = 4
+
+
+@njit(cache=True)
+def evaluate_exits(price, stop_loss, take_profit, side_buy, ts_ns, peak, valley,
+                   now_ns, max_hold_ns, trail_pct):
+    """
+    Retorna o código da condição de saída atingida por cada posição.
+    
+    Códigos, na ordem de prioridade de should_close_position: 0 nenhuma,
+    EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, EXIT_TRAILING_STOP e EXIT_MAX_HOLD.
+    
+    Stop-loss e take-profit ausentes são NaN e nunca disparam,
+    pois toda comparação com NaN é falsa; por isso o kernel não usa
+    fastmath, que supõe a ausência de NaN.
+    
+    Args:
+        price: Preços atuais
+        stop_loss: Stop-loss de cada posição (NaN se ausente)
+        take_profit: Take-profit de cada posição (NaN se ausente)
+        side_buy: True para posições compradas
+        ts_ns: Abertura em nanossegundos desde a época
+        peak: Maior preço observado (compras)
+        valley: Menor preço observado (vendas)
+        now_ns: Instante atual em nanossegundos
+        max_hold_ns: Tempo máximo de manutenção em nanossegundos
+        trail_pct: Distância do trailing stop em fração (0.02 = 2%)
+    
+    Returns:
+        Array int8 com o código da saída de cada posição (0 se nenhuma)
+    """
+    n = price.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        p = price[i]
+        if side_buy[i]:
+            stop_hit = p <= stop_loss[i]
+            take_hit = p >= take_profit[i]
+            trail_hit = p <= peak[i] * (1.0 - trail_pct)
+        else:
+            stop_hit = p >= stop_loss[i]
+            take_hit = p <= take_profit[i]
+            trail_hit = p >= valley[i] * (1.0 + trail_pct)
+        
+        if stop_hit:
+            out[i] = EXIT_STOP_LOSS
+        elif take_hit:
+            out[i] = EXIT_TAKE_PROFIT
+        elif trail_hit:
+            out[i] = EXIT_TRAILING_STOP
+        elif now_ns - ts_ns[i] >= max_hold_ns:
+            out[i] = EXIT_MAX_HOLD
+    return out
@@ -7,18 +7,21 @@ e implementa funcionalidades comuns.
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum
 
 from ...config.settings import get_settings
 from ...config.logging_config import get_logger
 from ...core.exceptions import TradingException, InvalidOrderException
-from ...signals.indicators.technical_indicators import SignalType
+from ...signals.indicators.technical_indicators import BUY_SIGNALS, SELL_SIGNALS, SignalType
 from ..risk_management.position_sizer import RiskManager, PositionSize
 
 logger = get_logger(__name__)
 
+# Confiança mínima aceita por validate_signal
+MIN_SIGNAL_CONFIDENCE = 0.6
+
 
 class OrderType(Enum):
     """Tipos de ordem."""
@@ -62,9 +65,24 @@ class TradeOrder:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+def _timestamp_to_ns(timestamp: Optional[datetime]) -> Optional[int]:
+    """Converte o horário de abertura em nanossegundos desde a época."""
+    return int(timestamp.timestamp() * 1_000_000_000) if timestamp else None
+
+
+@dataclass(slots=True)
 class Position:
-    """Posição aberta."""
+    """
+    Posição aberta.
+    
+    peak_price e valley_price (maior e menor preço desde a abertura, usados
+    por trailing stops) começam no preço de entrada se não informados.
+    side_is_buy é derivado de side na criação, para que as verificações
+    frequentes testem um bool em vez de comparar strings. timestamp_ns
+    (abertura em nanossegundos desde a época, None se sem horário) é
+    calculado na criação e a cada atribuição de timestamp, que é uma
+    property sobre o slot _timestamp.
+    """
     symbol: str
     side: str
     size: float
@@ -73,8 +91,40 @@ class Position:
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     unrealized_pnl: float = 0.0
-    timestamp: datetime = None
+    timestamp: InitVar[Optional[datetime]] = None
     order_id: Optional[str] = None
+    peak_price: Optional[float] = None
+    valley_price: Optional[float] = None
+    side_is_buy: bool = field(init=False)
+    _timestamp: Optional[datetime] = field(init=False, repr=False, default=None)
+    timestamp_ns: Optional[int] = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self, timestamp: Optional[datetime]):
+        self.side_is_buy = self.side == "buy"
+        if self.peak_price is None:
+            self.peak_price = self.entry_price
+        if self.valley_price is None:
+            self.valley_price = self.entry_price
+        self._timestamp = timestamp
+        self.timestamp_ns = _timestamp_to_ns(timestamp)
+
+
+def _get_position_timestamp(self: Position) -> Optional[datetime]:
+    return self._timestamp
+
+
+def _set_position_timestamp(self: Position, timestamp: Optional[datetime]) -> None:
+    self._timestamp = timestamp
+    self.timestamp_ns = _timestamp_to_ns(timestamp)
+
+
+# Definida fora do corpo da classe: lá, o nome timestamp é o InitVar do
+# __init__ (com seu valor padrão)
+Position.timestamp = property(
+    _get_position_timestamp,
+    _set_position_timestamp,
+    doc="Horário de abertura da posição (None se desconhecido)."
+)
 
 
 class BaseStrategy(ABC):
@@ -139,6 +189,55 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def analyze_signals(
+        self,
+        signals: List[TradingSignal],
+        market_data: Dict[str, Dict[str, Any]]
+    ) -> List[Optional[TradeOrder]]:
+        """
+        Analisa vários sinais (de símbolos diferentes) de uma vez.
+        
+        A implementação padrão chama analyze_signal sinal a sinal;
+        estratégias podem descartar em lote os que não passam nos filtros.
+        Um erro ao analisar um sinal resulta em None apenas para ele.
+        
+        Args:
+            signals: Sinais de trading
+            market_data: Dados de mercado por símbolo
+            
+        Returns:
+            Ordem (ou None) para cada sinal, na mesma ordem
+        """
+        orders: List[Optional[TradeOrder]] = []
+        for signal in signals:
+            try:
+                order = self.analyze_signal(signal, market_data.get(signal.symbol, {}))
+            except Exception as e:
+                logger.error(f"Error analyzing signal for {signal.symbol}", error=str(e))
+                order = None
+            orders.append(order)
+        return orders
+    
+    def positions_to_close(self, market_data: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Retorna as posições abertas que devem ser fechadas e o motivo.
+        
+        A implementação padrão consulta should_close_position posição a
+        posição e não distingue o motivo; estratégias podem avaliar todas
+        de uma vez.
+        
+        Args:
+            market_data: Dados de mercado por símbolo
+            
+        Returns:
+            Motivo do fechamento por símbolo das posições a fechar
+        """
+        return {
+            symbol: "strategy_exit"
+            for symbol, position in self.positions.items()
+            if self.should_close_position(position, market_data.get(symbol, {}))
+        }
+    
     def validate_signal(self, signal: TradingSignal) -> bool:
         """
         Valida se um sinal atende aos critérios da estratégia.
@@ -159,12 +258,11 @@ class BaseStrategy(ABC):
             return False
         
         # Verificar confiança mínima
-        min_confidence = 0.6  # 60% de confiança mínima
-        if signal.confidence < min_confidence:
+        if signal.confidence < MIN_SIGNAL_CONFIDENCE:
             logger.debug(
                 f"Signal confidence below threshold for {signal.symbol}",
                 confidence=signal.confidence,
-                threshold=min_confidence
+                threshold=MIN_SIGNAL_CONFIDENCE
             )
             return False
         
@@ -178,7 +276,8 @@ class BaseStrategy(ABC):
     def calculate_position_size(
         self,
         signal: TradingSignal,
-        account_balance: float
+        account_balance: float,
+        side: Optional[str] = None
     ) -> PositionSize:
         """
         Calcula o tamanho da posição baseado no sinal e gestão de risco.
@@ -186,23 +285,25 @@ class BaseStrategy(ABC):
         Args:
             signal: Sinal de trading
             account_balance: Saldo da conta
+            side: Lado da operação ("buy"/"sell"); derivado do sinal se omitido
             
         Returns:
             Tamanho da posição calculado
         """
+        if side is None:
+            side = "buy" if signal.signal_type in BUY_SIGNALS else "sell"
+        
         # Determinar preços
         entry_price = signal.entry_price
         stop_loss_price = signal.stop_loss
         
         # Se não há stop-loss no sinal, calcular um
         if not stop_loss_price:
-            side = "buy" if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY] else "sell"
             stop_loss_price = self.risk_manager.stop_loss_manager.calculate_fixed_stop_loss(
                 entry_price, side
             )
         
         # Calcular tamanho da posição
-        side = "buy" if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY] else "sell"
         position_size = self.risk_manager.position_sizer.calculate_position_size(
             account_balance=account_balance,
             entry_price=entry_price,
@@ -230,9 +331,9 @@ class BaseStrategy(ABC):
             Ordem de trade
         """
         # Determinar lado da ordem
-        if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY]:
+        if signal.signal_type in BUY_SIGNALS:
             side = OrderSide.BUY
-        elif signal.signal_type in [SignalType.SELL, SignalType.STRONG_SELL]:
+        elif signal.signal_type in SELL_SIGNALS:
             side = OrderSide.SELL
         else:
             raise InvalidOrderException(f"Invalid signal type for order: {signal.signal_type}")
@@ -301,7 +402,7 @@ class BaseStrategy(ABC):
         position = self.positions[symbol]
         
         # Calcular P&L
-        if position.side == "buy":
+        if position.side_is_buy:
             pnl = (exit_price - position.entry_price) * position.size
         else:  # sell
             pnl = (position.entry_price - exit_price) * position.size
@@ -351,7 +452,7 @@ class BaseStrategy(ABC):
             position.current_price = current_price
             
             # Calcular P&L não realizado
-            if position.side == "buy":
+            if position.side_is_buy:
                 position.unrealized_pnl = (current_price - position.entry_price) * position.size
             else:  # sell
                 position.unrealized_pnl = (position.entry_price - current_price) * position.size
@@ -4,17 +4,143 @@ Estratégia de Swing Trading.
 Esta estratégia implementa swing trading baseado em sinais de análise técnica,
 mantendo posições por períodos médios (dias a semanas) para capturar
 movimentos de tendência.
+
+Desempenho: a verificação de saídas (should_close_position) roda uma vez
+por posição a cada ciclo e faz apenas comparações escalares. O custo está
+no overhead do interpretador (despacho de métodos, lookups de atributos e
+dicts, datetime.now() por chamada), não em cálculo. Por isso o caminho
+preferido para muitas posições é avaliar todas de uma vez sobre colunas
+NumPy (estrutura de arrays), com o laço das condições compilado com Numba,
+como nos kernels de indicadores; a verificação escalar fica para consultas
+de uma única posição.
 """
 
-from typing import Dict, Optional, Any
-from datetime import datetime, timedelta
+import time
+from typing import Dict, List, Optional, Any
+
+import numpy as np
 
 from ...config.logging_config import get_logger
-from ...signals.indicators.technical_indicators import SignalType
-from .base_strategy import BaseStrategy, TradingSignal, TradeOrder, Position, OrderType, OrderSide
+from ...signals.indicators.technical_indicators import BUY_SIGNALS, SignalType
+from ._exits_jit import (
+    EXIT_MAX_HOLD, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, EXIT_TRAILING_STOP, evaluate_exits
+)
+from .base_strategy import (
+    MIN_SIGNAL_CONFIDENCE, BaseStrategy, TradingSignal, TradeOrder, Position, OrderType, OrderSide
+)
 
 logger = get_logger(__name__)
 
+# Sinais aceitos diretamente e sinais que exigem confiança maior
+_STRONG_SIGNALS = frozenset({SignalType.STRONG_BUY, SignalType.STRONG_SELL})
+_MEDIUM_SIGNALS = frozenset({SignalType.BUY, SignalType.SELL})
+
+# Distância percentual do trailing stop ao pico (compra) ou vale (venda)
+_TRAILING_STOP_PERCENTAGE = 2.0
+_TRAILING_BUY_FACTOR = 1 - _TRAILING_STOP_PERCENTAGE / 100
+_TRAILING_SELL_FACTOR = 1 + _TRAILING_STOP_PERCENTAGE / 100
+
+_NANOSECONDS_PER_DAY = 86_400 * 1_000_000_000
+
+# Timestamp de posições sem horário de abertura: nunca atinge o tempo máximo
+_NO_TIMESTAMP = np.iinfo(np.int64).max
+
+# Motivo de fechamento por código de saída (mesmas mensagens de
+# should_close_position); a reversão de tendência é avaliada fora do kernel
+_TREND_REVERSAL = "Trend reversal detected"
+_EXIT_REASONS = {
+    EXIT_STOP_LOSS: "Stop-loss triggered",
+    EXIT_TAKE_PROFIT: "Take-profit triggered",
+    EXIT_TRAILING_STOP: "Trailing stop triggered",
+    EXIT_MAX_HOLD: "Max hold time reached",
+}
+
+
+class _PositionTable:
+    """
+    Posições abertas em colunas NumPy, uma linha por símbolo.
+    
+    As linhas são cópias dos campos de Position: a estratégia as regrava
+    a partir das posições antes de cada avaliação, para que alterações
+    feitas diretamente na Position (stop-loss, take-profit, horário de
+    abertura) sejam consideradas. Stop-loss e take-profit ausentes ficam
+    como NaN (toda comparação com NaN é falsa). Remoções movem a última
+    linha para a posição liberada, mantendo as colunas contíguas; a
+    capacidade dobra quando as linhas acabam.
+    """
+    
+    __slots__ = (
+        "symbols", "_rows", "price", "stop_loss", "take_profit",
+        "side_buy", "peak", "valley", "ts_ns"
+    )
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Inicializa a tabela vazia.
+        
+        Args:
+            capacity: Número inicial de linhas alocadas
+        """
+        self.symbols: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.price = np.empty(capacity, dtype=np.float64)
+        self.stop_loss = np.empty(capacity, dtype=np.float64)
+        self.take_profit = np.empty(capacity, dtype=np.float64)
+        self.side_buy = np.empty(capacity, dtype=np.bool_)
+        self.peak = np.empty(capacity, dtype=np.float64)
+        self.valley = np.empty(capacity, dtype=np.float64)
+        self.ts_ns = np.empty(capacity, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def _grow(self) -> None:
+        capacity = 2 * len(self.price)
+        for name in ("price", "stop_loss", "take_profit", "side_buy", "peak", "valley", "ts_ns"):
+            setattr(self, name, np.resize(getattr(self, name), capacity))
+    
+    def add(self, position: Position) -> None:
+        """Adiciona (ou substitui) a linha do símbolo da posição."""
+        row = self._rows.get(position.symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self.price):
+                self._grow()
+            self._rows[position.symbol] = row
+            self.symbols.append(position.symbol)
+        
+        self.price[row] = position.current_price
+        self.stop_loss[row] = position.stop_loss or np.nan
+        self.take_profit[row] = position.take_profit or np.nan
+        self.side_buy[row] = position.side_is_buy
+        self.peak[row] = position.peak_price
+        self.valley[row] = position.valley_price
+        timestamp_ns = position.timestamp_ns
+        self.ts_ns[row] = _NO_TIMESTAMP if timestamp_ns is None else timestamp_ns
+    
+    def remove(self, symbol: str) -> None:
+        """Remove a linha do símbolo, se existir."""
+        row = self._rows.pop(symbol, None)
+        if row is None:
+            return
+        
+        last = len(self.symbols) - 1
+        if row != last:
+            moved = self.symbols[last]
+            self.symbols[row] = moved
+            self._rows[moved] = row
+            for column in (
+                self.price, self.stop_loss, self.take_profit,
+                self.side_buy, self.peak, self.valley, self.ts_ns
+            ):
+                column[row] = column[last]
+        self.symbols.pop()
+    
+    def refresh(self, positions: Dict[str, Position]) -> None:
+        """Regrava as linhas de todas as posições com os valores atuais."""
+        for position in positions.values():
+            self.add(position)
+
 
 class SwingTradingStrategy(BaseStrategy):
     """
@@ -37,11 +163,15 @@ class SwingTradingStrategy(BaseStrategy):
         self.stop_loss_percentage = 3.0  # Stop-loss mais amplo
         self.take_profit_ratio = 2.5     # Relação risco/recompensa
         self.max_hold_days = 14          # Máximo de dias para manter posição
+        self.max_hold_ns = self.max_hold_days * _NANOSECONDS_PER_DAY
         
         # Filtros de mercado
         self.min_volume_threshold = 1000000  # Volume mínimo
         self.avoid_news_hours = True         # Evitar horários de notícias
         
+        # Posições em colunas para a avaliação de saídas em lote
+        self._position_table = _PositionTable()
+        
         logger.info(
             "Swing trading strategy initialized",
             min_signal_strength=self.min_signal_strength,
@@ -50,13 +180,21 @@ class SwingTradingStrategy(BaseStrategy):
             take_profit_ratio=self.take_profit_ratio
         )
     
-    def analyze_signal(self, signal: TradingSignal, market_data: Dict[str, Any]) -> Optional[TradeOrder]:
+    def analyze_signal(
+        self,
+        signal: TradingSignal,
+        market_data: Dict[str, Any],
+        *,
+        market_conditions: Optional[str] = None
+    ) -> Optional[TradeOrder]:
         """
         Analisa um sinal para swing trading.
         
         Args:
             signal: Sinal de trading
             market_data: Dados de mercado atuais
+            market_conditions: Condições de mercado já classificadas (por
+                analyze_signals); avaliadas aqui se omitidas
             
         Returns:
             Ordem de trade ou None
@@ -72,23 +210,46 @@ class SwingTradingStrategy(BaseStrategy):
         if not self._validate_swing_signal(signal, market_data):
             return None
         
+        return self._create_swing_order(signal, market_data, market_conditions)
+    
+    def _create_swing_order(
+        self,
+        signal: TradingSignal,
+        market_data: Dict[str, Any],
+        market_conditions: Optional[str] = None
+    ) -> Optional[TradeOrder]:
+        """
+        Cria a ordem de um sinal que já passou nas validações.
+        
+        Args:
+            signal: Sinal de trading validado
+            market_data: Dados de mercado atuais
+            market_conditions: Condições de mercado já classificadas;
+                avaliadas aqui se omitidas
+            
+        Returns:
+            Ordem de trade ou None
+        """
         # Verificar se deve operar baseado no tipo de sinal
         if not self._should_enter_position(signal, market_data):
             return None
         
+        # Lado da operação, derivado uma única vez para todo o fluxo
+        side = "buy" if signal.signal_type in BUY_SIGNALS else "sell"
+        
         try:
             # Obter saldo da conta (simulado para teste)
             account_balance = market_data.get('account_balance', 10000.0)
             
             # Calcular tamanho da posição
-            position_size = self.calculate_position_size(signal, account_balance)
+            position_size = self.calculate_position_size(signal, account_balance, side)
             
             # Validar trade com gestão de risco
             can_trade, reason = self.risk_manager.validate_trade(
                 account_balance=account_balance,
                 entry_price=signal.entry_price,
                 position_size=position_size.base_size,
-                side="buy" if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY] else "sell"
+                side=side
             )
             
             if not can_trade:
@@ -96,8 +257,8 @@ class SwingTradingStrategy(BaseStrategy):
                 return None
             
             # Ajustar stop-loss e take-profit para swing trading
-            stop_loss = self._calculate_swing_stop_loss(signal)
-            take_profit = self._calculate_swing_take_profit(signal, stop_loss)
+            stop_loss = self._calculate_swing_stop_loss(signal, side)
+            take_profit = self._calculate_swing_take_profit(signal, stop_loss, side)
             
             # Atualizar sinal com novos valores
             signal.stop_loss = stop_loss
@@ -114,7 +275,10 @@ class SwingTradingStrategy(BaseStrategy):
             order.metadata.update({
                 "strategy_type": "swing_trading",
                 "expected_hold_days": self._estimate_hold_period(signal),
-                "market_conditions": self._assess_market_conditions(market_data)
+                "market_conditions": (
+                    market_conditions if market_conditions is not None
+                    else self._assess_market_conditions(market_data)
+                )
             })
             
             logger.info(
@@ -133,45 +297,212 @@ class SwingTradingStrategy(BaseStrategy):
             logger.error(f"Error creating swing trading order: {e}")
             return None
     
-    def should_close_position(self, position: Position, market_data: Dict[str, Any]) -> bool:
+    def analyze_signals(
+        self,
+        signals: List[TradingSignal],
+        market_data: Dict[str, Dict[str, Any]]
+    ) -> List[Optional[TradeOrder]]:
+        """
+        Analisa vários sinais, descartando em lote os que não passam nos filtros.
+        
+        Os critérios de validate_signal e _validate_swing_signal (força,
+        confiança, volume, tipo HOLD e posição já aberta) são aplicados a
+        todos os sinais de uma vez com máscaras NumPy; os sobreviventes
+        seguem direto para a gestão de risco e criação da ordem, sem repetir
+        as validações. Um erro em um sinal resulta em None apenas para ele.
+        
+        Args:
+            signals: Sinais de trading
+            market_data: Dados de mercado por símbolo
+            
+        Returns:
+            Ordem (ou None) para cada sinal, na mesma ordem
+        """
+        orders: List[Optional[TradeOrder]] = [None] * len(signals)
+        if not signals or not self.is_active:
+            return orders
+        
+        count = len(signals)
+        strengths = np.fromiter((s.strength for s in signals), dtype=np.float64, count=count)
+        confidences = np.fromiter((s.confidence for s in signals), dtype=np.float64, count=count)
+        volumes = np.fromiter(
+            (market_data.get(s.symbol, {}).get('volume', 0) for s in signals),
+            dtype=np.float64,
+            count=count
+        )
+        volatilities = np.fromiter(
+            (market_data.get(s.symbol, {}).get('volatility', 0.02) for s in signals),
+            dtype=np.float64,
+            count=count
+        )
+        not_hold = np.fromiter(
+            (s.signal_type is not SignalType.HOLD for s in signals),
+            dtype=np.bool_,
+            count=count
+        )
+        no_position = np.fromiter(
+            (s.symbol not in self.positions for s in signals),
+            dtype=np.bool_,
+            count=count
+        )
+        
+        # Limites mais restritivos entre validate_signal e _validate_swing_signal
+        min_strength = max(self.min_signal_strength, self.settings.signal_strength_threshold)
+        min_confidence = max(self.min_confidence, MIN_SIGNAL_CONFIDENCE)
+        keep = (
+            (strengths >= min_strength)
+            & (confidences >= min_confidence)
+            & (volumes >= self.min_volume_threshold)
+            & not_hold
+            & no_position
+        )
+        
+        survivors = np.flatnonzero(keep)
+        conditions = self._classify_market_conditions(volatilities[survivors], volumes[survivors])
+        
+        for i, condition in zip(survivors.tolist(), conditions.tolist()):
+            signal = signals[i]
+            try:
+                orders[i] = self._create_swing_order(
+                    signal,
+                    market_data.get(signal.symbol, {}),
+                    condition
+                )
+            except Exception as e:
+                logger.error(f"Error analyzing signal for {signal.symbol}", error=str(e))
+        return orders
+    
+    def should_close_position(
+        self,
+        position: Position,
+        market_data: Dict[str, Any],
+        now_ns: Optional[int] = None
+    ) -> bool:
         """
         Decide se uma posição de swing trading deve ser fechada.
         
         Args:
             position: Posição atual
             market_data: Dados de mercado atuais
+            now_ns: Instante atual em nanossegundos (padrão: time.time_ns());
+                quem verifica várias posições lê o relógio uma vez e repassa
             
         Returns:
             True se deve fechar a posição
         """
-        current_price = position.current_price
+        price = position.current_price
+        stop_loss = position.stop_loss
+        take_profit = position.take_profit
+        
+        # Condições em ordem de custo, parando na primeira atingida:
+        # comparações de preço (stop-loss, take-profit, trailing stop),
+        # tempo de manutenção e, por último, a tendência (lookup em dict).
+        # Stop-loss/take-profit ausentes (None ou 0) não disparam
+        if position.side_is_buy:
+            reason = (
+                (stop_loss and price <= stop_loss and "Stop-loss triggered")
+                or (take_profit and price >= take_profit and "Take-profit triggered")
+                or (price <= position.peak_price * _TRAILING_BUY_FACTOR and "Trailing stop triggered")
+            )
+            reversal_trend = "bearish"
+        else:  # sell
+            reason = (
+                (stop_loss and price >= stop_loss and "Stop-loss triggered")
+                or (take_profit and price <= take_profit and "Take-profit triggered")
+                or (price >= position.valley_price * _TRAILING_SELL_FACTOR and "Trailing stop triggered")
+            )
+            reversal_trend = "bullish"
+        
+        if not reason:
+            timestamp_ns = position.timestamp_ns
+            if timestamp_ns is not None:
+                if now_ns is None:
+                    now_ns = time.time_ns()
+                if now_ns - timestamp_ns >= self.max_hold_ns:
+                    reason = "Max hold time reached"
+            
+            if not reason and market_data.get('trend', 'sideways') == reversal_trend:
+                reason = "Trend reversal detected"
         
-        # Verificar stop-loss
-        if self._check_stop_loss(position, current_price):
-            logger.info(f"Stop-loss triggered for {position.symbol}")
+        if reason:
+            logger.info(f"{reason} for {position.symbol}")
             return True
         
-        # Verificar take-profit
-        if self._check_take_profit(position, current_price):
-            logger.info(f"Take-profit triggered for {position.symbol}")
-            return True
+        return False
+    
+    def positions_to_close(
+        self,
+        market_data: Dict[str, Dict[str, Any]],
+        now_ns: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Avalia as saídas de todas as posições abertas de uma vez.
         
-        # Verificar tempo máximo de manutenção
-        if self._check_max_hold_time(position):
-            logger.info(f"Max hold time reached for {position.symbol}")
-            return True
+        Aplica as mesmas condições de should_close_position sobre as colunas
+        da tabela de posições, em vez de uma chamada por posição. A tabela é
+        atualizada a partir das posições antes da avaliação.
         
-        # Verificar reversão de tendência
-        if self._check_trend_reversal(position, market_data):
-            logger.info(f"Trend reversal detected for {position.symbol}")
-            return True
+        Args:
+            market_data: Dados de mercado por símbolo
+            now_ns: Instante atual em nanossegundos (padrão: time.time_ns())
+            
+        Returns:
+            Motivo do fechamento por símbolo das posições que devem ser fechadas
+        """
+        table = self._position_table
+        table.refresh(self.positions)
+        n = len(table)
+        if n == 0:
+            return {}
+        
+        if now_ns is None:
+            now_ns = time.time_ns()
+        
+        exits = self._evaluate_exits_vectorized(now_ns)
+        
+        # Reversão de tendência: a tendência vem dos dados de mercado; como
+        # em should_close_position, é o último motivo considerado
+        trends = np.array([
+            market_data.get(symbol, {}).get('trend', 'sideways')
+            for symbol in table.symbols
+        ])
+        reversal = np.where(table.side_buy[:n], trends == "bearish", trends == "bullish")
+        
+        to_close = {}
+        for i in np.flatnonzero(exits | reversal):
+            symbol = table.symbols[i]
+            reason = _EXIT_REASONS.get(int(exits[i]), _TREND_REVERSAL)
+            logger.info(f"{reason} for {symbol}")
+            to_close[symbol] = reason
+        return to_close
+    
+    def _evaluate_exits_vectorized(self, now_ns: int) -> np.ndarray:
+        """
+        Avalia stop-loss, take-profit, tempo máximo e trailing stop em lote.
         
-        # Verificar trailing stop
-        if self._check_trailing_stop(position, current_price):
-            logger.info(f"Trailing stop triggered for {position.symbol}")
-            return True
+        As condições rodam no kernel compilado evaluate_exits, em um único
+        laço sobre as colunas.
         
-        return False
+        Args:
+            now_ns: Instante atual em nanossegundos
+            
+        Returns:
+            Código de saída por linha da tabela (0 se nenhuma condição)
+        """
+        table = self._position_table
+        n = len(table)
+        return evaluate_exits(
+            table.price[:n],
+            table.stop_loss[:n],
+            table.take_profit[:n],
+            table.side_buy[:n],
+            table.ts_ns[:n],
+            table.peak[:n],
+            table.valley[:n],
+            now_ns,
+            self.max_hold_ns,
+            _TRAILING_STOP_PERCENTAGE / 100
+        )
     
     def _validate_swing_signal(self, signal: TradingSignal, market_data: Dict[str, Any]) -> bool:
         """
@@ -218,28 +549,27 @@ class SwingTradingStrategy(BaseStrategy):
             True se deve entrar na posição
         """
         # Para swing trading, preferir sinais fortes
-        strong_signals = [SignalType.STRONG_BUY, SignalType.STRONG_SELL]
-        medium_signals = [SignalType.BUY, SignalType.SELL]
-        
-        if signal.signal_type in strong_signals:
+        if signal.signal_type in _STRONG_SIGNALS:
             return True
-        elif signal.signal_type in medium_signals:
+        elif signal.signal_type in _MEDIUM_SIGNALS:
             # Para sinais médios, exigir confiança maior
             return signal.confidence >= 0.75
         
         return False
     
-    def _calculate_swing_stop_loss(self, signal: TradingSignal) -> float:
+    def _calculate_swing_stop_loss(self, signal: TradingSignal, side: Optional[str] = None) -> float:
         """
         Calcula stop-loss específico para swing trading.
         
         Args:
             signal: Sinal de trading
+            side: Lado da operação ("buy"/"sell"); derivado do sinal se omitido
             
         Returns:
             Preço de stop-loss
         """
-        side = "buy" if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY] else "sell"
+        if side is None:
+            side = "buy" if signal.signal_type in BUY_SIGNALS else "sell"
         
         return self.risk_manager.stop_loss_manager.calculate_fixed_stop_loss(
             entry_price=signal.entry_price,
@@ -247,18 +577,25 @@ class SwingTradingStrategy(BaseStrategy):
             stop_loss_percentage=self.stop_loss_percentage
         )
     
-    def _calculate_swing_take_profit(self, signal: TradingSignal, stop_loss: float) -> float:
+    def _calculate_swing_take_profit(
+        self,
+        signal: TradingSignal,
+        stop_loss: float,
+        side: Optional[str] = None
+    ) -> float:
         """
         Calcula take-profit específico para swing trading.
         
         Args:
             signal: Sinal de trading
             stop_loss: Preço de stop-loss
+            side: Lado da operação ("buy"/"sell"); derivado do sinal se omitido
             
         Returns:
             Preço de take-profit
         """
-        side = "buy" if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY] else "sell"
+        if side is None:
+            side = "buy" if signal.signal_type in BUY_SIGNALS else "sell"
         
         return self.risk_manager.take_profit_manager.calculate_risk_reward_take_profit(
             entry_price=signal.entry_price,
@@ -295,93 +632,57 @@ class SwingTradingStrategy(BaseStrategy):
         Returns:
             Descrição das condições
         """
-        volatility = market_data.get('volatility', 0.02)
-        volume = market_data.get('volume', 0)
-        
-        if volatility > 0.05:
-            return "high_volatility"
-        elif volatility < 0.01:
-            return "low_volatility"
-        elif volume > self.min_volume_threshold * 2:
-            return "high_volume"
-        else:
-            return "normal"
-    
-    def _check_stop_loss(self, position: Position, current_price: float) -> bool:
-        """Verifica se o stop-loss foi atingido."""
-        if not position.stop_loss:
-            return False
-        
-        if position.side == "buy":
-            return current_price <= position.stop_loss
-        else:  # sell
-            return current_price >= position.stop_loss
-    
-    def _check_take_profit(self, position: Position, current_price: float) -> bool:
-        """Verifica se o take-profit foi atingido."""
-        if not position.take_profit:
-            return False
-        
-        if position.side == "buy":
-            return current_price >= position.take_profit
-        else:  # sell
-            return current_price <= position.take_profit
-    
-    def _check_max_hold_time(self, position: Position) -> bool:
-        """Verifica se o tempo máximo de manutenção foi atingido."""
-        if not position.timestamp:
-            return False
-        
-        hold_time = datetime.now() - position.timestamp
-        return hold_time.days >= self.max_hold_days
+        conditions = self._classify_market_conditions(
+            np.array([market_data.get('volatility', 0.02)], dtype=np.float64),
+            np.array([market_data.get('volume', 0)], dtype=np.float64)
+        )
+        return str(conditions[0])
     
-    def _check_trend_reversal(self, position: Position, market_data: Dict[str, Any]) -> bool:
+    def _classify_market_conditions(self, volatilities: np.ndarray, volumes: np.ndarray) -> np.ndarray:
         """
-        Verifica se houve reversão de tendência.
+        Classifica as condições de mercado de vários símbolos de uma vez.
+        
+        A primeira condição verdadeira vence, na ordem: alta volatilidade,
+        baixa volatilidade, volume alto; as demais são "normal".
         
         Args:
-            position: Posição atual
-            market_data: Dados de mercado
+            volatilities: Volatilidade de cada símbolo
+            volumes: Volume de cada símbolo
             
         Returns:
-            True se houve reversão
+            Array de rótulos, um por símbolo
         """
-        # Implementação simplificada - em produção usaria indicadores técnicos
-        trend = market_data.get('trend', 'sideways')
-        
-        if position.side == "buy" and trend == "bearish":
-            return True
-        elif position.side == "sell" and trend == "bullish":
-            return True
+        return np.select(
+            [volatilities > 0.05, volatilities < 0.01, volumes > self.min_volume_threshold * 2],
+            ["high_volatility", "low_volatility", "high_volume"],
+            default="normal"
+        )
+    
+    def add_position(self, position: Position) -> None:
+        """
+        Adiciona uma nova posição, também na tabela de posições.
         
-        return False
+        Args:
+            position: Posição a ser adicionada
+        """
+        super().add_position(position)
+        self._position_table.add(position)
     
-    def _check_trailing_stop(self, position: Position, current_price: float) -> bool:
+    def remove_position(self, symbol: str, exit_price: float, reason: str = "manual") -> Optional[float]:
         """
-        Verifica trailing stop para swing trading.
+        Remove uma posição, também da tabela de posições.
         
         Args:
-            position: Posição atual
-            current_price: Preço atual
+            symbol: Símbolo da posição
+            exit_price: Preço de saída
+            reason: Motivo do fechamento
             
         Returns:
-            True se trailing stop foi atingido
+            P&L da posição ou None se não encontrada
         """
-        # Implementação simplificada de trailing stop
-        trailing_percentage = 2.0  # 2% trailing stop
-        
-        if position.side == "buy":
-            # Para posições compradas, verificar se o preço caiu muito do pico
-            if hasattr(position, 'peak_price'):
-                trailing_stop = position.peak_price * (1 - trailing_percentage / 100)
-                return current_price <= trailing_stop
-        else:  # sell
-            # Para posições vendidas, verificar se o preço subiu muito do vale
-            if hasattr(position, 'valley_price'):
-                trailing_stop = position.valley_price * (1 + trailing_percentage / 100)
-                return current_price >= trailing_stop
-        
-        return False
+        pnl = super().remove_position(symbol, exit_price, reason)
+        self._position_table.remove(symbol)
+        return pnl
     
     def update_position_price(self, symbol: str, current_price: float) -> None:
         """
@@ -397,10 +698,8 @@ class SwingTradingStrategy(BaseStrategy):
             position = self.positions[symbol]
             
             # Atualizar picos e vales para trailing stop
-            if position.side == "buy":
-                if not hasattr(position, 'peak_price') or current_price > position.peak_price:
-                    position.peak_price = current_price
+            if position.side_is_buy:
+                position.peak_price = max(position.peak_price, current_price)
             else:  # sell
-                if not hasattr(position, 'valley_price') or current_price < position.valley_price:
-                    position.valley_price = current_price
+                position.valley_price = min(position.valley_price, current_price)
 
@@ -225,16 +225,14 @@ class TradingBot:
     async def _check_position_exits(self) -> None:
         """Verifica se alguma posição deve ser fechada."""
         positions_to_close = []
+        closing = set()
         
-        for symbol, position in self.portfolio_manager.positions.items():
-            market_data = self.market_data_cache.get(symbol, {})
-            
-            # Verificar cada estratégia
-            for strategy_name, strategy in self.strategies.items():
-                if symbol in strategy.positions:
-                    if strategy.should_close_position(position, market_data):
-                        positions_to_close.append((symbol, strategy_name, "strategy_exit"))
-                        break
+        # Cada estratégia avalia todas as suas posições de uma vez
+        for strategy_name, strategy in self.strategies.items():
+            for symbol, reason in strategy.positions_to_close(self.market_data_cache).items():
+                if symbol in self.portfolio_manager.positions and symbol not in closing:
+                    closing.add(symbol)
+                    positions_to_close.append((symbol, strategy_name, reason))
         
         # Fechar posições identificadas
         for symbol, strategy_name, reason in positions_to_close:
@@ -242,6 +240,8 @@ class TradingBot:
     
     async def _process_new_signals(self) -> None:
         """Processa novos sinais de trading."""
+        new_signals = []
+        
         for symbol in self.trading_pairs:
             try:
                 # Obter sinal do bot de sinais
@@ -254,12 +254,14 @@ class TradingBot:
                     if trading_signal:
                         self.last_signals[symbol] = trading_signal
                         self.performance_metrics["last_signal_time"] = datetime.now()
-                        
-                        # Processar sinal com estratégias
-                        await self._process_signal_with_strategies(trading_signal)
+                        new_signals.append(trading_signal)
                 
             except Exception as e:
                 logger.error(f"Error processing signals for {symbol}", error=str(e))
+        
+        # Processar os sinais do ciclo com as estratégias, em lote
+        if new_signals:
+            await self._process_signals_with_strategies(new_signals)
     
     def _convert_to_trading_signal(self, symbol: str, signal_result: Dict[str, Any]) -> Optional[TradingSignal]:
         """
@@ -321,17 +323,31 @@ class TradingBot:
         Args:
             signal: Sinal de trading
         """
-        market_data = self.market_data_cache.get(signal.symbol, {})
+        await self._process_signals_with_strategies([signal])
+    
+    async def _process_signals_with_strategies(self, signals: List[TradingSignal]) -> None:
+        """
+        Processa sinais de vários símbolos com todas as estratégias ativas.
         
+        Args:
+            signals: Sinais de trading
+        """
         for strategy_name, strategy in self.strategies.items():
             if not strategy.is_active:
                 continue
             
             try:
-                # Analisar sinal com a estratégia
-                order = strategy.analyze_signal(signal, market_data)
+                # Analisar os sinais com a estratégia
+                orders = strategy.analyze_signals(signals, self.market_data_cache)
+            except Exception as e:
+                logger.error(f"Error processing signals with strategy {strategy_name}", error=str(e))
+                continue
+            
+            for signal, order in zip(signals, orders):
+                if not order:
+                    continue
                 
-                if order:
+                try:
                     # Adicionar ordem às pendentes
                     order_id = f"{strategy_name}_{signal.symbol}_{datetime.now().timestamp()}"
                     order.client_order_id = order_id
@@ -345,9 +361,11 @@ class TradingBot:
                         size=order.size,
                         order_type=order.order_type.value
                     )
-                
-            except Exception as e:
-                logger.error(f"Error processing signal with strategy {strategy_name}", error=str(e))
+                except Exception as e:
+                    logger.error(
+                        f"Error registering order for {signal.symbol} with strategy {strategy_name}",
+                        error=str(e)
+                    )
     
     async def _execute_pending_orders(self) -> None:
         """Executa ordens pendentes."""
@@ -0,0 +1,8 @@
+"""
+Testes do projeto Crypto Bots.
+"""
+
+import os
+
+# Testes não gravam o cache de candles em disco, a menos que pedido
+os.environ.setdefault("ENABLE_CANDLE_DISK_CACHE", "false")
@@ -0,0 +1,188 @@
+"""
+Testes unitários para a busca paginada e o cache de candles do cliente Coinbase.
+
+O cliente REST é substituído por uma API falsa que serve candles sintéticos,
+permitindo verificar quais janelas são de fato requisitadas.
+"""
+
+import unittest
+import tempfile
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Adicionar diretório raiz ao path
+root_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(root_dir))
+
+from src.core.coinbase_client import CoinbaseClient, MAX_CANDLES_PER_REQUEST
+from src.data.candle_store import CandleStore
+
+INTERVAL = 60
+# 2024-01-01 00:00 UTC, alinhado ao dia e ao minuto
+BASE_TS = 1704067200
+
+
+def make_candle(start: int) -> dict:
+    """Candle sintético no formato da API (valores como string)."""
+    price = 100 + (start - BASE_TS) // INTERVAL
+    return {
+        'start': str(start),
+        'low': str(price - 1),
+        'high': str(price + 1),
+        'open': str(price),
+        'close': str(price + 0.5),
+        'volume': '10'
+    }
+
+
+class FakeCandleApi:
+    """API falsa: registra as janelas pedidas e responde do mais recente ao mais antigo."""
+    
+    def __init__(self, overlap: bool = False):
+        self.calls = []
+        self.overlap = overlap
+        self.empty = False
+    
+    def __call__(self, endpoint, params=None):
+        start, end = params['start'], params['end']
+        self.calls.append((start, end))
+        if self.empty:
+            return {'candles': []}
+        
+        # Com overlap, cada janela repete o primeiro candle da janela seguinte
+        last = end + INTERVAL if self.overlap else end
+        first = -(-start // INTERVAL) * INTERVAL
+        candles = [make_candle(t) for t in range(first, last + 1, INTERVAL)]
+        return {'candles': candles[::-1]}
+
+
+class TestCandleRangeRequests(unittest.TestCase):
+    """Testes para _request_candle_range, _fetch_candle_range e _get_cached_candles."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.client = CoinbaseClient(api_key="test_key", api_secret="test_secret")
+        self.client._candle_store = None
+        self.api = FakeCandleApi()
+        patcher = patch.object(self.client, '_get', side_effect=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+    
+    def assert_newest_first(self, candles, first, last):
+        """Verifica ordem decrescente, sem duplicatas, cobrindo [first, last]."""
+        starts = [int(candle['start']) for candle in candles]
+        self.assertEqual(starts, list(range(last, first - 1, -INTERVAL)))
+    
+    def test_exactly_max_candles_is_one_request(self):
+        """Testa se 350 candles cabem em uma única requisição."""
+        end = BASE_TS + (MAX_CANDLES_PER_REQUEST - 1) * INTERVAL
+        candles = self.client._request_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end)
+        
+        self.assertEqual(self.api.calls, [(BASE_TS, end)])
+        self.assertEqual(len(candles), MAX_CANDLES_PER_REQUEST)
+        self.assert_newest_first(candles, BASE_TS, end)
+    
+    def test_one_over_max_candles_splits_window(self):
+        """Testa se 351 candles são divididos em duas janelas contíguas."""
+        end = BASE_TS + MAX_CANDLES_PER_REQUEST * INTERVAL
+        candles = self.client._request_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end)
+        
+        split = BASE_TS + MAX_CANDLES_PER_REQUEST * INTERVAL
+        self.assertEqual(sorted(self.api.calls), [(BASE_TS, split - 1), (split, end)])
+        self.assertEqual(len(candles), MAX_CANDLES_PER_REQUEST + 1)
+        self.assert_newest_first(candles, BASE_TS, end)
+    
+    def test_duplicate_starts_are_merged(self):
+        """Testa se candles repetidos entre janelas aparecem uma única vez."""
+        self.api.overlap = True
+        end = BASE_TS + (3 * MAX_CANDLES_PER_REQUEST - 1) * INTERVAL
+        candles = self.client._request_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end)
+        
+        self.assertEqual(len(self.api.calls), 3)
+        # A última janela também repete o candle seguinte ao período
+        self.assert_newest_first(candles, BASE_TS, end + INTERVAL)
+    
+    def test_memory_cache_fetches_only_the_gap(self):
+        """Testa se uma segunda consulta estendida busca apenas o trecho novo."""
+        end = BASE_TS + 99 * INTERVAL
+        first = self.client._get_cached_candles("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end)
+        self.assert_newest_first(first, BASE_TS, end)
+        self.assertEqual(self.api.calls, [(BASE_TS, end)])
+        
+        self.api.calls.clear()
+        extended_end = end + 50 * INTERVAL
+        candles = self.client._get_cached_candles("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, extended_end)
+        
+        self.assertEqual(self.api.calls, [(end + INTERVAL, extended_end)])
+        self.assert_newest_first(candles, BASE_TS, extended_end)
+    
+    def test_memory_cache_ignores_empty_response(self):
+        """Testa se uma resposta vazia não esconde o trecho nas consultas seguintes."""
+        end = BASE_TS + 99 * INTERVAL
+        self.api.empty = True
+        self.assertEqual(
+            self.client._get_cached_candles("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end),
+            []
+        )
+        
+        self.api.empty = False
+        self.api.calls.clear()
+        candles = self.client._get_cached_candles("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end)
+        
+        self.assertEqual(self.api.calls, [(BASE_TS, end)])
+        self.assert_newest_first(candles, BASE_TS, end)
+    
+    def test_disk_cache_fetches_only_missing_ranges(self):
+        """Testa se o cache em disco evita buscar de novo trechos já gravados."""
+        store = CandleStore(self.tmp.name)
+        self.client._candle_store = store
+        last_closed = BASE_TS + 10_000 * INTERVAL
+        
+        end = BASE_TS + 99 * INTERVAL
+        self.client._fetch_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end, last_closed)
+        self.assertEqual(self.api.calls, [(BASE_TS, end)])
+        
+        # Período parcialmente coberto: só a parte nova vai à API
+        self.api.calls.clear()
+        start = BASE_TS + 50 * INTERVAL
+        extended_end = end + 100 * INTERVAL
+        candles = self.client._fetch_candle_range(
+            "BTC-USD", "ONE_MINUTE", INTERVAL, start, extended_end, last_closed
+        )
+        
+        self.assertEqual(self.api.calls, [(end + INTERVAL, extended_end)])
+        self.assert_newest_first(candles, start, extended_end)
+        self.assertEqual(
+            store.missing_ranges("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, extended_end),
+            []
+        )
+    
+    def test_empty_response_is_not_marked_as_covered(self):
+        """Testa se uma resposta vazia não marca o trecho como coberto."""
+        store = CandleStore(self.tmp.name)
+        self.client._candle_store = store
+        last_closed = BASE_TS + 10_000 * INTERVAL
+        end = BASE_TS + 9 * INTERVAL
+        
+        self.api.empty = True
+        candles = self.client._fetch_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end, last_closed)
+        self.assertEqual(candles, [])
+        self.assertEqual(
+            store.missing_ranges("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end),
+            [(BASE_TS, end)]
+        )
+        
+        # A consulta seguinte volta a buscar o trecho na API
+        self.api.empty = False
+        self.api.calls.clear()
+        candles = self.client._fetch_candle_range("BTC-USD", "ONE_MINUTE", INTERVAL, BASE_TS, end, last_closed)
+        self.assertEqual(self.api.calls, [(BASE_TS, end)])
+        self.assert_newest_first(candles, BASE_TS, end)
+
+
+if __name__ == '__main__':
+    unittest.main()
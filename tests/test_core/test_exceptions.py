@@ -0,0 +1,92 @@
+"""
+Testes unitários para as exceções do projeto.
+
+As exceções guardam os atributos em __slots__, que o pickle padrão de
+exceções ignora; os testes garantem que sobrevivem à serialização (ex.:
+ao cruzar processos de um ProcessPoolExecutor).
+"""
+
+import unittest
+import pickle
+import sys
+from pathlib import Path
+
+# Adicionar diretório raiz ao path
+root_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(root_dir))
+
+from src.core.exceptions import (
+    CoinbaseAPIException, PositionNotFoundException, RateLimitException
+)
+
+
+def round_trip(exc):
+    return pickle.loads(pickle.dumps(exc))
+
+
+class TestExceptionPickling(unittest.TestCase):
+    """Testes de serialização das exceções."""
+    
+    def test_rate_limit_exception_with_retry_after(self):
+        """Testa o round-trip de RateLimitException com retry_after."""
+        restored = round_trip(RateLimitException(retry_after=7))
+        
+        self.assertIs(type(restored), RateLimitException)
+        self.assertEqual(restored.retry_after, 7)
+        self.assertEqual(restored.status_code, 429)
+        self.assertEqual(restored.response_data, {"retry_after": 7})
+        self.assertIsNone(restored.endpoint)
+        self.assertEqual(restored.message, "Rate limit exceeded. Retry after 7 seconds")
+        self.assertEqual(str(restored), restored.message)
+        self.assertEqual(
+            dict(restored.details),
+            {"status_code": 429, "response_data": {"retry_after": 7}, "endpoint": None}
+        )
+    
+    def test_rate_limit_exception_without_retry_after(self):
+        """Testa o round-trip de RateLimitException sem retry_after (dados compartilhados)."""
+        restored = round_trip(RateLimitException())
+        
+        self.assertIsNone(restored.retry_after)
+        self.assertEqual(restored.response_data, {"retry_after": None})
+        self.assertEqual(restored.details["response_data"], {"retry_after": None})
+        self.assertEqual(str(restored), "Rate limit exceeded")
+    
+    def test_coinbase_api_exception(self):
+        """Testa o round-trip de CoinbaseAPIException com todos os campos."""
+        exc = CoinbaseAPIException(
+            "Server error",
+            status_code=503,
+            response_data={"error": "unavailable"},
+            endpoint="/api/v3/brokerage/accounts"
+        )
+        restored = round_trip(exc)
+        
+        self.assertIs(type(restored), CoinbaseAPIException)
+        self.assertEqual(restored.message, "Server error")
+        self.assertEqual(restored.status_code, 503)
+        self.assertEqual(restored.response_data, {"error": "unavailable"})
+        self.assertEqual(restored.endpoint, "/api/v3/brokerage/accounts")
+        self.assertEqual(dict(restored.details), dict(exc.details))
+        self.assertEqual(restored.args, exc.args)
+    
+    def test_coinbase_api_exception_without_details(self):
+        """Testa o round-trip de CoinbaseAPIException só com a mensagem."""
+        restored = round_trip(CoinbaseAPIException("Unexpected"))
+        
+        self.assertIsNone(restored.status_code)
+        self.assertEqual(dict(restored.response_data), {})
+        self.assertEqual(dict(restored.details), {})
+    
+    def test_position_not_found_exception(self):
+        """Testa o round-trip de PositionNotFoundException."""
+        restored = round_trip(PositionNotFoundException("BTC-USD"))
+        
+        self.assertIs(type(restored), PositionNotFoundException)
+        self.assertEqual(restored.message, "Position not found: BTC-USD")
+        self.assertEqual(dict(restored.details), {"position_id": "BTC-USD"})
+        self.assertEqual(str(restored), "Position not found: BTC-USD")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Testes unitários para o rate limiter.
+
+O relógio do módulo é substituído por um relógio falso, que avança apenas
+quando o rate limiter dorme ou quando o teste o adianta.
+"""
+
+import unittest
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Adicionar diretório raiz ao path
+root_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(root_dir))
+
+from src.core.rate_limiter import RateLimiter
+from src.core.exceptions import RateLimitException
+
+
+class FakeClock:
+    """Relógio controlado pelo teste (substitui o módulo time)."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def time(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Testes para RateLimiter."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.clock = FakeClock()
+        
+        async def fake_async_sleep(seconds):
+            self.clock.advance(seconds)
+        
+        for target, fake in (
+            ('src.core.rate_limiter.time', self.clock),
+            ('src.core.rate_limiter.asyncio', SimpleNamespace(sleep=fake_async_sleep)),
+        ):
+            patcher = patch(target, new=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def make_limiter(self, rps=2.0, rpm=1000.0, rph=100000.0, burst=0):
+        return RateLimiter(
+            requests_per_second=rps,
+            requests_per_minute=rpm,
+            requests_per_hour=rph,
+            burst_allowance=burst
+        )
+    
+    def test_tokens_refill_over_time(self):
+        """Testa se os tokens são repostos continuamente."""
+        limiter = self.make_limiter(rps=2.0)
+        limiter.acquire()
+        limiter.acquire()
+        
+        self.assertFalse(limiter.can_make_request())
+        self.assertAlmostEqual(limiter.wait_if_needed(), 0.5)
+        
+        self.clock.advance(0.25)
+        self.assertFalse(limiter.can_make_request())
+        self.assertAlmostEqual(limiter.wait_if_needed(), 0.25)
+        
+        self.clock.advance(0.25)
+        self.assertTrue(limiter.can_make_request())
+        self.assertIsNone(limiter.wait_if_needed())
+    
+    def test_most_restrictive_bucket_wins(self):
+        """Testa se o limite por minuto prevalece sobre o por segundo."""
+        limiter = self.make_limiter(rps=10.0, rpm=3.0)
+        for _ in range(3):
+            limiter.acquire()
+        
+        # O balde de um segundo ainda tem tokens, mas o de um minuto não
+        self.assertFalse(limiter.can_make_request())
+        self.assertAlmostEqual(limiter.wait_if_needed(), 20.0)
+        
+        # acquire espera pelo balde mais restritivo
+        start = self.clock.now
+        self.assertTrue(limiter.acquire())
+        self.assertAlmostEqual(self.clock.now - start, 20.0)
+        self.assertEqual(limiter.request_count, 4)
+    
+    def test_acquire_timeout_raises(self):
+        """Testa se acquire levanta RateLimitException ao esgotar o timeout."""
+        limiter = self.make_limiter(rps=1.0)
+        limiter.acquire()
+        
+        start = self.clock.now
+        with self.assertRaises(RateLimitException):
+            limiter.acquire(timeout=0.3)
+        self.assertAlmostEqual(self.clock.now - start, 0.3)
+        self.assertEqual(limiter.request_count, 1)
+        
+        # Com tempo suficiente, a permissão é concedida
+        self.assertTrue(limiter.acquire(timeout=1.0))
+        self.assertEqual(limiter.request_count, 2)
+    
+    def test_acquire_async_timeout_raises(self):
+        """Testa se acquire_async respeita o timeout como acquire."""
+        limiter = self.make_limiter(rps=1.0)
+        limiter.acquire()
+        
+        with self.assertRaises(RateLimitException):
+            asyncio.run(limiter.acquire_async(timeout=0.3))
+        self.assertTrue(asyncio.run(limiter.acquire_async(timeout=1.0)))
+    
+    def test_burst_allowance_adds_capacity(self):
+        """Testa se burst_allowance permite uma rajada acima do limite por segundo."""
+        limiter = self.make_limiter(rps=2.0, burst=3)
+        for _ in range(5):
+            self.assertTrue(limiter.can_make_request())
+            limiter.acquire()
+        self.assertFalse(limiter.can_make_request())
+        
+        # A reposição continua no ritmo do limite por segundo
+        self.assertAlmostEqual(limiter.wait_if_needed(), 0.5)
+        self.clock.advance(10.0)
+        for _ in range(5):
+            limiter.acquire()
+        self.assertFalse(limiter.can_make_request())
+    
+    def test_burst_allowance_respects_longer_windows(self):
+        """Testa se a rajada não ultrapassa o limite por minuto."""
+        limiter = self.make_limiter(rps=2.0, rpm=4.0, burst=3)
+        for _ in range(4):
+            limiter.acquire()
+        self.assertFalse(limiter.can_make_request())
+
+
+if __name__ == '__main__':
+    unittest.main()
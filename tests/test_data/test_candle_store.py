@@ -0,0 +1,119 @@
+"""
+Testes unitários para o cache de candles em disco.
+"""
+
+import unittest
+import tempfile
+import sys
+from pathlib import Path
+
+# Adicionar diretório raiz ao path
+root_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(root_dir))
+
+from src.data.candle_store import CandleStore, SECONDS_PER_DAY
+
+INTERVAL = 3600
+# 2024-01-01 00:00 UTC
+BASE_TS = 1704067200
+
+
+def make_candles(first: int, last: int) -> list:
+    """Candles sintéticos no formato da API, do mais recente ao mais antigo."""
+    return [
+        {
+            'start': str(t),
+            'low': '99.5',
+            'high': '101.5',
+            'open': '100',
+            'close': str(100 + (t - BASE_TS) // INTERVAL),
+            'volume': '12.5'
+        }
+        for t in range(last, first - 1, -INTERVAL)
+    ]
+
+
+class TestCandleStore(unittest.TestCase):
+    """Testes para CandleStore."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = CandleStore(self.tmp.name)
+    
+    def test_round_trip_across_days(self):
+        """Testa se os candles gravados são lidos de volta, em vários arquivos diários."""
+        end = BASE_TS + 2 * SECONDS_PER_DAY + 5 * INTERVAL
+        candles = make_candles(BASE_TS, end)
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, BASE_TS, end, candles)
+        
+        series_dir = Path(self.tmp.name) / "BTC-USD" / "ONE_HOUR"
+        self.assertEqual(len(list(series_dir.glob("*.parquet"))), 3)
+        
+        stored = self.store.read("BTC-USD", "ONE_HOUR", BASE_TS, end)
+        self.assertEqual(stored, {int(candle['start']): candle for candle in candles})
+        
+        # Leitura parcial respeita os limites pedidos
+        partial = self.store.read("BTC-USD", "ONE_HOUR", BASE_TS + INTERVAL, BASE_TS + 3 * INTERVAL)
+        self.assertEqual(sorted(partial), [BASE_TS + i * INTERVAL for i in (1, 2, 3)])
+    
+    def test_rewrite_keeps_existing_candles(self):
+        """Testa se gravar um trecho novo no mesmo dia preserva os candles anteriores."""
+        middle = BASE_TS + 5 * INTERVAL
+        end = BASE_TS + 10 * INTERVAL
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, BASE_TS, middle, make_candles(BASE_TS, middle))
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, middle + INTERVAL, end,
+                         make_candles(middle + INTERVAL, end))
+        
+        stored = self.store.read("BTC-USD", "ONE_HOUR", BASE_TS, end)
+        self.assertEqual(sorted(stored), list(range(BASE_TS, end + 1, INTERVAL)))
+    
+    def test_coverage_merging(self):
+        """Testa se intervalos adjacentes são mesclados e lacunas reportadas."""
+        def at(hour):
+            return BASE_TS + hour * INTERVAL
+        
+        self.assertEqual(
+            self.store.missing_ranges("BTC-USD", "ONE_HOUR", INTERVAL, at(0), at(20)),
+            [(at(0), at(20))]
+        )
+        
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, at(0), at(4), make_candles(at(0), at(4)))
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, at(10), at(14), make_candles(at(10), at(14)))
+        self.assertEqual(
+            self.store.missing_ranges("BTC-USD", "ONE_HOUR", INTERVAL, at(0), at(20)),
+            [(at(5), at(9)), (at(15), at(20))]
+        )
+        
+        # Trecho adjacente a ambos une as duas coberturas
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, at(5), at(9), make_candles(at(5), at(9)))
+        self.assertEqual(
+            self.store.missing_ranges("BTC-USD", "ONE_HOUR", INTERVAL, at(0), at(20)),
+            [(at(15), at(20))]
+        )
+        self.assertEqual(
+            self.store.missing_ranges("BTC-USD", "ONE_HOUR", INTERVAL, at(2), at(12)),
+            []
+        )
+        
+        # Início fora do alinhamento é arredondado para o próximo bucket
+        self.assertEqual(
+            self.store.missing_ranges("BTC-USD", "ONE_HOUR", INTERVAL, at(14) + 1, at(16)),
+            [(at(15), at(16))]
+        )
+    
+    def test_series_are_independent(self):
+        """Testa se produtos e granularidades diferentes não compartilham cobertura."""
+        end = BASE_TS + 3 * INTERVAL
+        self.store.write("BTC-USD", "ONE_HOUR", INTERVAL, BASE_TS, end, make_candles(BASE_TS, end))
+        
+        self.assertEqual(
+            self.store.missing_ranges("ETH-USD", "ONE_HOUR", INTERVAL, BASE_TS, end),
+            [(BASE_TS, end)]
+        )
+        self.assertEqual(self.store.read("BTC-USD", "SIX_HOUR", BASE_TS, end), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,11 +7,14 @@ completo dos bots de sinais e trading.
 
 import unittest
 import asyncio
+import time
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Adicionar diretório raiz ao path
 root_dir = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(root_dir))
@@ -83,16 +86,12 @@ class TestSignalBotIntegration(unittest.TestCase):
     def test_check_volume_threshold(self):
         """Testa verificação de threshold de volume."""
         # Volume alto - deve passar
-        high_volume_candles = [
-            {'volume': '2000000'} for _ in range(10)
-        ]
-        self.assertTrue(self.signal_bot._check_volume_threshold(high_volume_candles))
+        high_volumes = np.full(10, 2000000.0)
+        self.assertTrue(self.signal_bot._check_volume_threshold(high_volumes))
         
         # Volume baixo - não deve passar
-        low_volume_candles = [
-            {'volume': '100'} for _ in range(10)
-        ]
-        self.assertFalse(self.signal_bot._check_volume_threshold(low_volume_candles))
+        low_volumes = np.full(10, 100.0)
+        self.assertFalse(self.signal_bot._check_volume_threshold(low_volumes))
     
     def test_is_new_signal(self):
         """Testa verificação de novo sinal."""
@@ -107,20 +106,17 @@ class TestSignalBotIntegration(unittest.TestCase):
         self.assertTrue(self.signal_bot._is_new_signal("BTC-USD", analysis))
         
         # Adicionar sinal ao histórico
-        from src.signals.signal_bot import SignalResult
-        signal_result = SignalResult(
-            symbol="BTC-USD",
-            analysis=analysis,
-            description={},
-            timestamp=datetime.now()
+        self.signal_bot._last_sig_meta["BTC-USD"] = (
+            analysis.signal.value, analysis.confidence, time.monotonic()
         )
-        self.signal_bot.last_signals["BTC-USD"] = signal_result
         
         # Mesmo sinal muito recente - não deve ser novo
         self.assertFalse(self.signal_bot._is_new_signal("BTC-USD", analysis))
         
         # Sinal antigo - deve ser novo
-        signal_result.timestamp = datetime.now() - timedelta(minutes=10)
+        self.signal_bot._last_sig_meta["BTC-USD"] = (
+            analysis.signal.value, analysis.confidence, time.monotonic() - 600
+        )
         self.assertTrue(self.signal_bot._is_new_signal("BTC-USD", analysis))
     
     def test_get_status(self):
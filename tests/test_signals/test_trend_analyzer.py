@@ -0,0 +1,93 @@
+"""
+Testes unitários para o analisador de tendências.
+
+Valida que a análise incremental (analyze_stream) produz o mesmo
+resultado que analyze() sobre todo o histórico.
+"""
+
+import unittest
+from datetime import datetime
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar diretório raiz ao path
+root_dir = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(root_dir))
+
+from src.signals.analyzers.trend_analyzer import TrendAnalyzer
+
+
+class TestAnalyzeStream(unittest.TestCase):
+    """Testes de equivalência entre analyze_stream e analyze."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        n = 200
+        self.close = [100 + np.sin(i * 0.15) * 6 + i * 0.05 + (i % 5) * 0.4 for i in range(n)]
+        self.high = [c + 1.0 + (i % 3) * 0.2 for i, c in enumerate(self.close)]
+        self.low = [c - 1.0 - (i % 4) * 0.2 for i, c in enumerate(self.close)]
+        self.volumes = [1000.0 + i for i in range(n)]
+        self.timestamp = datetime(2024, 1, 1)
+    
+    def assert_analysis_equal(self, stream, batch):
+        """Compara sinal, tendência, confiança e valores dos indicadores."""
+        self.assertEqual(stream.signal, batch.signal)
+        self.assertEqual(stream.trend, batch.trend)
+        self.assertAlmostEqual(stream.strength, batch.strength, places=9)
+        self.assertAlmostEqual(stream.confidence, batch.confidence, places=9)
+        self.assertEqual(set(stream.indicators), set(batch.indicators))
+        
+        for name, result in batch.indicators.items():
+            streamed = stream.indicators[name]
+            self.assertEqual(streamed.signal, result.signal, name)
+            if isinstance(result.value, dict):
+                self.assertEqual(set(streamed.value), set(result.value), name)
+                for key, value in result.value.items():
+                    self.assertAlmostEqual(streamed.value[key], value, places=6, msg=f"{name}.{key}")
+            else:
+                self.assertAlmostEqual(streamed.value, result.value, places=6, msg=name)
+    
+    def test_stream_matches_analyze_close_only(self):
+        """Aquecimento com N-1 candles + analyze_stream no N-ésimo equivale a analyze()."""
+        batch = TrendAnalyzer().analyze({'close': self.close}, timestamp=self.timestamp)
+        
+        analyzer = TrendAnalyzer()
+        analyzer.start_stream({'close': self.close[:-1]})
+        stream = analyzer.analyze_stream(self.close[-1], timestamp=self.timestamp)
+        
+        self.assertNotIn('stochastic', stream.indicators)
+        self.assert_analysis_equal(stream, batch)
+    
+    def test_stream_matches_analyze_with_high_low(self):
+        """Com máximas e mínimas, Stochastic e Williams %R também coincidem."""
+        prices = {'close': self.close, 'high': self.high, 'low': self.low}
+        batch = TrendAnalyzer().analyze(prices, volumes=self.volumes, timestamp=self.timestamp)
+        
+        analyzer = TrendAnalyzer()
+        analyzer.start_stream({key: series[:-1] for key, series in prices.items()})
+        stream = analyzer.analyze_stream(
+            self.close[-1],
+            high=self.high[-1],
+            low=self.low[-1],
+            timestamp=self.timestamp
+        )
+        
+        self.assertIn('stochastic', stream.indicators)
+        self.assert_analysis_equal(stream, batch)
+    
+    def test_stream_tracks_each_new_candle(self):
+        """Candle a candle, cada analyze_stream equivale a analyze() sobre o prefixo."""
+        analyzer = TrendAnalyzer()
+        warmup = 150
+        analyzer.start_stream({'close': self.close[:warmup]})
+        
+        for end in range(warmup + 1, len(self.close) + 1):
+            stream = analyzer.analyze_stream(self.close[end - 1], timestamp=self.timestamp)
+            batch = TrendAnalyzer().analyze({'close': self.close[:end]}, timestamp=self.timestamp)
+            self.assert_analysis_equal(stream, batch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ root_dir = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(root_dir))
 
 from src.signals.indicators.technical_indicators import TechnicalIndicators, SignalType, IndicatorResult
+from src.signals.indicators.streaming import MacdState, PriceBuffer, RollingWindow, RsiState
 
 
 class TestTechnicalIndicators(unittest.TestCase):
@@ -191,6 +192,82 @@ class TestTechnicalIndicators(unittest.TestCase):
         self.assertGreaterEqual(result.value, -100)
         self.assertLessEqual(result.value, 0)
     
+    def test_high_low_indicators_match_separate_calls(self):
+        """O cálculo conjunto deve coincidir com Stochastic e Williams %R isolados."""
+        high = [p + 2 for p in self.prices_sideways]
+        low = [p - 2 for p in self.prices_sideways]
+        close = self.prices_sideways
+        
+        combined = TechnicalIndicators.high_low_indicators(high, low, close)
+        stochastic = TechnicalIndicators.stochastic_oscillator(high, low, close)
+        williams = TechnicalIndicators.williams_r(high, low, close)
+        
+        self.assertEqual(combined['stochastic'].value, stochastic.value)
+        self.assertEqual(combined['stochastic'].signal, stochastic.signal)
+        self.assertEqual(combined['williams_r'].value, williams.value)
+        self.assertEqual(combined['williams_r'].signal, williams.signal)
+    
+    def test_fused_indicators_match_separate_calls(self):
+        """close_indicators e compute_all devem coincidir com os indicadores isolados."""
+        base = [100 + np.sin(i * 0.2) * 5 + (i % 7) * 0.3 for i in range(80)]
+        
+        # Nulos iniciais não são preenchidos pelo forward fill e não podem
+        # contaminar as janelas depois que saem delas
+        for prices in (base, [np.nan] * 3 + base):
+            separate = {
+                'rsi': TechnicalIndicators.rsi(prices),
+                'macd': TechnicalIndicators.macd(prices),
+                'bollinger': TechnicalIndicators.bollinger_bands(prices),
+                'moving_averages': TechnicalIndicators.moving_averages(prices)
+            }
+            
+            for fused in (
+                TechnicalIndicators.close_indicators(prices),
+                TechnicalIndicators.compute_all(prices)
+            ):
+                for name, expected in separate.items():
+                    actual = fused[name]
+                    if isinstance(expected.value, dict):
+                        for key, value in expected.value.items():
+                            np.testing.assert_allclose(actual.value[key], value, rtol=1e-9)
+                    else:
+                        np.testing.assert_allclose(actual.value, expected.value, rtol=1e-9)
+                    self.assertEqual(actual.signal, expected.signal)
+                    
+                    for key, series in expected.metadata.items():
+                        if key.endswith("_series"):
+                            np.testing.assert_allclose(actual.metadata[key], series, rtol=1e-9)
+    
+    def test_return_last_only_matches_full_series(self):
+        """O modo return_last_only deve dar o mesmo valor sem as séries."""
+        high = [p + 2 for p in self.prices_volatile]
+        low = [p - 2 for p in self.prices_volatile]
+        close = self.prices_volatile
+        
+        pairs = [
+            (TechnicalIndicators.rsi(close), TechnicalIndicators.rsi(close, return_last_only=True)),
+            (
+                TechnicalIndicators.bollinger_bands(close),
+                TechnicalIndicators.bollinger_bands(close, return_last_only=True)
+            ),
+            (
+                TechnicalIndicators.stochastic_oscillator(high, low, close),
+                TechnicalIndicators.stochastic_oscillator(high, low, close, return_last_only=True)
+            ),
+            (
+                TechnicalIndicators.williams_r(high, low, close),
+                TechnicalIndicators.williams_r(high, low, close, return_last_only=True)
+            )
+        ]
+        
+        for full, last in pairs:
+            full_values = full.value if isinstance(full.value, dict) else {"value": full.value}
+            last_values = last.value if isinstance(last.value, dict) else {"value": last.value}
+            for key, value in full_values.items():
+                self.assertAlmostEqual(value, last_values[key], places=9)
+            self.assertEqual(full.signal, last.signal)
+            self.assertFalse(any(key.endswith("_series") for key in last.metadata))
+    
     def test_combine_signals(self):
         """Testa combinação de sinais."""
         # Criar indicadores de teste
@@ -327,6 +404,64 @@ class TestIndicatorIntegration(unittest.TestCase):
         self.assertIsInstance(combined.signal, SignalType)
 
 
+class TestRollingWindow(unittest.TestCase):
+    """Testes para a janela móvel incremental."""
+    
+    def test_matches_full_recalculation(self):
+        """Média e desvio devem coincidir com o cálculo sobre a janela inteira."""
+        prices = [100 + np.sin(i * 0.3) * 5 + i * 0.1 for i in range(200)]
+        window = RollingWindow(20)
+        
+        for i, price in enumerate(prices):
+            window.push(price)
+            if i < 19:
+                self.assertFalse(window.ready)
+                continue
+            
+            expected = np.array(prices[i - 19:i + 1])
+            self.assertAlmostEqual(window.mean(), expected.mean(), places=9)
+            self.assertAlmostEqual(window.std(), expected.std(ddof=1), places=6)
+
+
+class TestExponentialState(unittest.TestCase):
+    """Testes para os estados incrementais de RSI e MACD."""
+    
+    def test_rsi_and_macd_state_match_batch(self):
+        """RSI e MACD incrementais devem coincidir com o cálculo em lote."""
+        prices = [100 + np.sin(i * 0.3) * 5 + i * 0.1 for i in range(200)]
+        rsi_state = RsiState(14)
+        macd_state = MacdState(12, 26, 9)
+        
+        for price in prices:
+            rsi = rsi_state.update(price)
+            macd, signal = macd_state.update(price)
+        
+        batch_rsi = TechnicalIndicators.rsi(prices, period=14)
+        batch_macd = TechnicalIndicators.macd(prices, 12, 26, 9)
+        
+        self.assertAlmostEqual(rsi, batch_rsi.value, places=9)
+        self.assertAlmostEqual(macd, batch_macd.value["macd"], places=9)
+        self.assertAlmostEqual(signal, batch_macd.value["signal"], places=9)
+
+
+class TestPriceBuffer(unittest.TestCase):
+    """Testes para o buffer circular de preços."""
+    
+    def test_price_buffer_view_is_chronological(self):
+        """A view do buffer circular deve conter os últimos valores em ordem."""
+        buffer = PriceBuffer(5)
+        
+        for value in range(3):
+            buffer.push(float(value))
+        np.testing.assert_array_equal(buffer.view(), [0.0, 1.0, 2.0])
+        
+        for value in range(3, 12):
+            buffer.push(float(value))
+            expected = np.arange(max(0, value - 4), value + 1, dtype=float)
+            np.testing.assert_array_equal(buffer.view(), expected)
+            self.assertTrue(buffer.view().flags.c_contiguous)
+
+
 if __name__ == '__main__':
     # Configurar logging para testes
     import logging
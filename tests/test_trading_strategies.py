@@ -161,6 +161,20 @@ class TestBaseStrategy(unittest.TestCase):
         self.assertEqual(position.current_price, 52000.0)
         self.assertEqual(position.unrealized_pnl, 200.0)  # (52000 - 50000) * 0.1
     
+    def test_position_timestamp_ns(self):
+        """Testa se timestamp_ns acompanha as atribuições de timestamp."""
+        opened = datetime(2024, 1, 1, 12, 0, 0)
+        position = Position(symbol="BTC-USD", side="buy", size=0.1, entry_price=50000.0,
+                            current_price=50000.0, timestamp=opened)
+        self.assertEqual(position.timestamp_ns, int(opened.timestamp() * 1_000_000_000))
+        
+        later = opened + timedelta(hours=1)
+        position.timestamp = later
+        self.assertEqual(position.timestamp_ns, int(later.timestamp() * 1_000_000_000))
+        
+        position.timestamp = None
+        self.assertIsNone(position.timestamp_ns)
+    
     def test_performance_metrics(self):
         """Testa cálculo de métricas de performance."""
         # Adicionar algumas posições e trades
@@ -334,6 +348,46 @@ class TestSwingTradingStrategy(unittest.TestCase):
             self.assertEqual(order.order_type, OrderType.LIMIT)
             self.assertEqual(order.size, 0.1)
     
+    @patch('src.trading.strategies.swing_strategy.SwingTradingStrategy.calculate_position_size')
+    def test_analyze_signals_isolates_failures(self, mock_calc_size):
+        """Testa se um erro em um sinal do lote não descarta os demais."""
+        mock_position_size = Mock()
+        mock_position_size.base_size = 0.1
+        mock_position_size.stop_loss_price = 48500.0
+        mock_calc_size.return_value = mock_position_size
+        
+        signals = [
+            self.strong_signal,
+            TradingSignal(symbol="ETH-USD", signal_type=SignalType.STRONG_BUY, strength=0.85,
+                          confidence=0.8, entry_price=3000.0, timestamp=datetime.now()),
+            TradingSignal(symbol="SOL-USD", signal_type=SignalType.STRONG_BUY, strength=0.3,
+                          confidence=0.8, entry_price=100.0, timestamp=datetime.now()),
+        ]
+        market_data = {signal.symbol: self.market_data for signal in signals}
+        
+        should_enter = self.strategy._should_enter_position
+        
+        def fail_for_eth(signal, data):
+            if signal.symbol == "ETH-USD":
+                raise ValueError("bad market data")
+            return should_enter(signal, data)
+        
+        with patch.object(self.strategy.risk_manager, 'validate_trade', return_value=(True, "ok")), \
+                patch.object(self.strategy, '_should_enter_position', side_effect=fail_for_eth), \
+                patch.object(self.strategy, 'validate_signal') as mock_validate, \
+                patch.object(self.strategy, '_validate_swing_signal') as mock_validate_swing:
+            orders = self.strategy.analyze_signals(signals, market_data)
+        
+        self.assertEqual(len(orders), 3)
+        self.assertIsNotNone(orders[0])
+        self.assertEqual(orders[0].symbol, "BTC-USD")
+        self.assertIsNone(orders[1])
+        self.assertIsNone(orders[2])
+        
+        # Os sobreviventes do filtro em lote não são validados de novo
+        mock_validate.assert_not_called()
+        mock_validate_swing.assert_not_called()
+    
     def test_position_exit_conditions(self):
         """Testa condições de saída de posição."""
         position = Position(
@@ -363,6 +417,81 @@ class TestSwingTradingStrategy(unittest.TestCase):
         position.timestamp = datetime.now() - timedelta(days=15)  # Mais de 14 dias
         self.assertTrue(self.strategy.should_close_position(position, self.market_data))
     
+    def test_positions_to_close_matches_should_close(self):
+        """Testa se a avaliação em lote concorda com a verificação por posição."""
+        now = datetime.now()
+        positions = [
+            Position(symbol="BTC-USD", side="buy", size=0.1, entry_price=50000.0,
+                     current_price=50000.0, stop_loss=48500.0, take_profit=53750.0, timestamp=now),
+            Position(symbol="ETH-USD", side="sell", size=1.0, entry_price=3000.0,
+                     current_price=3000.0, stop_loss=3090.0, take_profit=2775.0, timestamp=now),
+            Position(symbol="SOL-USD", side="buy", size=10.0, entry_price=100.0,
+                     current_price=100.0, timestamp=now - timedelta(days=15)),
+            Position(symbol="ADA-USD", side="buy", size=100.0, entry_price=1.0,
+                     current_price=1.0, stop_loss=0.9, take_profit=1.5, timestamp=now),
+        ]
+        for position in positions:
+            self.strategy.add_position(position)
+        
+        # Queda de 3% do pico no ETH (venda) e subida de 5% no ADA seguida de queda de 3%
+        self.strategy.update_position_price("BTC-USD", 51000.0)
+        self.strategy.update_position_price("ETH-USD", 2900.0)
+        self.strategy.update_position_price("ETH-USD", 2990.0)
+        self.strategy.update_position_price("ADA-USD", 1.05)
+        self.strategy.update_position_price("ADA-USD", 1.02)
+        
+        market_data = {position.symbol: {"trend": "sideways"} for position in positions}
+        expected = {
+            position.symbol
+            for position in positions
+            if self.strategy.should_close_position(position, market_data[position.symbol])
+        }
+        
+        self.assertEqual(expected, {"ETH-USD", "SOL-USD", "ADA-USD"})
+        self.assertEqual(
+            self.strategy.positions_to_close(market_data),
+            {
+                "ETH-USD": "Trailing stop triggered",
+                "SOL-USD": "Max hold time reached",
+                "ADA-USD": "Trailing stop triggered",
+            }
+        )
+        
+        # Após remover uma posição, a tabela continua consistente
+        self.strategy.remove_position("ETH-USD", 2990.0)
+        self.assertEqual(set(self.strategy.positions_to_close(market_data)), {"SOL-USD", "ADA-USD"})
+    
+    def test_positions_to_close_sees_position_changes(self):
+        """Testa se alterações feitas na Position após a abertura são consideradas."""
+        position = Position(symbol="BTC-USD", side="buy", size=0.1, entry_price=50000.0,
+                            current_price=50000.0, stop_loss=48500.0, take_profit=53750.0,
+                            timestamp=datetime.now())
+        self.strategy.add_position(position)
+        market_data = {"BTC-USD": {"trend": "sideways"}}
+        self.assertEqual(self.strategy.positions_to_close(market_data), {})
+        
+        # Stop-loss movido para cima do preço atual
+        position.stop_loss = 50500.0
+        self.assertEqual(
+            self.strategy.positions_to_close(market_data),
+            {"BTC-USD": "Stop-loss triggered"}
+        )
+        
+        # Sem stop-loss e aberta há mais do que o tempo máximo
+        position.stop_loss = None
+        position.timestamp = datetime.now() - timedelta(days=15)
+        self.assertEqual(
+            self.strategy.positions_to_close(market_data),
+            {"BTC-USD": "Max hold time reached"}
+        )
+        
+        # Reversão de tendência é o último motivo considerado
+        position.timestamp = datetime.now()
+        self.assertEqual(
+            self.strategy.positions_to_close({"BTC-USD": {"trend": "bearish"}}),
+            {"BTC-USD": "Trend reversal detected"}
+        )
+    
     def test_estimate_hold_period(self):
         """Testa estimativa de período de manutenção."""
         # Sinal muito forte